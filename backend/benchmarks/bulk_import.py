@@ -0,0 +1,98 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - bulk_import.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The bulk_import.py file is a developer tool that sits outside the running backend. It adds synthetic pets to
+    a live FurEver Pals server, once through /add-pet and once through /add-pet/bulk.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of bulk_import.py is to compare how many pets per second a shelter can import by calling
+    /add-pet once per pet against sending the same pets as one NDJSON batch to /add-pet/bulk.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program builds the same number of random pets for both modes, each with a small random photo so that
+    the media store does real work. The single mode posts them one by one, keeping --concurrency requests in
+    flight. The bulk mode streams them as NDJSON lines in one request. It prints the pets per second of each
+    mode and the inserted and failed counts of the bulk report. The owner must be a registered user.
+
+USAGE:
+    python benchmarks/bulk_import.py --base-url http://localhost:8000 --username shelter --pets 2000
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import time
+import httpx
+
+NAMES = ["Bantay", "Mingming", "Choco", "Brownie", "Putol", "Whitey", "Blackie", "Muning", "Tagpi", "Lucky"]
+CITIES = ["Manila", "Quezon City", "Makati", "Pasig", "Taguig", "Caloocan", "Marikina", "Paranaque"]
+
+def random_pet(index: int, username: str) -> dict:
+    return {
+        "pet_name": f"{random.choice(NAMES)} {index}",
+        "pet_age": random.randint(1, 15),
+        "sex": random.choice(["Female", "Male"]),
+        "location": f"{random.choice(CITIES)}, Metro Manila",
+        "description": "Imported by bulk_import.py",
+        "pet_photo": base64.b64encode(os.urandom(2048)).decode(),
+        "username": username,
+    }
+
+async def add_one_by_one(client: httpx.AsyncClient, pets: list, concurrency: int) -> float:
+    # Posts every pet to /add-pet with a fixed number of requests in flight and returns the elapsed seconds
+    queue = list(pets)
+
+    async def worker():
+        while queue:
+            response = await client.post("/add-pet", json=queue.pop())
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started
+
+async def add_in_bulk(client: httpx.AsyncClient, pets: list, username: str):
+    # Streams every pet to /add-pet/bulk as one NDJSON body and returns the elapsed seconds and the report
+    async def body():
+        for pet in pets:
+            yield json.dumps(pet).encode() + b"\n"
+
+    started = time.perf_counter()
+    response = await client.post("/add-pet/bulk", params={"username": username}, content=body(),
+                                 headers={"Content-Type": "application/x-ndjson"})
+    response.raise_for_status()
+    return time.perf_counter() - started, response.json()
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare single and bulk pet import throughput")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--username", required=True, help="Registered user that owns the imported pets")
+    parser.add_argument("--pets", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=600) as client:
+        single_seconds = await add_one_by_one(client, [random_pet(i, args.username) for i in range(args.pets)], args.concurrency)
+        bulk_seconds, report = await add_in_bulk(client, [random_pet(i, args.username) for i in range(args.pets)], args.username)
+
+    print(f"{'mode':<8} {'seconds':>10} {'pets/s':>10}")
+    print(f"{'single':<8} {single_seconds:>10.2f} {args.pets / single_seconds:>10.1f}")
+    print(f"{'bulk':<8} {bulk_seconds:>10.2f} {args.pets / bulk_seconds:>10.1f}")
+    print(f"bulk report: {report['inserted']} inserted, {report['failed']} failed")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,92 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - concurrency_bench.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The concurrency_bench.py file is a developer tool that sits outside the running backend. It drives a live
+    FurEver Pals server with concurrent requests to check that the database layer does not block the event loop.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of concurrency_bench.py is to show how throughput changes as the number of in-flight requests
+    grows. With a non-blocking data layer, requests per second should rise with concurrency until the connection
+    pool or the database saturates, instead of staying flat.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program uses asyncio and httpx to keep a fixed number of requests in flight against one endpoint, for
+    each concurrency level given on the command line. Requests are GETs, or POSTs when a JSON body is given. It
+    records the latency of every successful request and prints the throughput, the p50/p99 latencies and the
+    number of requests the server shed with 503 per level.
+
+USAGE:
+    python benchmarks/concurrency_bench.py --url http://localhost:8000/all-pets --levels 1,4,16,64 --requests 400
+    python benchmarks/concurrency_bench.py --url http://localhost:8000/login --requests 200 \
+        --json '{"username": "bench", "password": "benchpassword"}'
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import httpx
+
+async def run_level(url: str, concurrency: int, total_requests: int, body=None):
+    # Sends total_requests requests with at most `concurrency` of them in flight
+    latencies = []
+    shed = 0
+    remaining = iter(range(total_requests))
+
+    async with httpx.AsyncClient(limits=httpx.Limits(max_connections=concurrency), timeout=60) as client:
+        async def worker():
+            nonlocal shed
+            for _ in remaining:
+                started = time.perf_counter()
+                if body is None:
+                    response = await client.get(url)
+                else:
+                    response = await client.post(url, json=body)
+                if response.status_code == 503:
+                    shed += 1
+                    continue
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    if not latencies:
+        latencies = [0.0]
+    return {
+        "concurrency": concurrency,
+        "throughput": (total_requests - shed) / elapsed,
+        "shed": shed,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description="Measure throughput of a FurEver Pals endpoint per concurrency level")
+    parser.add_argument("--url", default="http://localhost:8000/all-pets")
+    parser.add_argument("--levels", default="1,4,16,64", help="Comma-separated numbers of in-flight requests")
+    parser.add_argument("--requests", type=int, default=400, help="Requests sent per concurrency level")
+    parser.add_argument("--json", help="JSON body; when given, requests are sent as POST")
+    args = parser.parse_args()
+    body = json.loads(args.json) if args.json else None
+
+    print(f"{'in-flight':>10} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'503s':>6}")
+    for level in (int(value) for value in args.levels.split(",")):
+        result = await run_level(args.url, level, args.requests, body)
+        print(f"{result['concurrency']:>10} {result['throughput']:>10.1f} {result['p50_ms']:>10.1f} {result['p99_ms']:>10.1f} {result['shed']:>6}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,90 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - feed_round_trips.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The feed_round_trips.py file is a developer tool that sits outside the running backend. It calls the post
+    feed controller directly against a scratch MongoDB database and counts the commands the driver sends.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of feed_round_trips.py is to show that building a page of the post feed costs the same number of
+    database round trips no matter how many posts and authors exist, instead of one extra user query per post.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program opens the client through connect_to_database() with an extra pymongo CommandListener, seeds a
+    scratch database with an increasing number of users and posts, and records how many commands and how much
+    time fetch_all_posts() needs for one full page at each size. The scratch database is dropped when the run
+    ends.
+
+USAGE:
+    cd backend && python -m benchmarks.feed_round_trips --sizes 10,100,1000,10000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from pymongo import monitoring
+import config.db
+from controllers.user_controller import fetch_all_posts
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event):
+        self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+async def seed(db, post_count: int):
+    # Fills the scratch database with posts spread over one author per ten posts
+    await db.users.delete_many({})
+    await db.posts.delete_many({})
+    authors = max(1, post_count // 10)
+    await db.users.insert_many([{"username": f"user{i}", "profile_photo_id": f"{i:064x}"} for i in range(authors)])
+    await db.posts.insert_many([
+        {"username": f"user{i % authors}", "post_content": f"post {i}", "date_posted": datetime.now()}
+        for i in range(post_count)
+    ])
+
+async def main():
+    parser = argparse.ArgumentParser(description="Count database round trips per page of the post feed")
+    parser.add_argument("--uri", default=config.db.MONGO_URI)
+    parser.add_argument("--database", default="fureverpals_bench")
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="Comma-separated numbers of posts to seed")
+    parser.add_argument("--limit", type=int, default=100, help="Page size requested from the feed")
+    args = parser.parse_args()
+
+    counter = CommandCounter()
+    config.db.MONGO_URI = args.uri
+    config.db.DATABASE_NAME = args.database
+    config.db.connect_to_database([counter])
+    try:
+        print(f"{'posts':>8} {'commands':>9} {'ms':>8}")
+        for size in (int(value) for value in args.sizes.split(",")):
+            await seed(config.db.get_database(), size)
+            counter.count = 0
+            started = time.perf_counter()
+            await fetch_all_posts(limit=args.limit)
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"{size:>8} {counter.count:>9} {elapsed:>8.1f}")
+    finally:
+        await config.db.client.drop_database(args.database)
+        config.db.close_database_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
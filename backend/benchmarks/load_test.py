@@ -0,0 +1,343 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - load_test.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The load_test.py file is a developer tool that sits outside the running backend. It seeds a scratch MongoDB
+    database and drives the FastAPI app from main.py in-process, route by route, with concurrent requests.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of load_test.py is to give a repeatable measurement of how every route of the user, pet and
+    media routers behaves under load, and to write the results as JSON so two runs can be diffed to spot a
+    regression.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program seeds the given numbers of users, pets, posts and adoption applications straight into the
+    scratch database, with one shared password hash and a small pool of photos in the media store. Each post
+    also gets its materialized /feed entry. The upload routes are sent the same fields as multipart forms with a
+    photo file part. It then sends requests to main.app through httpx's ASGI transport, so no server or network
+    is involved. For each endpoint in ENDPOINTS it keeps --concurrency requests in flight until --requests are
+    done, choosing users and pets from the seed with a fixed random seed, and records the latency, status and
+    body size of each request. It prints and writes the p50/p95/p99 latency, the throughput and the mean payload
+    per endpoint. The scratch database is dropped when the run ends unless --keep is given.
+
+USAGE:
+    cd backend && python -m benchmarks.load_test --users 1000 --pets 5000 --posts 5000 --requests 500 \
+        --concurrency 16 --output load_results.json
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import platform
+import random
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Callable, List, NamedTuple, Optional
+import httpx
+from bson import ObjectId
+from pymongo import UpdateOne
+import config.db
+from config.auth import issue_tokens
+from config.indexes import ensure_indexes
+from config.media import store_photo
+from config.passwords import pwd_context, shutdown_password_pool
+from controllers.feed_controller import add_feed_entries, feed_entry
+
+PASSWORD = "loadtestpassword"
+PHOTO_POOL_SIZE = 20
+NAMES = ["Bantay", "Mingming", "Choco", "Brownie", "Putol", "Whitey", "Blackie", "Muning", "Tagpi", "Lucky"]
+TRAITS = ["playful", "gentle", "shy", "energetic", "calm", "friendly", "curious", "loyal", "vaccinated", "house-trained"]
+CITIES = ["Manila", "Quezon City", "Makati", "Pasig", "Taguig", "Caloocan", "Marikina", "Paranaque"]
+
+class Seed(NamedTuple):
+    usernames: List[str]
+    pet_ids: List[str]
+    photo_ids: List[str]
+    owners: dict
+    tokens: dict
+    applications: List[tuple]
+
+class RequestPlan(NamedTuple):
+    method: str
+    url: str
+    json: Optional[object] = None
+    content: Optional[bytes] = None
+    headers: Optional[dict] = None
+    data: Optional[dict] = None
+    files: Optional[dict] = None
+
+class Endpoint(NamedTuple):
+    name: str
+    build: Callable[[random.Random, Seed, int], RequestPlan]
+
+def random_photo(rng: random.Random) -> str:
+    return base64.b64encode(rng.randbytes(2048)).decode()
+
+def photo_file(rng: random.Random) -> tuple:
+    return ("photo.jpg", rng.randbytes(2048), "image/jpeg")
+
+def form_fields(document: dict) -> dict:
+    # Turns a JSON request body into the text fields of a multipart form
+    return {name: value.isoformat() if isinstance(value, datetime) else str(value) for name, value in document.items()}
+
+def random_pet(rng: random.Random, username: str, index: int) -> dict:
+    return {
+        "pet_name": f"{rng.choice(NAMES)} {index}",
+        "pet_age": rng.randint(1, 15),
+        "sex": rng.choice(["Female", "Male"]),
+        "location": f"{rng.choice(CITIES)}, Metro Manila",
+        "description": " ".join(rng.sample(TRAITS, 3)),
+        "username": username,
+    }
+
+def random_user(rng: random.Random, username: str) -> dict:
+    return {
+        "username": username,
+        "email": f"{username}@example.com",
+        "firstname": "Load",
+        "lastname": "Tester",
+        "birthday": datetime(1990, 1, 1) + timedelta(days=rng.randint(0, 9000)),
+        "mobilenum": f"09{rng.randint(0, 999999999):09d}",
+        "address": f"{rng.randint(1, 999)} {rng.choice(CITIES)}",
+        **{field: rng.randint(0, 5) for field in ["pet_knowledge", "stable_living", "flex_time_sched", "environment"]},
+    }
+
+def application(username: str) -> dict:
+    return {"username": username, "name": "Load Tester", "reason_for_adopting": "Load test", "occupation": "Tester"}
+
+async def seed(db, rng: random.Random, users: int, pets: int, posts: int, applications: int) -> Seed:
+    # Fills the scratch database and returns the ids the endpoint builders pick from
+    for collection in ["users", "pets", "posts", "feed", "adoption_applications"]:
+        await db[collection].delete_many({})
+    photo_ids = [await store_photo(random_photo(rng).encode()) for _ in range(PHOTO_POOL_SIZE)]
+    password = await asyncio.get_running_loop().run_in_executor(None, pwd_context.hash, PASSWORD)
+
+    usernames = [f"loaduser{i}" for i in range(users)]
+    user_ids = {}
+    authors = {}
+    batch = 5000
+    for start in range(0, users, batch):
+        documents = [{**random_user(rng, name), "password": password, "profile_photo_id": rng.choice(photo_ids)} for name in usernames[start:start + batch]]
+        result = await db.users.insert_many(documents, ordered=False)
+        user_ids.update(zip(usernames[start:start + batch], map(str, result.inserted_ids)))
+        authors.update((document["username"], document) for document in documents)
+
+    owners = {}
+    for start in range(0, pets, batch):
+        documents = []
+        for i in range(start, min(start + batch, pets)):
+            documents.append({**random_pet(rng, rng.choice(usernames), i), "pet_photo_id": rng.choice(photo_ids)})
+        result = await db.pets.insert_many(documents, ordered=False)
+        owners.update({str(pet_id): document["username"] for pet_id, document in zip(result.inserted_ids, documents)})
+    pet_ids = list(owners)
+
+    now = datetime.now()
+    for start in range(0, posts, batch):
+        documents = [{"username": rng.choice(usernames), "post_content": f"Post {i}", "date_posted": now - timedelta(minutes=i)} for i in range(start, min(start + batch, posts))]
+        await db.posts.insert_many(documents, ordered=False)
+        await add_feed_entries([feed_entry(document, authors[document["username"]]) for document in documents])
+
+    application_ids = []
+    if pet_ids and applications:
+        # One application per applicant and pet, as the unique index requires
+        pairs = {(rng.choice(pet_ids), rng.choice(usernames)) for _ in range(applications)}
+        documents = [{**application(username), "pet_id": ObjectId(pet_id), "status": "pending", "submitted_at": now, "proof_of_identity_photo_id": rng.choice(photo_ids)} for pet_id, username in pairs]
+        result = await db.adoption_applications.insert_many(documents, ordered=False)
+        application_ids = [(str(document["pet_id"]), str(application_id)) for document, application_id in zip(documents, result.inserted_ids)]
+        pending = Counter(pet_id for pet_id, _ in pairs)
+        await db.pets.bulk_write([UpdateOne({"_id": ObjectId(pet_id)}, {"$set": {"pending_applications": count}}) for pet_id, count in pending.items()], ordered=False)
+
+    tokens = {name: issue_tokens(user_ids[name], name) for name in usernames}
+    return Seed(usernames, pet_ids, photo_ids, owners, tokens, application_ids)
+
+def bearer(seed: Seed, username: str) -> dict:
+    return {"Authorization": f"Bearer {seed.tokens[username]['access_token']}"}
+
+def register_request(rng: random.Random, seed: Seed, n: int) -> RequestPlan:
+    body = {**random_user(rng, f"newloaduser{n}-{rng.getrandbits(32)}"), "password": PASSWORD, "profile_photo": random_photo(rng)}
+    body["birthday"] = body["birthday"].isoformat()
+    return RequestPlan("POST", "/register", json=body)
+
+def register_upload_request(rng: random.Random, seed: Seed, n: int) -> RequestPlan:
+    fields = form_fields({**random_user(rng, f"newuploaduser{n}-{rng.getrandbits(32)}"), "password": PASSWORD})
+    return RequestPlan("POST", "/register/upload", data=fields, files={"profile_photo": photo_file(rng)})
+
+def add_pet_request(rng: random.Random, seed: Seed, n: int) -> RequestPlan:
+    username = rng.choice(seed.usernames)
+    return RequestPlan("POST", "/add-pet", json={**random_pet(rng, username, n), "pet_photo": random_photo(rng)}, headers=bearer(seed, username))
+
+def add_pet_upload_request(rng: random.Random, seed: Seed, n: int) -> RequestPlan:
+    username = rng.choice(seed.usernames)
+    fields = form_fields(random_pet(rng, username, n))
+    return RequestPlan("POST", "/add-pet/upload", data=fields, files={"pet_photo": photo_file(rng)}, headers=bearer(seed, username))
+
+def bulk_pets_request(rng: random.Random, seed: Seed, n: int) -> RequestPlan:
+    username = rng.choice(seed.usernames)
+    lines = [json.dumps({**random_pet(rng, username, n * 20 + i), "pet_photo": random_photo(rng)}) for i in range(20)]
+    headers = {**bearer(seed, username), "Content-Type": "application/x-ndjson"}
+    return RequestPlan("POST", f"/add-pet/bulk?username={username}", content="\n".join(lines).encode(), headers=headers)
+
+def adopt_request(rng: random.Random, seed: Seed, n: int) -> RequestPlan:
+    username = rng.choice(seed.usernames)
+    body = {**application(username), "proof_of_identity_photo": random_photo(rng)}
+    return RequestPlan("POST", f"/adopt-pet/{rng.choice(seed.pet_ids)}", json=body, headers=bearer(seed, username))
+
+def adopt_upload_request(rng: random.Random, seed: Seed, n: int) -> RequestPlan:
+    username = rng.choice(seed.usernames)
+    files = {"proof_of_identity_photo": photo_file(rng)}
+    return RequestPlan("POST", f"/adopt-pet/{rng.choice(seed.pet_ids)}/upload", data=application(username), files=files, headers=bearer(seed, username))
+
+def applications_request(rng: random.Random, seed: Seed, n: int) -> RequestPlan:
+    pet_id = rng.choice(seed.pet_ids)
+    return RequestPlan("GET", f"/pets/{pet_id}/applications", headers=bearer(seed, seed.owners[pet_id]))
+
+def application_status_request(rng: random.Random, seed: Seed, n: int) -> RequestPlan:
+    pet_id, application_id = rng.choice(seed.applications)
+    body = {"status": rng.choice(["pending", "approved", "rejected"])}
+    return RequestPlan("PATCH", f"/pets/{pet_id}/applications/{application_id}", json=body, headers=bearer(seed, seed.owners[pet_id]))
+
+def user_applications_request(rng: random.Random, seed: Seed, n: int) -> RequestPlan:
+    username = rng.choice(seed.usernames)
+    return RequestPlan("GET", f"/users/{username}/applications", headers=bearer(seed, username))
+
+def post_request(rng: random.Random, seed: Seed, n: int) -> RequestPlan:
+    username = rng.choice(seed.usernames)
+    body = {"username": username, "sharedpost": f"Load test post {n}", "date_posted": datetime.now().isoformat()}
+    return RequestPlan("POST", f"/user-posts/{username}", json=body, headers=bearer(seed, username))
+
+ENDPOINTS = [
+    Endpoint("POST /register", register_request),
+    Endpoint("POST /register/upload", register_upload_request),
+    Endpoint("POST /login", lambda rng, seed, n: RequestPlan("POST", "/login", json={"username": rng.choice(seed.usernames), "password": PASSWORD})),
+    Endpoint("POST /refresh", lambda rng, seed, n: RequestPlan("POST", "/refresh", json={"refresh_token": seed.tokens[rng.choice(seed.usernames)]["refresh_token"]})),
+    Endpoint("GET /users/{username}", lambda rng, seed, n: RequestPlan("GET", f"/users/{rng.choice(seed.usernames)}")),
+    Endpoint("GET /user-details/{username}", lambda rng, seed, n: RequestPlan("GET", f"/user-details/{rng.choice(seed.usernames)}")),
+    Endpoint("PUT /update-user-details/{username}", lambda rng, seed, n: RequestPlan("PUT", f"/update-user-details/{rng.choice(seed.usernames)}", json={"address": f"{n} Load Street"})),
+    Endpoint("POST /user-posts/{username}", post_request),
+    Endpoint("GET /all-user-posts", lambda rng, seed, n: RequestPlan("GET", "/all-user-posts")),
+    Endpoint("GET /feed", lambda rng, seed, n: RequestPlan("GET", "/feed")),
+    Endpoint("POST /add-pet", add_pet_request),
+    Endpoint("POST /add-pet/upload", add_pet_upload_request),
+    Endpoint("POST /add-pet/bulk", bulk_pets_request),
+    Endpoint("GET /pets/search", lambda rng, seed, n: RequestPlan("GET", f"/pets/search?q={rng.choice(TRAITS)}&sex={rng.choice(['Female', 'Male'])}")),
+    Endpoint("GET /pets/{pet_id}", lambda rng, seed, n: RequestPlan("GET", f"/pets/{rng.choice(seed.pet_ids)}")),
+    Endpoint("GET /user-pets/{username}", lambda rng, seed, n: RequestPlan("GET", f"/user-pets/{rng.choice(seed.usernames)}")),
+    Endpoint("GET /all-pets", lambda rng, seed, n: RequestPlan("GET", "/all-pets")),
+    Endpoint("POST /adopt-pet/{pet_id}", adopt_request),
+    Endpoint("POST /adopt-pet/{pet_id}/upload", adopt_upload_request),
+    Endpoint("GET /pets/{pet_id}/applications", applications_request),
+    Endpoint("PATCH /pets/{pet_id}/applications/{application_id}", application_status_request),
+    Endpoint("GET /users/{username}/applications", user_applications_request),
+    Endpoint("GET /media/{digest}", lambda rng, seed, n: RequestPlan("GET", f"/media/{rng.choice(seed.photo_ids)}")),
+]
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+async def run_endpoint(client: httpx.AsyncClient, endpoint: Endpoint, seed: Seed, rng: random.Random, requests: int, concurrency: int) -> dict:
+    # Keeps concurrency requests in flight against one endpoint and summarizes the results
+    plans = [endpoint.build(rng, seed, n) for n in range(requests)]
+    latencies = []
+    payload_bytes = 0
+    statuses = {}
+
+    async def worker():
+        nonlocal payload_bytes
+        while plans:
+            plan = plans.pop()
+            started = time.perf_counter()
+            response = await client.request(plan.method, plan.url, json=plan.json, content=plan.content, data=plan.data, files=plan.files, headers=plan.headers)
+            body = await response.aread()
+            latencies.append((time.perf_counter() - started) * 1000)
+            payload_bytes += len(body)
+            statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": requests,
+        "statuses": statuses,
+        "throughput_rps": round(requests / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 0.50), 2),
+        "p95_ms": round(percentile(latencies, 0.95), 2),
+        "p99_ms": round(percentile(latencies, 0.99), 2),
+        "mean_payload_bytes": round(payload_bytes / requests) if requests else 0,
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description="Load test every FurEver Pals route against a seeded scratch database")
+    parser.add_argument("--database", default="fureverpals_load")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--pets", type=int, default=5000)
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--applications", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--only", help="Comma-separated substrings; run only the endpoints whose name contains one")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the data and the request mix")
+    parser.add_argument("--output", default="load_results.json")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch database after the run")
+    args = parser.parse_args()
+
+    from main import app
+
+    endpoints = ENDPOINTS
+    if args.only:
+        wanted = [item.strip() for item in args.only.split(",") if item.strip()]
+        endpoints = [endpoint for endpoint in ENDPOINTS if any(item in endpoint.name for item in wanted)]
+
+    config.db.DATABASE_NAME = args.database
+    config.db.connect_to_database()
+    try:
+        rng = random.Random(args.seed)
+        print(f"Seeding {args.users} users, {args.pets} pets, {args.posts} posts, {args.applications} applications...")
+        seeded = await seed(config.db.get_database(), rng, args.users, args.pets, args.posts, args.applications)
+        await ensure_indexes()
+
+        results = {}
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=120) as client:
+            print(f"{'endpoint':<52} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'bytes':>9}  statuses")
+            for endpoint in endpoints:
+                result = await run_endpoint(client, endpoint, seeded, random.Random(f"{args.seed}:{endpoint.name}"), args.requests, args.concurrency)
+                results[endpoint.name] = result
+                print(f"{endpoint.name:<52} {result['throughput_rps']:>9.1f} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} "
+                      f"{result['p99_ms']:>8.2f} {result['mean_payload_bytes']:>9}  {result['statuses']}")
+    finally:
+        if not args.keep:
+            await config.db.client.drop_database(args.database)
+        config.db.close_database_connection()
+        shutdown_password_pool()
+
+    report = {
+        "run": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+            **{key: value for key, value in vars(args).items() if key not in ("output", "keep")},
+        },
+        "endpoints": results,
+    }
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - poll_bytes.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The poll_bytes.py file is a developer tool that sits outside the running backend. It polls the list
+    endpoints of a live FurEver Pals server the way the mobile app does and measures what goes over the wire.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of poll_bytes.py is to report the bytes transferred per poll before and after conditional
+    requests and compression, so the saving of ETag revalidation and gzip/brotli can be checked per endpoint.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program polls each endpoint repeatedly in two modes. The plain mode asks for an uncompressed body and
+    never revalidates, like the original app. The conditional mode accepts compressed bodies and sends back the
+    last ETag in If-None-Match. Wire bytes are read from httpx's downloaded byte count, before decompression.
+
+USAGE:
+    python benchmarks/poll_bytes.py --base-url http://localhost:8000 --polls 20
+"""
+
+import argparse
+import asyncio
+import httpx
+
+ENDPOINTS = ["/all-pets", "/all-user-posts"]
+
+async def poll(client: httpx.AsyncClient, url: str, polls: int, conditional: bool):
+    # Polls one endpoint and returns the average wire bytes and the count of 304 answers
+    total_bytes = 0
+    not_modified = 0
+    etag = None
+    for _ in range(polls):
+        headers = {"Accept-Encoding": "br, gzip" if conditional else "identity"}
+        if conditional and etag:
+            headers["If-None-Match"] = etag
+        response = await client.get(url, headers=headers)
+        await response.aread()
+        total_bytes += response.num_bytes_downloaded
+        if response.status_code == 304:
+            not_modified += 1
+        etag = response.headers.get("etag", etag)
+    return total_bytes / polls, not_modified
+
+async def main():
+    parser = argparse.ArgumentParser(description="Report bytes transferred per poll of the list endpoints")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--polls", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'endpoint':<18} {'plain B/poll':>14} {'conditional B/poll':>20} {'304s':>6}")
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60) as client:
+        for endpoint in ENDPOINTS:
+            plain, _ = await poll(client, endpoint, args.polls, conditional=False)
+            conditional, not_modified = await poll(client, endpoint, args.polls, conditional=True)
+            print(f"{endpoint:<18} {plain:>14.0f} {conditional:>20.0f} {not_modified:>6}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - rank_applicants.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The rank_applicants.py file is a developer tool that sits outside the running backend. It times the
+    applicant ranking engine in utils/ranking.py on synthetic data, without needing a database.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of rank_applicants.py is to check that ranking a large applicant pool, 50,000 applicants by
+    default, stays well under 100 ms, and to compare it with scoring the same applicants in a Python loop.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program builds a random score matrix, then times rank_applicants() for a full ranking and for a top-20
+    page, and times an equivalent per-applicant Python loop as the baseline. Each timing is the median of
+    several runs. The exit status is non-zero when the full NumPy ranking exceeds the budget.
+
+USAGE:
+    cd backend && python -m benchmarks.rank_applicants --applicants 50000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import numpy as np
+from utils.ranking import DEFAULT_WEIGHTS, MAX_SCORE, rank_applicants
+
+def median_ms(func, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def rank_in_python(rows, weights):
+    # Baseline: score and sort applicants one by one
+    total = MAX_SCORE * sum(weights)
+    scored = [(sum(value * weight for value, weight in zip(row, weights)) * 100 / total, index) for index, row in enumerate(rows)]
+    return sorted(scored, key=lambda item: (-item[0], item[1]))
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the adoption applicant ranking engine")
+    parser.add_argument("--applicants", type=int, default=50000)
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=100.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    matrix = rng.integers(0, MAX_SCORE + 1, size=(args.applicants, len(DEFAULT_WEIGHTS))).astype(np.float32)
+    rows = matrix.tolist()
+    weights = DEFAULT_WEIGHTS.tolist()
+
+    full = median_ms(lambda: rank_applicants(matrix, DEFAULT_WEIGHTS), args.runs)
+    top = median_ms(lambda: rank_applicants(matrix, DEFAULT_WEIGHTS, top=20), args.runs)
+    loop = median_ms(lambda: rank_in_python(rows, weights), max(1, args.runs // 5))
+
+    print(f"applicants:            {args.applicants}")
+    print(f"numpy full ranking:    {full:8.2f} ms")
+    print(f"numpy top-20 page:     {top:8.2f} ms")
+    print(f"python loop baseline:  {loop:8.2f} ms")
+    if full > args.budget_ms:
+        print(f"Full ranking exceeded the {args.budget_ms:.0f} ms budget")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - search_latency.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The search_latency.py file is a developer tool that sits outside the running backend. It calls the pet
+    search controller directly against a scratch MongoDB database seeded with a large synthetic catalog.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of search_latency.py is to measure how long /pets/search takes on a realistic catalog size, by
+    default 100,000 pets, for each kind of filter the endpoint supports.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program seeds pets with random names, descriptions, sexes, ages, locations and coordinates around
+    Metro Manila, creates the declared indexes with ensure_indexes(), then runs each query scenario repeatedly
+    through search_pets() and prints the p50 and p95 latency of one result page. The scratch database is
+    dropped when the run ends unless --keep is given.
+
+USAGE:
+    cd backend && python -m benchmarks.search_latency --pets 100000 --runs 50
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import config.db
+from config.indexes import ensure_indexes
+from controllers.pet_controller import search_pets
+
+NAMES = ["Bantay", "Mingming", "Choco", "Brownie", "Putol", "Whitey", "Blackie", "Muning", "Tagpi", "Lucky"]
+TRAITS = ["playful", "gentle", "shy", "energetic", "calm", "friendly", "curious", "loyal", "vaccinated", "house-trained"]
+CITIES = ["Manila", "Quezon City", "Makati", "Pasig", "Taguig", "Caloocan", "Marikina", "Paranaque"]
+
+SCENARIOS = {
+    "no filter": {},
+    "location + sex": {"location": "Quezon City", "sex": "Female"},
+    "sex + age range": {"sex": "Male", "min_age": 1, "max_age": 3},
+    "text": {"q": "playful"},
+    "text + sex": {"q": "gentle vaccinated", "sex": "Female"},
+    "radius 5 km": {"latitude": 14.5995, "longitude": 120.9842, "radius_km": 5},
+}
+
+def random_pet(index: int) -> dict:
+    return {
+        "pet_name": f"{random.choice(NAMES)} {index}",
+        "pet_age": random.randint(1, 15),
+        "sex": random.choice(["Female", "Male"]),
+        "location": f"{random.choice(CITIES)}, Metro Manila",
+        "description": " ".join(random.sample(TRAITS, 3)),
+        "username": f"shelter{index % 200}",
+        "pet_photo_id": f"{index:064x}",
+        "geo": {"type": "Point", "coordinates": [120.98 + random.uniform(-0.15, 0.15), 14.6 + random.uniform(-0.15, 0.15)]},
+    }
+
+async def seed(db, count: int):
+    # Fills the scratch database with count random pets
+    await db.pets.delete_many({})
+    batch = 5000
+    for start in range(0, count, batch):
+        await db.pets.insert_many([random_pet(i) for i in range(start, min(start + batch, count))], ordered=False)
+
+async def main():
+    parser = argparse.ArgumentParser(description="Measure pet search latency on a seeded catalog")
+    parser.add_argument("--database", default="fureverpals_bench")
+    parser.add_argument("--pets", type=int, default=100000)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch database after the run")
+    args = parser.parse_args()
+
+    config.db.DATABASE_NAME = args.database
+    config.db.connect_to_database()
+    try:
+        print(f"Seeding {args.pets} pets...")
+        await seed(config.db.get_database(), args.pets)
+        await ensure_indexes()
+
+        print(f"{'scenario':<18} {'p50 ms':>8} {'p95 ms':>8} {'results':>8}")
+        for label, params in SCENARIOS.items():
+            timings = []
+            for _ in range(args.runs):
+                started = time.perf_counter()
+                pets, _ = await search_pets(**params)
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            print(f"{label:<18} {timings[len(timings) // 2]:>8.2f} {timings[int(len(timings) * 0.95)]:>8.2f} {len(pets):>8}")
+    finally:
+        if not args.keep:
+            await config.db.client.drop_database(args.database)
+        config.db.close_database_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - serialize_pets.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The serialize_pets.py file is a developer tool that sits outside the running backend. It calls the response
+    helpers in utils/responses.py directly on synthetic documents, without a server or a database.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of serialize_pets.py is to measure the CPU time spent turning a 1,000-pet list into a JSON body,
+    before and after the fast serialization path, so the saving per response can be checked.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program builds pet documents as MongoDB returns them, with an ObjectId and, for the old shape, the inline
+    photo bytes. The "response_model" mode repeats what FastAPI did for response_model=List[Pet]: validate every
+    document into a Pet, which runs validate_pet_photo, then walk the result with jsonable_encoder and dump it
+    with the json module. The "json_response" mode encodes the read-side summaries the controllers now return
+    with serialize(), which uses orjson when it is installed. Each mode is repeated and timed with
+    time.process_time(), and the median CPU milliseconds and body size are printed.
+
+USAGE:
+    cd backend && python -m benchmarks.serialize_pets --pets 1000 --runs 30
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from typing import List
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from controllers.pet_controller import pet_summary
+from models.pet_model import Pet
+from utils.responses import orjson, serialize
+
+CITIES = ["Manila", "Quezon City", "Makati", "Pasig", "Taguig", "Caloocan", "Marikina", "Paranaque"]
+
+def stored_pet(index: int, photo_bytes: int) -> dict:
+    return {
+        "_id": ObjectId(),
+        "pet_name": f"Pet {index}",
+        "pet_age": random.randint(1, 15),
+        "sex": random.choice(["Female", "Male"]),
+        "location": f"{random.choice(CITIES)}, Metro Manila",
+        "description": "playful gentle vaccinated",
+        "username": f"shelter{index % 20}",
+        "pet_photo": os.urandom(photo_bytes).hex().encode(),
+        "pet_photo_id": os.urandom(32).hex(),
+    }
+
+def response_model_body(pets: List[dict]) -> bytes:
+    # What FastAPI did for response_model=List[Pet]: revalidate, walk, then dump
+    validated = TypeAdapter(List[Pet]).validate_python(pets)
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+def json_response_body(pets: List[dict]) -> bytes:
+    # What the routes do now: shape the read-side summary and encode it directly
+    return serialize([pet_summary(pet) for pet in pets])
+
+def median_cpu_ms(build, pets: List[dict], runs: int):
+    timings = []
+    for _ in range(runs):
+        started = time.process_time()
+        body = build(pets)
+        timings.append((time.process_time() - started) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2], len(body)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare CPU time of the old and new pet list serialization")
+    parser.add_argument("--pets", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--photo-bytes", type=int, default=4096, help="Inline photo size of the old document shape")
+    args = parser.parse_args()
+
+    pets = [stored_pet(i, args.photo_bytes) for i in range(args.pets)]
+    print(f"{args.pets} pets, encoder: {'orjson' if orjson is not None else 'json'}")
+    print(f"{'mode':<16} {'CPU ms':>9} {'bytes':>11}")
+    before, before_size = median_cpu_ms(response_model_body, pets, args.runs)
+    after, after_size = median_cpu_ms(json_response_body, pets, args.runs)
+    print(f"{'response_model':<16} {before:>9.2f} {before_size:>11}")
+    print(f"{'json_response':<16} {after:>9.2f} {after_size:>11}")
+    print(f"speedup: {before / after:.1f}x" if after else "speedup: n/a")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - upload_memory.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The upload_memory.py file is a developer tool that sits outside the running backend. It drives the FastAPI
+    app from main.py in-process against a scratch MongoDB database and watches the memory it allocates.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of upload_memory.py is to compare the peak memory of concurrent photo uploads sent as base64
+    inside a JSON body to /add-pet with the same uploads sent as multipart to /add-pet/upload, which streams
+    the photo to the media store.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program registers one owner, builds a random photo of --photo-mb megabytes, and prepares both request
+    bodies before tracing starts, so only server-side allocations are counted. For each mode, it starts
+    tracemalloc, sends --concurrency uploads at once through httpx's ASGI transport, and prints the traced
+    peak in total and per upload. Each upload carries a different photo so the media store cannot dedupe them.
+    The scratch database is dropped at the end unless --keep is given.
+
+USAGE:
+    cd backend && python -m benchmarks.upload_memory --photo-mb 5 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import tracemalloc
+from datetime import datetime
+import httpx
+import config.db
+from config.indexes import ensure_indexes
+from config.passwords import pwd_context, shutdown_password_pool
+
+OWNER = "uploadbench"
+BOUNDARY = "furever-upload-benchmark"
+
+def pet_fields(index: int) -> dict:
+    return {"pet_name": f"Upload {index}", "pet_age": "2", "sex": "Female", "location": "Manila", "username": OWNER}
+
+def json_body(index: int, photo: bytes) -> bytes:
+    return json.dumps({**pet_fields(index), "pet_photo": base64.b64encode(photo).decode()}).encode()
+
+def multipart_body(index: int, photo: bytes) -> bytes:
+    parts = [f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode() for name, value in pet_fields(index).items()]
+    parts.append(f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="pet_photo"; filename="pet.jpg"\r\nContent-Type: image/jpeg\r\n\r\n'.encode())
+    parts.append(photo)
+    parts.append(f"\r\n--{BOUNDARY}--\r\n".encode())
+    return b"".join(parts)
+
+async def chunked(body: bytes, chunk_size: int = 64 * 1024):
+    # Sends a prepared body in chunks, the way a network server hands it to the app
+    for start in range(0, len(body), chunk_size):
+        yield body[start:start + chunk_size]
+
+async def measure(client: httpx.AsyncClient, path: str, content_type: str, bodies: list) -> int:
+    # Sends every body at once and returns the traced peak of server-side allocations
+    tracemalloc.start()
+    responses = await asyncio.gather(*(client.post(path, content=chunked(body), headers={"Content-Type": content_type}) for body in bodies))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    failed = [response.status_code for response in responses if response.status_code >= 400]
+    if failed:
+        print(f"  {path}: {len(failed)} upload(s) failed with {sorted(set(failed))}")
+    return peak
+
+async def main():
+    parser = argparse.ArgumentParser(description="Compare peak memory of JSON and streamed multipart photo uploads")
+    parser.add_argument("--database", default="fureverpals_upload_bench")
+    parser.add_argument("--photo-mb", type=float, default=5)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch database after the run")
+    args = parser.parse_args()
+
+    from main import app
+
+    config.db.DATABASE_NAME = args.database
+    config.db.connect_to_database()
+    try:
+        db = config.db.get_database()
+        await ensure_indexes()
+        await db.users.delete_many({"username": OWNER})
+        await db.users.insert_one({"username": OWNER, "password": pwd_context.hash("uploadbench"), "birthday": datetime(1990, 1, 1)})
+
+        size = int(args.photo_mb * 1024 * 1024)
+        json_bodies = [json_body(i, os.urandom(size)) for i in range(args.concurrency)]
+        multipart_bodies = [multipart_body(i, os.urandom(size)) for i in range(args.concurrency)]
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://uploadbench", timeout=300) as client:
+            json_peak = await measure(client, "/add-pet", "application/json", json_bodies)
+            multipart_peak = await measure(client, "/add-pet/upload", f"multipart/form-data; boundary={BOUNDARY}", multipart_bodies)
+
+        mib = 1024 * 1024
+        print(f"{args.concurrency} concurrent uploads of {args.photo_mb:g} MB photos")
+        print(f"{'mode':<26} {'peak MiB':>10} {'MiB/upload':>12}")
+        print(f"{'JSON /add-pet':<26} {json_peak / mib:>10.1f} {json_peak / mib / args.concurrency:>12.2f}")
+        print(f"{'multipart /add-pet/upload':<26} {multipart_peak / mib:>10.1f} {multipart_peak / mib / args.concurrency:>12.2f}")
+    finally:
+        if not args.keep:
+            await config.db.client.drop_database(args.database)
+        config.db.close_database_connection()
+        shutdown_password_pool()
+
+if __name__ == "__main__":
+    asyncio.run(main())
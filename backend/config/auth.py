@@ -0,0 +1,125 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - auth.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The auth.py file is part of the backend configuration layer. The login and refresh routes use it to issue
+    session tokens, and user-scoped routes use its dependencies to learn who is calling without a database read.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of auth.py is to give the app a session after /login. A short-lived access token and a longer
+    refresh token carry the user id and username, are signed by the server, and can be checked entirely in memory,
+    so a request bearing a valid token does not need a users lookup to prove the user exists.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    Tokens are JSON Web Tokens signed with HMAC-SHA256 using the AUTH_SECRET_KEY environment variable, built with
+    the standard library only. Each token holds the user id (sub), username, token type, issue time and expiry.
+    get_current_user() is a FastAPI dependency that rejects missing or invalid tokens with 401, while
+    get_optional_user() lets routes accept both token-bearing and older token-less clients.
+"""
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from typing import NamedTuple, Optional
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import time
+
+SECRET_KEY = os.getenv("AUTH_SECRET_KEY") or secrets.token_urlsafe(32)
+ACCESS_TOKEN_TTL = int(os.getenv("ACCESS_TOKEN_TTL_SECONDS", 15 * 60))
+REFRESH_TOKEN_TTL = int(os.getenv("REFRESH_TOKEN_TTL_SECONDS", 7 * 24 * 60 * 60))
+ACCESS = "access"
+REFRESH = "refresh"
+
+if not os.getenv("AUTH_SECRET_KEY"):
+    print("AUTH_SECRET_KEY is not set; using a random key, so tokens will not survive a restart")
+
+class CurrentUser(NamedTuple):
+    id: str
+    username: str
+
+def b64url_encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+def b64url_decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+def sign(message: bytes) -> str:
+    return b64url_encode(hmac.new(SECRET_KEY.encode(), message, hashlib.sha256).digest())
+
+def create_token(user_id: str, username: str, token_type: str, ttl: int) -> str:
+    # Creates a signed token for the user that expires after ttl seconds
+    now = int(time.time())
+    header = b64url_encode(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+    claims = {"sub": user_id, "username": username, "type": token_type, "iat": now, "exp": now + ttl}
+    payload = b64url_encode(json.dumps(claims, separators=(",", ":")).encode())
+    signing_input = f"{header}.{payload}"
+    return f"{signing_input}.{sign(signing_input.encode())}"
+
+def decode_token(token: str, token_type: str) -> CurrentUser:
+    # Checks the signature, type and expiry of a token and returns the user it names
+    invalid = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    try:
+        header, payload, signature = token.split(".")
+        if not hmac.compare_digest(signature.encode(), sign(f"{header}.{payload}".encode()).encode()):
+            raise invalid
+        claims = json.loads(b64url_decode(payload))
+    except (ValueError, UnicodeDecodeError):
+        raise invalid
+    if claims.get("type") != token_type or claims.get("exp", 0) < time.time():
+        raise invalid
+    return CurrentUser(id=claims["sub"], username=claims["username"])
+
+def issue_tokens(user_id: str, username: str) -> dict:
+    # Issues a new access and refresh token pair
+    return {
+        "access_token": create_token(user_id, username, ACCESS, ACCESS_TOKEN_TTL),
+        "refresh_token": create_token(user_id, username, REFRESH, REFRESH_TOKEN_TTL),
+        "token_type": "bearer",
+        "expires_in": ACCESS_TOKEN_TTL,
+    }
+
+def refresh_tokens(refresh_token: str) -> dict:
+    # Exchanges a valid refresh token for a new token pair
+    user = decode_token(refresh_token, REFRESH)
+    return issue_tokens(user.id, user.username)
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+async def get_optional_user(credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)) -> Optional[CurrentUser]:
+    # Returns the caller named by the bearer token, or None when no token was sent
+    if credentials is None:
+        return None
+    return decode_token(credentials.credentials, ACCESS)
+
+async def get_current_user(user: Optional[CurrentUser] = Depends(get_optional_user)) -> CurrentUser:
+    # Returns the caller named by the bearer token, rejecting requests without one
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+def ensure_same_user(current_user: CurrentUser, username: str):
+    # Rejects a token holder acting on behalf of another username
+    if current_user.username != username:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Token does not belong to this user")
@@ -0,0 +1,151 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - cache.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The cache.py file is part of the backend configuration layer. Controllers put it in front of frequent reads,
+    such as the user profile lookups in user_controller.py, so the common case is answered without MongoDB.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of cache.py is to provide a read-through cache with bounded memory, a time-to-live on every
+    entry, hit and miss counters, and explicit invalidation for the writes that change cached data.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    LocalCacheBackend is an in-process LRU built on an OrderedDict: reads move an entry to the end, writes evict
+    from the front once max_entries is reached, and entries older than the TTL are dropped when read. When
+    CACHE_BACKEND is "redis", RedisCacheBackend stores entries in a shared Redis server instead, so invalidation
+    is seen by every worker. ReadThroughCache wraps either backend, loads missing entries through a caller-given
+    coroutine and counts hits and misses. Concurrent misses on the same key share one load: the first caller
+    runs the loader and the others await its future, so a burst of identical lookups costs one query.
+"""
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+import asyncio
+import os
+import pickle
+import time
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", 10000))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 60))
+
+class LocalCacheBackend:
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.evictions = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any):
+        self.entries[key] = (time.monotonic() + self.ttl, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str):
+        self.entries.pop(key, None)
+
+    def size(self) -> int:
+        return len(self.entries)
+
+class RedisCacheBackend:
+    def __init__(self, namespace: str, ttl: float, url: str = REDIS_URL):
+        import redis.asyncio as redis
+
+        self.namespace = namespace
+        self.ttl = ttl
+        self.redis = redis.from_url(url)
+        self.evictions = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.redis.get(f"{self.namespace}:{key}")
+        return pickle.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any):
+        await self.redis.set(f"{self.namespace}:{key}", pickle.dumps(value), px=int(self.ttl * 1000))
+
+    async def delete(self, key: str):
+        await self.redis.delete(f"{self.namespace}:{key}")
+
+    def size(self) -> Optional[int]:
+        return None
+
+class ReadThroughCache:
+    def __init__(self, name: str, max_entries: int, ttl: float):
+        self.name = name
+        if CACHE_BACKEND == "redis":
+            self.backend = RedisCacheBackend(name, ttl)
+        else:
+            self.backend = LocalCacheBackend(max_entries, ttl)
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.loading: Dict[str, asyncio.Future] = {}
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Optional[Any]]]) -> Optional[Any]:
+        # Returns the cached value, or loads and caches it; None results are not cached
+        value = await self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        pending = self.loading.get(key)
+        if pending is not None:
+            # Another request is already loading this key, so wait for its result instead of loading it again
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self.loading[key] = future
+        try:
+            value = await loader()
+            if value is not None:
+                await self.backend.set(key, value)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self.loading.pop(key, None)
+
+    async def invalidate(self, key: str):
+        await self.backend.delete(key)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.backend.evictions,
+            "size": self.backend.size(),
+        }
+
+# Profile fields of users, keyed by username
+user_profile_cache = ReadThroughCache("user-profile", USER_CACHE_MAX_ENTRIES, USER_CACHE_TTL_SECONDS)
@@ -13,7 +13,7 @@ DATE WRITTEN:
     May 8, 2024
 
 DATE REVISED:
-    January 25, 2025
+    October 18, 2026
 
 PURPOSE:
     The purpose of db.py is to connect to the MongoDB database and provide a reusable function, get_database(), 
@@ -21,17 +21,98 @@ PURPOSE:
     access throughout the system.
 
 DATA STRUCTURES, ALGORITHMS, AND CONTROL:
-    The program uses the pymongo library to manage database connections. It establishes a connection to a local 
-    MongoDB instance using MongoClient and provides the database instance through the get_database() function 
-    for other modules to interact with the data.
+    The program uses the motor library, the asynchronous driver for MongoDB, so database round trips never 
+    block the event loop. The client and its connection pool are opened by connect_to_database() and closed by 
+    close_database_connection(), both called from the application lifespan in main.py. The connection string, 
+    database name and pool sizes come from the MONGO_URI, MONGO_DATABASE, MONGO_MAX_POOL_SIZE and 
+    MONGO_MIN_POOL_SIZE environment variables. get_database() provides the database instance for other modules 
+    and takes the caller's read intent. READ_PRIMARY, the default, is for writes and for reads that must see 
+    the caller's own writes, such as a login right after registering. READ_SECONDARY is for browse lists that 
+    may trail the primary by up to MONGO_MAX_STALENESS_SECONDS. Those reads use 
+    MONGO_SECONDARY_READ_PREFERENCE, secondaryPreferred by default, so they fall back to the primary when no 
+    secondary is fresh enough. A staleness bound under 90 seconds, the server's minimum, or an unknown read 
+    preference is refused when the client is opened rather than on the first secondary read. Both handles 
+    share one client and pool. Against a standalone server both intents reach the same node. The client 
+    reports every command to the listener in metrics.py, which times it per collection and operation, and to 
+    any extra listeners a benchmark passes in. ping_database() backs the health checks. The client is only 
+    created by connect_to_database(), never at import time, so each server worker opens its own pool after it 
+    has been forked.
+
+USAGE:
+    A single-node replica set stands in for a production cluster during local testing:
+    mongod --replSet rs0 --dbpath /tmp/rs0 --port 27017 &
+    mongosh --eval 'rs.initiate()'
+    MONGO_URI="mongodb://localhost:27017/?replicaSet=rs0" python -m benchmarks.load_test
+    cd backend && python -m pytest tests    # read routing checks, no server needed
 """
 
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+from pymongo.read_preferences import Nearest, Primary, Secondary, SecondaryPreferred
+from config.metrics import command_listener
+from typing import Sequence
+import asyncio
+import os
+
+MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017/")
+DATABASE_NAME = os.getenv("MONGO_DATABASE", "fureverpals")
+MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", 100))
+MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", 0))
+PING_TIMEOUT_SECONDS = float(os.getenv("MONGO_PING_TIMEOUT_SECONDS", 2))
+SECONDARY_READ_PREFERENCE = os.getenv("MONGO_SECONDARY_READ_PREFERENCE", "secondaryPreferred")
+MAX_STALENESS_SECONDS = int(os.getenv("MONGO_MAX_STALENESS_SECONDS", 90))
+MIN_MAX_STALENESS_SECONDS = 90
+
+# Read intents a controller declares when it asks for the database
+READ_PRIMARY = "primary"
+READ_SECONDARY = "secondary"
+
+STALE_READ_PREFERENCES = {"secondaryPreferred": SecondaryPreferred, "secondary": Secondary, "nearest": Nearest}
+
+client = None
+db = None
+secondary_db = None
+
+def secondary_read_preference():
+    # Builds the read preference for reads that may lag the primary by up to MAX_STALENESS_SECONDS
+    if SECONDARY_READ_PREFERENCE == "primary":
+        return Primary()
+    if SECONDARY_READ_PREFERENCE not in STALE_READ_PREFERENCES:
+        raise ValueError(f"MONGO_SECONDARY_READ_PREFERENCE must be primary or one of {', '.join(STALE_READ_PREFERENCES)}")
+    if MAX_STALENESS_SECONDS < MIN_MAX_STALENESS_SECONDS:
+        # The server refuses smaller bounds, which would otherwise only surface on the first secondary read
+        raise ValueError(f"MONGO_MAX_STALENESS_SECONDS must be at least {MIN_MAX_STALENESS_SECONDS}, got {MAX_STALENESS_SECONDS}")
+    return STALE_READ_PREFERENCES[SECONDARY_READ_PREFERENCE](max_staleness=MAX_STALENESS_SECONDS)
+
+def connect_to_database(extra_listeners: Sequence[monitoring.CommandListener] = ()):
+    # Opens the MongoDB client and its connection pool; tools may pass more command listeners
+    global client, db, secondary_db
+    stale_read_preference = secondary_read_preference()
+    client = AsyncIOMotorClient(MONGO_URI, maxPoolSize=MAX_POOL_SIZE, minPoolSize=MIN_POOL_SIZE, event_listeners=[command_listener, *extra_listeners])
+    db = client.get_database(DATABASE_NAME, read_preference=Primary())
+    secondary_db = client.get_database(DATABASE_NAME, read_preference=stale_read_preference)
+
+def close_database_connection():
+    # Closes the MongoDB client and releases its pooled connections
+    global client, db, secondary_db
+    if client is not None:
+        client.close()
+    client = None
+    db = None
+    secondary_db = None
 
-# MongoDB connection setup
-client = MongoClient("mongodb://localhost:27017/")
-db = client["fureverpals"]
+def get_database(read: str = READ_PRIMARY):
+    # Returns the database instance for the declared read intent; writes always go to the primary
+    if db is None:
+        raise RuntimeError("Database connection is not open; connect_to_database() must be called first")
+    return secondary_db if read == READ_SECONDARY else db
 
-def get_database():
-    # Returns the database instance
-    return db
\ No newline at end of file
+async def ping_database() -> bool:
+    # Checks that the database answers a ping within PING_TIMEOUT_SECONDS
+    if db is None:
+        return False
+    try:
+        await asyncio.wait_for(db.command("ping"), PING_TIMEOUT_SECONDS)
+        return True
+    except Exception:
+        return False
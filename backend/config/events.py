@@ -0,0 +1,235 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - events.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The events.py file is part of the backend configuration layer. The pet and user controllers publish change
+    events to it, main.py starts and stops it, and events_router.py streams the events to connected clients.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of events.py is to push new pets and posts to the mobile app as they are created, so clients can
+    stop polling /all-pets and /all-user-posts, and to let a client that reconnects catch up on what it missed.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    EventBus fans every event out to its subscribers. Each subscriber has an asyncio queue bounded by
+    EVENT_CLIENT_BUFFER. A subscriber whose queue is full is dropped and told to reload, so a slow client
+    costs at most that many events of memory. The backend decides how events travel and how they are
+    replayed.
+    - LocalEventBackend numbers events with an in-process counter and keeps the last EVENT_HISTORY of them in
+      a deque.
+    - When EVENTS_BACKEND is "redis", RedisEventBackend appends events to a capped Redis stream. A reader task
+      in every worker delivers them to that worker's subscribers, so a post made on one worker reaches
+      clients connected to any other.
+    Either way, replay() returns the events after a Last-Event-ID. It returns None when that id is older than
+    the kept history, and the client then reloads its lists instead. On shutdown, close_subscribers() ends
+    every open stream and refuses new ones. main.py calls it as soon as the server gets its exit signal,
+    because uvicorn waits for open responses before it runs the lifespan shutdown. Clients then reconnect with
+    their Last-Event-ID.
+"""
+
+from collections import deque
+from typing import AsyncIterator, List, NamedTuple, Optional
+import asyncio
+import json
+import os
+
+EVENTS_BACKEND = os.getenv("EVENTS_BACKEND", "memory")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+EVENT_HISTORY = int(os.getenv("EVENT_HISTORY", 1000))
+EVENT_CLIENT_BUFFER = int(os.getenv("EVENT_CLIENT_BUFFER", 100))
+EVENT_HEARTBEAT_SECONDS = 15
+EVENT_STREAM = "fureverpals:events"
+
+class Event(NamedTuple):
+    id: str
+    type: str
+    data: dict
+
+# Sent to a subscriber in place of the events it could not keep up with
+OVERFLOW = Event("", "reset", {"reason": "overflow"})
+# Ends a subscriber's stream when the server shuts down; the client reconnects with its Last-Event-ID
+CLOSED = Event("", "close", {})
+
+class LocalEventBackend:
+    def __init__(self, history: int):
+        self.history = deque(maxlen=history)
+        self.sequence = 0
+        self.deliver = None
+
+    async def start(self, deliver):
+        self.deliver = deliver
+
+    async def stop(self):
+        self.deliver = None
+
+    async def publish(self, event_type: str, data: dict):
+        self.sequence += 1
+        event = Event(str(self.sequence), event_type, data)
+        self.history.append(event)
+        if self.deliver is not None:
+            self.deliver(event)
+
+    async def replay(self, last_event_id: str) -> Optional[List[Event]]:
+        if not last_event_id.isdigit():
+            return None
+        last = int(last_event_id)
+        if last > self.sequence:
+            return None
+        oldest = int(self.history[0].id) if self.history else self.sequence + 1
+        if last < oldest - 1:
+            return None
+        return [event for event in self.history if int(event.id) > last]
+
+class RedisEventBackend:
+    def __init__(self, history: int, url: str = REDIS_URL):
+        import redis.asyncio as redis
+
+        self.history = history
+        self.redis = redis.from_url(url)
+        self.reader = None
+
+    async def start(self, deliver):
+        self.reader = asyncio.create_task(self.read_stream(deliver))
+
+    async def stop(self):
+        if self.reader is not None:
+            self.reader.cancel()
+            await asyncio.gather(self.reader, return_exceptions=True)
+        await self.redis.aclose()
+
+    async def read_stream(self, deliver):
+        # Delivers every event appended to the stream from now on, by any worker
+        last_id = "$"
+        while True:
+            try:
+                batches = await self.redis.xread({EVENT_STREAM: last_id}, block=5000, count=100)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Event stream read failed: {e}")
+                await asyncio.sleep(1)
+                continue
+            for _, entries in batches:
+                for entry_id, fields in entries:
+                    last_id = entry_id
+                    deliver(self.to_event(entry_id, fields))
+
+    def to_event(self, entry_id, fields) -> Event:
+        return Event(entry_id.decode(), fields[b"type"].decode(), json.loads(fields[b"data"]))
+
+    async def publish(self, event_type: str, data: dict):
+        await self.redis.xadd(EVENT_STREAM, {"type": event_type, "data": json.dumps(data, default=str)}, maxlen=self.history, approximate=True)
+
+    async def replay(self, last_event_id: str) -> Optional[List[Event]]:
+        try:
+            oldest = await self.redis.xrange(EVENT_STREAM, count=1)
+            if oldest and stream_id_key(last_event_id) < stream_id_key(oldest[0][0].decode()):
+                return None
+            entries = await self.redis.xrange(EVENT_STREAM, min=f"({last_event_id}", count=self.history)
+        except Exception:
+            return None
+        return [self.to_event(entry_id, fields) for entry_id, fields in entries]
+
+def stream_id_key(stream_id: str):
+    # Orders Redis stream ids, which are "<milliseconds>-<sequence>"
+    milliseconds, _, sequence = stream_id.partition("-")
+    return int(milliseconds), int(sequence or 0)
+
+class EventBus:
+    def __init__(self):
+        if EVENTS_BACKEND == "redis":
+            self.backend = RedisEventBackend(EVENT_HISTORY)
+        else:
+            self.backend = LocalEventBackend(EVENT_HISTORY)
+        self.subscribers = set()
+        self.dropped = 0
+        self.closing = False
+
+    async def start(self):
+        await self.backend.start(self.deliver)
+
+    async def stop(self):
+        self.close_subscribers()
+        await self.backend.stop()
+
+    def close_subscribers(self):
+        # Ends every open stream and refuses new ones, so a graceful shutdown does not wait on connected clients
+        self.closing = True
+        for queue in list(self.subscribers):
+            self.subscribers.discard(queue)
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(CLOSED)
+
+    def deliver(self, event: Event):
+        # Hands an event to every subscriber, dropping those whose buffer is full
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self.drop(queue)
+
+    def drop(self, queue: asyncio.Queue):
+        # Replaces a subscriber's backlog with a reset notice and stops feeding it
+        self.subscribers.discard(queue)
+        self.dropped += 1
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(OVERFLOW)
+
+    async def publish(self, event_type: str, data: dict):
+        # Publishes a change event; a failure is logged and never fails the write that caused it
+        try:
+            await self.backend.publish(event_type, data)
+        except Exception as e:
+            print(f"Could not publish {event_type} event: {e}")
+
+    def subscribe(self) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=EVENT_CLIENT_BUFFER + 1)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+
+    async def listen(self, last_event_id: Optional[str] = None, heartbeat: float = EVENT_HEARTBEAT_SECONDS) -> AsyncIterator[Optional[Event]]:
+        # Yields the events after last_event_id, then new events as they are published, and None when idle
+        if self.closing:
+            return
+        queue = self.subscribe()
+        try:
+            replayed = set()
+            if last_event_id:
+                events = await self.backend.replay(last_event_id)
+                if events is None:
+                    yield Event("", "reset", {"reason": "history"})
+                else:
+                    for event in events:
+                        replayed.add(event.id)
+                        yield event
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event is CLOSED:
+                    return
+                if event.id in replayed:
+                    continue
+                yield event
+                if event is OVERFLOW:
+                    return
+        finally:
+            self.unsubscribe(queue)
+
+event_bus = EventBus()
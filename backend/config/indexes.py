@@ -0,0 +1,157 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - indexes.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The indexes.py file is part of the backend configuration layer, next to db.py. It declares the MongoDB
+    indexes every collection needs and is run by the application lifespan in main.py when the server starts.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of indexes.py is to keep the indexes behind the controller queries in one place, so lookups by
+    username, the paged pet lists, the post feed and adoption applications are served from indexes instead of
+    collection scans, and so the uniqueness of usernames and of one application per user and pet is enforced
+    by the database.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program keeps a list of IndexSpec entries and creates them with create_index(), which does nothing when
+    an identical index already exists, so startup stays idempotent. Indexes listed in RETIRED_INDEXES are
+    dropped first, so an index can be replaced by one with the same keys and new options. A unique index that
+    cannot be built, for example because of existing duplicates, stops startup, since writes rely on it to
+    reject duplicates; the error names the script that removes them, scripts/migrate_users.py for usernames and
+    scripts/migrate_applications.py for applications. Other index failures are only reported. The posts feed
+    pages by _id, which needs no extra index, so the old date_posted index is retired. The application index
+    only covers documents with a pet_id, so applications older than pet_id do not collide with each other. Run
+    as a module, it prints the winning plan of each query shape the controllers use, as reported by explain(),
+    to show which ones are index-covered.
+
+USAGE:
+    cd backend && python -m config.indexes            # create the indexes
+    cd backend && python -m config.indexes --explain  # report index coverage of controller queries
+"""
+
+import argparse
+import asyncio
+from typing import List, NamedTuple, Optional, Tuple, Union
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, GEOSPHERE, TEXT
+from pymongo.errors import OperationFailure
+from config.db import connect_to_database, close_database_connection, get_database
+
+class IndexSpec(NamedTuple):
+    collection: str
+    keys: List[Tuple[str, Union[int, str]]]
+    name: str
+    unique: bool = False
+    options: Optional[dict] = None
+    repair: Optional[str] = None
+
+INDEXES = [
+    IndexSpec("users", [("username", ASCENDING)], "username_unique", unique=True, repair="scripts.migrate_users"),
+    IndexSpec("pets", [("username", ASCENDING), ("_id", DESCENDING)], "username_id"),
+    IndexSpec("pets", [("location", ASCENDING), ("sex", ASCENDING), ("_id", DESCENDING)], "location_sex_id"),
+    IndexSpec("pets", [("sex", ASCENDING), ("pet_age", ASCENDING)], "sex_age"),
+    IndexSpec("pets", [("pet_name", TEXT), ("description", TEXT)], "name_description_text", options={"weights": {"pet_name": 5, "description": 1}}),
+    IndexSpec("pets", [("geo", GEOSPHERE)], "geo_2dsphere"),
+    IndexSpec("feed", [("username", ASCENDING)], "username"),
+    IndexSpec("adoption_applications", [("pet_id", ASCENDING), ("username", ASCENDING)], "pet_id_username_unique", unique=True, options={"partialFilterExpression": {"pet_id": {"$exists": True}}}, repair="scripts.migrate_applications"),
+    IndexSpec("adoption_applications", [("pet_id", ASCENDING), ("_id", DESCENDING)], "pet_id_id"),
+    IndexSpec("adoption_applications", [("username", ASCENDING), ("_id", DESCENDING)], "username_id"),
+]
+
+INDEX_NOT_FOUND = 27
+
+# Indexes no longer declared, or replaced by a declared one with the same keys, dropped before the declared ones are created
+RETIRED_INDEXES = [
+    ("adoption_applications", "pet_id_username"),
+    ("posts", "date_posted_desc"),
+]
+
+class QueryShape(NamedTuple):
+    label: str
+    collection: str
+    filter: dict
+    sort: Optional[List[Tuple[str, int]]] = None
+
+QUERY_SHAPES = [
+    QueryShape("users by username", "users", {"username": "example"}),
+    QueryShape("pets by username, newest first", "pets", {"username": "example"}, [("_id", DESCENDING)]),
+    QueryShape("all pets, newest first", "pets", {}, [("_id", DESCENDING)]),
+    QueryShape("pets search by location and sex", "pets", {"location": {"$regex": "^Manila"}, "sex": "Female"}, [("_id", DESCENDING)]),
+    QueryShape("pets search by sex and age range", "pets", {"sex": "Male", "pet_age": {"$gte": 1, "$lte": 3}}),
+    QueryShape("pets search by text", "pets", {"$text": {"$search": "playful"}}),
+    QueryShape("pets search by radius", "pets", {"geo": {"$geoWithin": {"$centerSphere": [[121.0, 14.6], 10 / 6378.1]}}}),
+    QueryShape("posts feed, newest first", "posts", {}, [("_id", DESCENDING)]),
+    QueryShape("materialized feed, newest first", "feed", {}, [("_id", DESCENDING)]),
+    QueryShape("feed entries by author", "feed", {"username": "example"}),
+    QueryShape("applications for a pet", "adoption_applications", {"pet_id": ObjectId()}),
+    QueryShape("applications by pet, newest", "adoption_applications", {"pet_id": ObjectId()}, [("_id", DESCENDING)]),
+    QueryShape("applications by user, newest", "adoption_applications", {"username": "example"}, [("_id", DESCENDING)]),
+]
+
+async def ensure_indexes():
+    # Drops retired indexes and creates every declared index; existing identical indexes are left untouched
+    db = get_database()
+    for collection, name in RETIRED_INDEXES:
+        try:
+            if name in await db[collection].index_information():
+                await db[collection].drop_index(name)
+        except OperationFailure as e:
+            # Another worker starting at the same time may have dropped it first
+            if e.code != INDEX_NOT_FOUND:
+                print(f"Could not drop retired index {collection}.{name}: {e}")
+    for spec in INDEXES:
+        try:
+            await db[spec.collection].create_index(spec.keys, name=spec.name, unique=spec.unique, **(spec.options or {}))
+        except OperationFailure as e:
+            if spec.unique:
+                # Writes rely on unique indexes to reject duplicates, so the server must not run without them
+                hint = f"; remove the duplicates with `cd backend && python -m {spec.repair}` and restart" if spec.repair else ""
+                raise RuntimeError(f"Could not create unique index {spec.collection}.{spec.name}: {e}{hint}") from e
+            print(f"Could not create index {spec.collection}.{spec.name}: {e}")
+
+def plan_stages(plan: dict) -> List[str]:
+    # Collects the stage names of a query plan tree
+    stages = [plan["stage"]] if "stage" in plan else []
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            stages += plan_stages(plan[key])
+    for child in plan.get("inputStages", []):
+        stages += plan_stages(child)
+    return stages
+
+async def explain_queries():
+    # Prints whether each controller query shape is served by an index
+    db = get_database()
+    for shape in QUERY_SHAPES:
+        cursor = db[shape.collection].find(shape.filter)
+        if shape.sort:
+            cursor = cursor.sort(shape.sort)
+        explanation = await cursor.explain()
+        stages = plan_stages(explanation["queryPlanner"]["winningPlan"])
+        covered = "COLLSCAN" not in stages
+        print(f"{'indexed' if covered else 'SCAN':>8}  {shape.label:<32} {' <- '.join(stages)}")
+
+async def main():
+    parser = argparse.ArgumentParser(description="Create the FurEver Pals indexes or report their coverage")
+    parser.add_argument("--explain", action="store_true", help="Report index coverage of controller queries")
+    args = parser.parse_args()
+
+    connect_to_database()
+    try:
+        await ensure_indexes()
+        if args.explain:
+            await explain_queries()
+    finally:
+        close_database_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,272 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - media.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The media.py file is part of the backend configuration layer, next to db.py. It owns where photo bytes are
+    kept, so pet, user and adoption documents only have to store a short reference to each photo.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of media.py is to store uploaded photos by the SHA-256 hash of their content and to read them
+    back as a stream of chunks. Because the hash is the key, uploading the same photo twice stores it once, and a
+    stored photo can never change, which lets the /media endpoint cache it for as long as clients like.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program offers two interchangeable stores selected with the MEDIA_BACKEND environment variable:
+    GridFSMediaStore keeps blobs in a GridFS bucket of the main database, and FileSystemMediaStore keeps them
+    under MEDIA_ROOT in a directory fan-out by hash prefix. Both expose put(), exists(), open() and delete();
+    open() returns the content type and an async iterator of chunks so large photos are never loaded whole.
+    writer() returns a writer that takes a photo chunk by chunk, hashing it as it goes, and names the blob by
+    its hash when it is closed, so streamed uploads are never held whole in memory either. A closed writer
+    records whether it created the blob or found it already stored, so an upload that fails later only deletes a
+    blob it added itself. Every photo stored through store_photo() is also queued for the resized variants made
+    by thumbnails.py.
+"""
+
+from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+from gridfs.errors import NoFile
+from fastapi.concurrency import run_in_threadpool
+from config.db import get_database
+import binascii
+import base64
+import hashlib
+import os
+import tempfile
+import uuid
+
+MEDIA_BACKEND = os.getenv("MEDIA_BACKEND", "gridfs")
+MEDIA_ROOT = os.getenv("MEDIA_ROOT", "media")
+MEDIA_BUCKET = "media"
+CHUNK_SIZE = 256 * 1024
+
+class MediaNotFound(Exception):
+    pass
+
+def decode_photo(data: bytes) -> bytes:
+    # Returns the raw image bytes, decoding the base64 text the mobile app sends when needed
+    try:
+        return base64.b64decode(data, validate=True)
+    except (binascii.Error, ValueError):
+        return data
+
+def content_hash(data: bytes) -> str:
+    # Returns the content address of a blob
+    return hashlib.sha256(data).hexdigest()
+
+def sniff_content_type(head: bytes) -> str:
+    # Guesses the image type from the first bytes of the blob
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    return "application/octet-stream"
+
+class GridFSMediaStore:
+    def __init__(self, db):
+        self.db = db
+        self.bucket = AsyncIOMotorGridFSBucket(db, bucket_name=MEDIA_BUCKET, chunk_size_bytes=CHUNK_SIZE)
+
+    async def exists(self, digest: str) -> bool:
+        return await self.db[f"{MEDIA_BUCKET}.files"].find_one({"filename": digest}, {"_id": 1}) is not None
+
+    async def put(self, data: bytes) -> str:
+        # Stores the blob unless a blob with the same hash is already there
+        digest = content_hash(data)
+        if not await self.exists(digest):
+            metadata = {"content_type": sniff_content_type(data[:16])}
+            await self.bucket.upload_from_stream(digest, data, metadata=metadata)
+        return digest
+
+    async def open(self, digest: str):
+        try:
+            grid_out = await self.bucket.open_download_stream_by_name(digest)
+        except NoFile:
+            raise MediaNotFound(digest)
+        content_type = (grid_out.metadata or {}).get("content_type", "application/octet-stream")
+
+        async def chunks():
+            while True:
+                chunk = await grid_out.readchunk()
+                if not chunk:
+                    break
+                yield chunk
+
+        return content_type, chunks()
+
+    async def delete(self, digest: str):
+        async for grid_out in self.bucket.find({"filename": digest}):
+            try:
+                await self.bucket.delete(grid_out._id)
+            except NoFile:
+                pass
+
+    def writer(self) -> "GridFSMediaWriter":
+        return GridFSMediaWriter(self)
+
+class GridFSMediaWriter:
+    def __init__(self, store: GridFSMediaStore):
+        # The blob is uploaded under a temporary name, since its hash is only known at the end
+        self.store = store
+        self.hasher = hashlib.sha256()
+        self.head = b""
+        self.size = 0
+        self.created = False
+        self.grid_in = store.bucket.open_upload_stream(f"upload-{uuid.uuid4().hex}")
+
+    async def write(self, data: bytes):
+        self.hasher.update(data)
+        if len(self.head) < 16:
+            self.head += data[:16 - len(self.head)]
+        self.size += len(data)
+        await self.grid_in.write(data)
+
+    async def close(self) -> str:
+        # Names the blob by its hash, or drops it when a blob with the same hash is already stored
+        await self.grid_in.close()
+        digest = self.hasher.hexdigest()
+        if await self.store.exists(digest):
+            await self.store.bucket.delete(self.grid_in._id)
+        else:
+            await self.store.db[f"{MEDIA_BUCKET}.files"].update_one(
+                {"_id": self.grid_in._id},
+                {"$set": {"filename": digest, "metadata": {"content_type": sniff_content_type(self.head)}}},
+            )
+            self.created = True
+        return digest
+
+    async def abort(self):
+        await self.grid_in.abort()
+
+class FileSystemMediaStore:
+    def __init__(self, root: str):
+        self.root = root
+
+    def path_for(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    async def exists(self, digest: str) -> bool:
+        return await run_in_threadpool(os.path.exists, self.path_for(digest))
+
+    def _write(self, digest: str, data: bytes):
+        # Writes through a temporary file so readers never see a partial blob
+        path = self.path_for(digest)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_path, path)
+
+    async def put(self, data: bytes) -> str:
+        digest = content_hash(data)
+        await run_in_threadpool(self._write, digest, data)
+        return digest
+
+    def writer(self) -> "FileSystemMediaWriter":
+        return FileSystemMediaWriter(self)
+
+    def _delete(self, digest: str):
+        try:
+            os.remove(self.path_for(digest))
+        except FileNotFoundError:
+            pass
+
+    async def delete(self, digest: str):
+        await run_in_threadpool(self._delete, digest)
+
+    async def open(self, digest: str):
+        path = self.path_for(digest)
+        try:
+            handle = await run_in_threadpool(open, path, "rb")
+        except FileNotFoundError:
+            raise MediaNotFound(digest)
+        head = await run_in_threadpool(handle.read, 16)
+        content_type = sniff_content_type(head)
+
+        async def chunks():
+            try:
+                if head:
+                    yield head
+                while True:
+                    chunk = await run_in_threadpool(handle.read, CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    yield chunk
+            finally:
+                handle.close()
+
+        return content_type, chunks()
+
+class FileSystemMediaWriter:
+    def __init__(self, store: FileSystemMediaStore):
+        self.store = store
+        self.hasher = hashlib.sha256()
+        self.size = 0
+        self.created = False
+        self.handle = None
+        self.tmp_path = None
+
+    def _open(self):
+        # Creates the temporary file next to the blob directories, so the final rename stays on one filesystem
+        os.makedirs(self.store.root, exist_ok=True)
+        fd, self.tmp_path = tempfile.mkstemp(dir=self.store.root, prefix="upload-")
+        self.handle = os.fdopen(fd, "wb")
+
+    async def write(self, data: bytes):
+        if self.handle is None:
+            await run_in_threadpool(self._open)
+        self.hasher.update(data)
+        self.size += len(data)
+        await run_in_threadpool(self.handle.write, data)
+
+    def _finish(self, digest: str):
+        # Moves the finished upload into place, or drops it when the blob already exists
+        self.handle.close()
+        path = self.store.path_for(digest)
+        if os.path.exists(path):
+            os.remove(self.tmp_path)
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(self.tmp_path, path)
+        self.created = True
+
+    async def close(self) -> str:
+        digest = self.hasher.hexdigest()
+        if self.handle is None:
+            await run_in_threadpool(self.store._write, digest, b"")
+        else:
+            await run_in_threadpool(self._finish, digest)
+        return digest
+
+    async def abort(self):
+        if self.handle is not None:
+            self.handle.close()
+            await run_in_threadpool(os.remove, self.tmp_path)
+
+def get_media_store():
+    # Returns the media store selected by MEDIA_BACKEND
+    if MEDIA_BACKEND == "filesystem":
+        return FileSystemMediaStore(MEDIA_ROOT)
+    return GridFSMediaStore(get_database())
+
+async def store_photo(data: bytes) -> str:
+    # Stores an uploaded photo, queues it for resizing, and returns the hash used to reference it
+    from config.thumbnails import enqueue_thumbnails
+
+    digest = await get_media_store().put(decode_photo(data))
+    enqueue_thumbnails(digest)
+    return digest
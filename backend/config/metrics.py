@@ -0,0 +1,189 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - metrics.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The metrics.py file is part of the backend configuration layer. main.py installs its middleware on the app,
+    db.py registers its command listener on the MongoDB client, and metrics_router.py serves what it collects.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of metrics.py is to show where the time of a slow endpoint goes. It records the latency of every
+    request by route template, and the latency and returned document count of every MongoDB command by
+    collection and operation. Optionally, it logs each slow request with the commands it issued.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    Histogram keeps cumulative bucket counts, a sum and a count per label set, guarded by a lock because the
+    command listener runs on the driver's worker threads. Counter keeps one total per label set. The middleware
+    stores a fresh command list in a context variable before calling the route; the driver copies the context
+    into the thread that runs each command, so the listener can append to the list of the request that issued
+    it. When a request takes longer than SLOW_REQUEST_MS, which is off by default, its route, status, duration
+    and commands are printed. render_metrics() writes everything in the Prometheus text exposition format,
+    together with the hit and miss counters of the user profile cache and the subscriber counts of the event
+    bus.
+"""
+
+from contextvars import ContextVar
+from fastapi import Request
+from pymongo import monitoring
+from typing import Dict, List, Optional, Tuple
+import os
+import threading
+import time
+from config.cache import user_profile_cache
+from config.events import event_bus
+
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", 0))
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CURSOR_COMMANDS = {"getMore": "collection"}
+
+class Counter:
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.values: Dict[Tuple[str, ...], float] = {}
+        self.lock = threading.Lock()
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1):
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self.lock:
+            for labels, value in sorted(self.values.items()):
+                lines.append(f"{self.name}{format_labels(self.label_names, labels)} {value:g}")
+        return lines
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...], buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self.series: Dict[Tuple[str, ...], list] = {}
+        self.lock = threading.Lock()
+
+    def observe(self, labels: Tuple[str, ...], value: float):
+        with self.lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = [[0] * len(self.buckets), 0.0, 0]
+            counts = series[0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        bucket_names = self.label_names + ("le",)
+        with self.lock:
+            for labels, (counts, total, count) in sorted(self.series.items()):
+                for bound, bucket_count in zip(self.buckets, counts):
+                    lines.append(f"{self.name}_bucket{format_labels(bucket_names, labels + (f'{bound:g}',))} {bucket_count}")
+                lines.append(f"{self.name}_bucket{format_labels(bucket_names, labels + ('+Inf',))} {count}")
+                lines.append(f"{self.name}_sum{format_labels(self.label_names, labels)} {total:.6f}")
+                lines.append(f"{self.name}_count{format_labels(self.label_names, labels)} {count}")
+        return lines
+
+def format_labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    # Formats a Prometheus label set, escaping backslashes, quotes and newlines
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+request_latency = Histogram("http_request_duration_seconds", "Time to the start of the response, by route template.", ("method", "route", "status"))
+mongo_command_latency = Histogram("mongo_command_duration_seconds", "MongoDB command round trip time.", ("collection", "command"))
+mongo_command_documents = Counter("mongo_command_documents_total", "Documents returned or written by MongoDB commands.", ("collection", "command"))
+mongo_command_failures = Counter("mongo_command_failures_total", "MongoDB commands that failed.", ("collection", "command"))
+
+# Commands issued while handling the current request, for the slow-request log
+request_commands: ContextVar[Optional[list]] = ContextVar("request_commands", default=None)
+
+def reply_documents(reply: dict) -> int:
+    # Counts the documents a command returned or wrote
+    cursor = reply.get("cursor")
+    if isinstance(cursor, dict):
+        return len(cursor.get("firstBatch", cursor.get("nextBatch", [])))
+    return int(reply.get("n", 0))
+
+class CommandMetricsListener(monitoring.CommandListener):
+    def __init__(self):
+        self.pending: Dict[Tuple[int, int], Tuple[str, Optional[list]]] = {}
+        self.lock = threading.Lock()
+
+    def started(self, event):
+        collection = event.command.get(CURSOR_COMMANDS.get(event.command_name, event.command_name))
+        if not isinstance(collection, str):
+            collection = "-"
+        with self.lock:
+            self.pending[(event.request_id, event.operation_id)] = (collection, request_commands.get())
+
+    def finish(self, event, failed: bool):
+        with self.lock:
+            collection, commands = self.pending.pop((event.request_id, event.operation_id), ("-", None))
+        labels = (collection, event.command_name)
+        seconds = event.duration_micros / 1_000_000
+        mongo_command_latency.observe(labels, seconds)
+        if failed:
+            mongo_command_failures.inc(labels)
+            documents = 0
+        else:
+            documents = reply_documents(event.reply)
+            mongo_command_documents.inc(labels, documents)
+        if commands is not None:
+            commands.append({"collection": collection, "command": event.command_name, "ms": round(seconds * 1000, 2), "documents": documents, "failed": failed})
+
+    def succeeded(self, event):
+        self.finish(event, failed=False)
+
+    def failed(self, event):
+        self.finish(event, failed=True)
+
+command_listener = CommandMetricsListener()
+
+async def metrics_middleware(request: Request, call_next):
+    # Times each request by its route template and logs it with its MongoDB commands when it is slow
+    commands = []
+    token = request_commands.set(commands)
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        seconds = time.perf_counter() - started
+        request_commands.reset(token)
+        route = request.scope.get("route")
+        template = getattr(route, "path", "unmatched")
+        request_latency.observe((request.method, template, str(status_code)), seconds)
+        if SLOW_REQUEST_MS and seconds * 1000 >= SLOW_REQUEST_MS:
+            print(f"Slow request: {request.method} {template} -> {status_code} in {seconds * 1000:.1f} ms, {len(commands)} MongoDB command(s): {commands}")
+
+def render_metrics() -> str:
+    # Writes every metric in the Prometheus text exposition format
+    lines = []
+    for metric in (request_latency, mongo_command_latency, mongo_command_documents, mongo_command_failures):
+        lines += metric.render()
+    stats = user_profile_cache.stats()
+    for key in ("hits", "misses", "coalesced", "evictions"):
+        lines += [f"# TYPE cache_{key}_total counter", f'cache_{key}_total{{cache="{user_profile_cache.name}"}} {stats[key]}']
+    if stats["size"] is not None:
+        lines += ["# TYPE cache_entries gauge", f'cache_entries{{cache="{user_profile_cache.name}"}} {stats["size"]}']
+    lines += ["# TYPE event_subscribers gauge", f"event_subscribers {len(event_bus.subscribers)}"]
+    lines += ["# TYPE event_subscribers_dropped_total counter", f"event_subscribers_dropped_total {event_bus.dropped}"]
+    return "\n".join(lines) + "\n"
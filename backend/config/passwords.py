@@ -0,0 +1,80 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - passwords.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The passwords.py file is part of the backend configuration layer. It is used by user_controller.py whenever a
+    password is hashed at registration or checked at login.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of passwords.py is to keep bcrypt off the event loop and to bound how much hashing work the
+    server accepts at once. Each hash costs hundreds of milliseconds of CPU, so a burst of logins is queued on a
+    small dedicated pool, and once the queue is full further requests get 503 instead of stalling the server.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program uses passlib's CryptContext with a bcrypt cost factor read from BCRYPT_ROUNDS. Hashing runs on a
+    ThreadPoolExecutor of PASSWORD_HASH_WORKERS threads; bcrypt releases the GIL while it works, so the threads
+    hash in parallel. A counter of admitted jobs is compared to PASSWORD_HASH_QUEUE_LIMIT before each job is
+    submitted, and an HTTPException with status 503 and a Retry-After header is raised when it is exceeded.
+"""
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import os
+
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", HASH_WORKERS * 8))
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+executor = None
+pending_jobs = 0
+
+def get_executor() -> ThreadPoolExecutor:
+    # Returns the hashing pool, creating it on first use
+    global executor
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="password-hash")
+    return executor
+
+def shutdown_password_pool():
+    # Stops the hashing pool after the jobs already submitted have finished
+    global executor
+    if executor is not None:
+        executor.shutdown(wait=True)
+    executor = None
+
+async def run_hash_job(func, *args):
+    # Runs a bcrypt call on the hashing pool, refusing work beyond the queue limit
+    global pending_jobs
+    if pending_jobs >= HASH_QUEUE_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy, please try again",
+            headers={"Retry-After": "1"},
+        )
+    pending_jobs += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(get_executor(), func, *args)
+    finally:
+        pending_jobs -= 1
+
+async def hash_password(password: str) -> str:
+    # Hashes the user's password using bcrypt
+    return await run_hash_job(pwd_context.hash, password)
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    # Verifies if the plain password matches the hashed password
+    return await run_hash_job(pwd_context.verify, plain_password, hashed_password)
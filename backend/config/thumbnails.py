@@ -0,0 +1,160 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - thumbnails.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The thumbnails.py file is part of the backend configuration layer, next to media.py. store_photo() hands it
+    every uploaded photo, main.py starts and stops its workers, and media_controller.py asks it which stored
+    variant to serve for a ?w= hint.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of thumbnails.py is to keep list screens from downloading full-size photos. Every uploaded
+    photo is resized in the background to a few smaller widths. The /media endpoint serves the smallest
+    variant at least as wide as the width the client asks for, and the original until the variants exist.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    Uploads put their hash on a bounded asyncio queue without waiting. When the queue is full, the photo is
+    skipped and can be processed later by scripts/build_thumbnails.py. A few worker tasks take hashes off the
+    queue and read each original from the media store. The image is decoded once on a thread pool with
+    Pillow, with JPEG draft mode doing most of the downscale during decoding. It is encoded once per width in
+    THUMBNAIL_WIDTHS, largest first, each width resized from the one before. Widths at least as large as the
+    original are skipped. The variants are stored in the media store like any other blob. The map from
+    original hash to variant hashes is saved in the media_variants collection and read through a small
+    cache. Pillow is optional; without it no variants are made and the originals are always served.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+import asyncio
+import io
+import os
+from config.cache import ReadThroughCache
+from config.db import get_database
+from config.media import MediaNotFound, get_media_store
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+THUMBNAIL_WIDTHS = tuple(sorted({int(width) for width in os.getenv("THUMBNAIL_WIDTHS", "160,320,640").split(",") if width.strip()}))
+THUMBNAIL_FORMAT = os.getenv("THUMBNAIL_FORMAT", "WEBP").upper()
+THUMBNAIL_QUALITY = int(os.getenv("THUMBNAIL_QUALITY", 80))
+THUMBNAIL_WORKERS = int(os.getenv("THUMBNAIL_WORKERS", max(1, (os.cpu_count() or 1) // 2)))
+THUMBNAIL_QUEUE_LIMIT = int(os.getenv("THUMBNAIL_QUEUE_LIMIT", 1000))
+
+queue: Optional[asyncio.Queue] = None
+workers = []
+executor = None
+
+# Variant hashes of processed originals, keyed by the original hash
+media_variant_cache = ReadThroughCache("media-variants", 10000, 300)
+
+def get_executor() -> ThreadPoolExecutor:
+    # Returns the image pool, creating it on first use
+    global executor
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=THUMBNAIL_WORKERS, thread_name_prefix="thumbnail")
+    return executor
+
+def render_variants(data: bytes, widths: Tuple[int, ...]) -> Dict[int, bytes]:
+    # Decodes an image once and encodes one resized copy per width smaller than the original
+    with Image.open(io.BytesIO(data)) as source:
+        source.draft("RGB", (max(widths), max(widths)))
+        image = ImageOps.exif_transpose(source)
+        has_alpha = image.mode in ("RGBA", "LA", "P") and THUMBNAIL_FORMAT != "JPEG"
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        variants = {}
+        for width in sorted(widths, reverse=True):
+            if width >= image.width:
+                continue
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, format=THUMBNAIL_FORMAT, quality=THUMBNAIL_QUALITY)
+            variants[width] = buffer.getvalue()
+        return variants
+
+async def process_photo(digest: str):
+    # Builds and records the variants of one stored original, unless that was already done
+    db = get_database()
+    if await db.media_variants.find_one({"_id": digest}, {"_id": 1}):
+        return
+    store = get_media_store()
+    try:
+        content_type, chunks = await store.open(digest)
+    except MediaNotFound:
+        return
+    widths = {}
+    if content_type.startswith("image/"):
+        data = b"".join([chunk async for chunk in chunks])
+        try:
+            rendered = await asyncio.get_running_loop().run_in_executor(get_executor(), render_variants, data, THUMBNAIL_WIDTHS)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Could not make thumbnails of {digest}: {e}")
+            rendered = {}
+        for width, variant in rendered.items():
+            widths[str(width)] = await store.put(variant)
+    # Photos that cannot be resized are recorded too, so they are served as they are and not retried
+    await db.media_variants.update_one({"_id": digest}, {"$set": {"widths": widths}}, upsert=True)
+
+async def thumbnail_worker():
+    # Processes queued photos one at a time until cancelled
+    while True:
+        digest = await queue.get()
+        try:
+            await process_photo(digest)
+        except Exception as e:
+            print(f"Thumbnail job for {digest} failed: {e}")
+        finally:
+            queue.task_done()
+
+def enqueue_thumbnails(digest: str):
+    # Queues a stored photo for resizing without waiting; photos are skipped when the queue is full
+    if queue is None:
+        return
+    try:
+        queue.put_nowait(digest)
+    except asyncio.QueueFull:
+        pass
+
+def start_thumbnail_workers():
+    # Starts the background workers, if Pillow is installed
+    global queue, workers
+    if Image is None:
+        print("Pillow is not installed; photos will be served at their original size")
+        return
+    queue = asyncio.Queue(maxsize=THUMBNAIL_QUEUE_LIMIT)
+    workers = [asyncio.create_task(thumbnail_worker()) for _ in range(THUMBNAIL_WORKERS)]
+
+async def stop_thumbnail_workers():
+    # Stops the workers; photos still queued are left for scripts/build_thumbnails.py
+    global queue, workers, executor
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    workers = []
+    queue = None
+    if executor is not None:
+        executor.shutdown(wait=True)
+    executor = None
+
+async def resolve_variant(digest: str, width: int) -> Tuple[str, bool]:
+    # Picks the blob to serve for a width hint; the flag is False while the original is still being processed
+    db = get_database()
+    record = await media_variant_cache.get_or_load(digest, lambda: db.media_variants.find_one({"_id": digest}))
+    if record is None:
+        return digest, False
+    for variant_width in sorted(int(key) for key in record.get("widths", {})):
+        if variant_width >= width:
+            return record["widths"][str(variant_width)], True
+    return digest, True
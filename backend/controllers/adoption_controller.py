@@ -0,0 +1,190 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - adoption_controller.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The adoption_controller.py file handles the listing side of adoptions. It sits between pet_router.py and
+    user_router.py and the adoption_applications, pets and users collections. It lets the owner of a pet review
+    and decide the applications for it, and lets applicants follow their own.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of adoption_controller.py is to list the applications for a pet ranked by how well each
+    applicant fits as an adopter, so shelters can start with the most promising applicants, and to list the
+    applications of one user with the status of each.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program reads every application for the pet in one aggregation that joins each applicant's scores from
+    users, builds a NumPy score matrix from the joined rows, and ranks it with utils/ranking.py instead of
+    scoring documents in a Python loop. Only the requested slice of applicants is shaped into the response.
+    Ranking only covers pending applications unless another status is asked for. Sorted by newest, the pet's
+    applications are instead read one keyset page at a time from the (pet_id, _id) index, and only that page is
+    joined and scored. A user's applications are paged the same way from the (username, _id) index, each joined
+    to the name and photo of its pet; applications kept from before pet_id was stored are listed without one.
+    Every application has a status of pending, approved or rejected. When the owner changes it, the pet's
+    pending_applications counter is adjusted by the difference. Errors are reported with HTTPException.
+"""
+
+from fastapi import HTTPException, status
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
+from typing import List, Optional, Tuple
+import asyncio
+import numpy as np
+from config.db import get_database
+from config.auth import CurrentUser, ensure_same_user
+from utils.pagination import keyset_query, page_limit, split_page
+from utils.ranking import DEFAULT_WEIGHTS, SCORE_FIELDS, parse_weights, rank_applicants, score_applicants
+
+APPLICATION_FIELDS = ["username", "name", "address", "occupation", "responsible_for_pet_care", "plan_to_care_for_pet", "clinic_name", "reason_for_adopting", "status", "submitted_at"]
+APPLICATION_STATUSES = ("pending", "approved", "rejected")
+
+def application_match(pet_id: ObjectId, status_filter: Optional[str]) -> dict:
+    # Builds the filter for a pet's applications, optionally in one status
+    match = {"pet_id": pet_id}
+    if status_filter:
+        match["status"] = status_filter
+    return match
+
+def applications_pipeline(match: dict, newest_first: bool = False, limit: Optional[int] = None) -> List[dict]:
+    # Builds the aggregation that joins the matching applications to their applicants' scores
+    pipeline = [{"$match": match}, {"$sort": {"_id": -1 if newest_first else 1}}]
+    if limit is not None:
+        pipeline.append({"$limit": limit})
+    pipeline += [
+        {"$lookup": {"from": "users", "localField": "username", "foreignField": "username", "as": "applicant"}},
+        {"$unwind": {"path": "$applicant", "preserveNullAndEmptyArrays": True}},
+        {"$project": {
+            **{field: 1 for field in APPLICATION_FIELDS},
+            "scores": [{"$ifNull": [f"$applicant.{field}", 0]} for field in SCORE_FIELDS],
+        }},
+    ]
+    return pipeline
+
+def ranked_application(application: dict, score: float) -> dict:
+    # Shapes a joined application with its scores for the owner's listing
+    return {
+        "application_id": str(application["_id"]),
+        **{field: application.get(field) for field in APPLICATION_FIELDS},
+        "scores": dict(zip(SCORE_FIELDS, application["scores"])),
+        "score": round(float(score), 1),
+    }
+
+def parse_object_id(value: str, detail: str) -> ObjectId:
+    # Converts a path id into an ObjectId, answering 404 when it cannot name a document
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+async def load_owned_pet(pet_id: str, current_user: CurrentUser) -> dict:
+    # Fetches a pet the caller owns, answering 404 or 403 otherwise
+    db = get_database()
+    pet_oid = parse_object_id(pet_id, "Pet not found")
+    pet = await db.pets.find_one({"_id": pet_oid}, {"username": 1, "pending_applications": 1})
+    if not pet:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pet not found")
+    if pet["username"] != current_user.username:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only the pet's owner can view its applications")
+    return pet
+
+async def get_ranked_applications(pet_id: str, current_user: CurrentUser, sort: str = "score", weights: Optional[str] = None, offset: int = 0, limit: Optional[int] = None, after: Optional[str] = None, status_filter: Optional[str] = None) -> Tuple[dict, Optional[str]]:
+    # Lists the applications for a pet, best-fitting applicants first unless sorted by newest, with the next page cursor
+    db = get_database()
+    pet = await load_owned_pet(pet_id, current_user)
+    weight_vector = parse_weights(weights) if weights else DEFAULT_WEIGHTS
+    limit = page_limit(limit)
+    if sort == "score" and status_filter is None:
+        # Ranking is for choosing among the applicants still waiting for a decision
+        status_filter = "pending"
+    match = application_match(pet["_id"], status_filter)
+
+    if sort == "newest":
+        # Newest first is one keyset page read from the pet_id_id index, counted from the same index
+        page, total = await asyncio.gather(
+            db.adoption_applications.aggregate(applications_pipeline(keyset_query(match, after), newest_first=True, limit=limit + 1)).to_list(length=limit + 1),
+            db.adoption_applications.count_documents(match),
+        )
+        page, next_cursor = split_page(page, limit)
+        if not page:
+            return {"total": total, "applications": []}, None
+        scores = score_applicants(np.array([application["scores"] for application in page], dtype=np.float32), weight_vector)
+        return {"total": total, "applications": [ranked_application(application, score) for application, score in zip(page, scores)]}, next_cursor
+
+    applications = await db.adoption_applications.aggregate(applications_pipeline(match)).to_list(length=None)
+    if not applications:
+        return {"total": 0, "applications": []}, None
+    matrix = np.array([application["scores"] for application in applications], dtype=np.float32)
+    order, scores = rank_applicants(matrix, weight_vector, top=offset + limit)
+    ranked = [ranked_application(applications[index], scores[index]) for index in order[offset:offset + limit]]
+    return {"total": len(applications), "applications": ranked}, None
+
+async def update_application_status(pet_id: str, application_id: str, new_status: str, current_user: CurrentUser) -> dict:
+    # Moves an application to a new status and keeps the pet's pending count in step
+    db = get_database()
+    pet = await load_owned_pet(pet_id, current_user)
+    application_oid = parse_object_id(application_id, "Application not found")
+    previous = await db.adoption_applications.find_one_and_update(
+        {"_id": application_oid, "pet_id": pet["_id"]},
+        {"$set": {"status": new_status}},
+        projection={"status": 1},
+        return_document=ReturnDocument.BEFORE,
+    )
+    if not previous:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Application not found")
+    was_pending = previous.get("status", "pending") == "pending"
+    change = int(new_status == "pending") - int(was_pending)
+    if change:
+        await db.pets.update_one({"_id": pet["_id"]}, {"$inc": {"pending_applications": change}})
+    return {"application_id": application_id, "status": new_status}
+
+def applicant_pipeline(match: dict, limit: int) -> List[dict]:
+    # Builds the aggregation that reads one page of a user's applications with the pets they are for
+    return [
+        {"$match": match},
+        {"$sort": {"_id": -1}},
+        {"$limit": limit},
+        {"$lookup": {
+            "from": "pets",
+            "localField": "pet_id",
+            "foreignField": "_id",
+            "pipeline": [{"$project": {"pet_name": 1, "pet_photo_id": 1, "username": 1}}],
+            "as": "pet",
+        }},
+        {"$project": {"pet_id": 1, "status": 1, "submitted_at": 1, "pet": {"$arrayElemAt": ["$pet", 0]}}},
+    ]
+
+def applicant_summary(application: dict) -> dict:
+    # Shapes one of a user's applications for their listing; applications from before pet_id was stored have none
+    pet = application.get("pet") or {}
+    pet_id = application.get("pet_id")
+    return {
+        "application_id": str(application["_id"]),
+        "pet_id": str(pet_id) if pet_id is not None else None,
+        "pet_name": pet.get("pet_name"),
+        "pet_photo_id": pet.get("pet_photo_id"),
+        "owner": pet.get("username"),
+        "status": application.get("status", "pending"),
+        "submitted_at": application.get("submitted_at"),
+    }
+
+async def get_user_applications(username: str, current_user: CurrentUser, after: Optional[str] = None, limit: Optional[int] = None, status_filter: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+    # Lists one newest-first page of the applications a user has submitted
+    ensure_same_user(current_user, username)
+    db = get_database()
+    limit = page_limit(limit)
+    match = {"username": username}
+    if status_filter:
+        match["status"] = status_filter
+    page = await db.adoption_applications.aggregate(applicant_pipeline(keyset_query(match, after), limit + 1)).to_list(length=limit + 1)
+    page, next_cursor = split_page(page, limit)
+    return [applicant_summary(application) for application in page], next_cursor
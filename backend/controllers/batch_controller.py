@@ -0,0 +1,159 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - batch_controller.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The batch_controller.py file handles the logic behind the /batch endpoint. It sits between batch_router.py
+    and the read routes of user_router.py and pet_router.py, which it calls inside the running application.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of batch_controller.py is to let a mobile screen that needs several lookups, such as a pet, its
+    owner's details and the owner's other pets, get all of them in one HTTP round trip instead of one each.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    Each sub-request is turned into an ASGI scope and passed to the application itself, so it goes through the
+    same middleware, routing, validation and controllers as a direct call. Only GET routes of the user and pet
+    routers are allowed; other paths answer 404 inside the batch without running. The caller's Authorization
+    header is forwarded. Compression and conditional headers are not, since the outer response takes care of
+    both. Every response is held in memory until the batch is answered, so only JSON is collected: a sub-request
+    asking for the NDJSON stream answers 400 without running, a successful response of another type is cut off
+    at its first message and answers 406, and a body past MAX_BATCH_BODY_BYTES is cut off and answers 413. An
+    error response keeps its own status whatever its type; when it is not JSON, its text is returned under
+    detail, the way FastAPI shapes its own errors. Sub-requests with the same path and query share one call. The
+    distinct calls run concurrently with asyncio.gather, and identical profile lookups that still reach the
+    controllers share one query through the profile cache. The results come back in request order, with status,
+    paging headers and decoded body.
+"""
+
+from fastapi import Request
+from starlette.routing import Match
+from typing import List, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+import asyncio
+import json
+import os
+from models.batch_model import BatchRequest
+from routes.pet_router import router as pet_router
+from routes.user_router import router as user_router
+
+BATCH_ROUTES = [route for route in user_router.routes + pet_router.routes if "GET" in getattr(route, "methods", ())]
+FORWARDED_HEADERS = {b"authorization", b"accept-language"}
+RETURNED_HEADERS = ["x-next-cursor"]
+MAX_BATCH_BODY_BYTES = int(os.getenv("MAX_BATCH_BODY_BYTES", 1024 * 1024))
+
+class SubResponseRejected(Exception):
+    # Raised from send to stop a sub-request whose response cannot be buffered
+    def __init__(self, status: int, detail: str):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+def sub_request_scope(request: Request, path: str) -> dict:
+    # Builds the ASGI scope of a GET sub-request, on the same connection details as the batch request
+    parts = urlsplit(path)
+    headers = [(name, value) for name, value in request.scope["headers"] if name in FORWARDED_HEADERS]
+    headers.append((b"accept", b"application/json"))
+    scope = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": "GET",
+        "scheme": request.url.scheme,
+        "path": unquote(parts.path),
+        "raw_path": parts.path.encode(),
+        "root_path": request.scope.get("root_path", ""),
+        "query_string": parts.query.encode(),
+        "headers": headers,
+        "client": request.scope.get("client"),
+        "server": request.scope.get("server"),
+    }
+    if "state" in request.scope:
+        scope["state"] = request.scope["state"]
+    return scope
+
+def wants_stream(scope: dict) -> bool:
+    # Checks whether a sub-request asks for the NDJSON stream instead of a JSON page
+    return "stream" in parse_qs(scope["query_string"].decode("latin-1"), keep_blank_values=True)
+
+def is_batchable(scope: dict) -> bool:
+    # Checks that a sub-request targets a GET route of the user or pet router
+    return any(route.matches(scope)[0] == Match.FULL for route in BATCH_ROUTES)
+
+async def call_app(app, scope: dict, max_body: int = MAX_BATCH_BODY_BYTES) -> Tuple[int, dict, bytes]:
+    # Runs one sub-request through the application and collects its JSON response, up to max_body bytes
+    response = {"status": 500, "headers": {}, "body": bytearray()}
+    request_sent = False
+    response_done = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {name.decode("latin-1").lower(): value.decode("latin-1") for name, value in message.get("headers", [])}
+            content_type = response["headers"].get("content-type", "application/json")
+            if 200 <= message["status"] < 300 and not content_type.startswith("application/json"):
+                raise SubResponseRejected(406, f"{content_type} responses are not available in a batch")
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+            if len(response["body"]) > max_body:
+                raise SubResponseRejected(413, f"Response is larger than {max_body} bytes; request it directly")
+            if not message.get("more_body", False):
+                response_done.set()
+
+    try:
+        await app(scope, receive, send)
+    except SubResponseRejected as e:
+        response_done.set()
+        return e.status, {"content-type": "application/json"}, json.dumps({"detail": e.detail}).encode()
+    except Exception:
+        # The server error middleware has already sent a 500 when an endpoint raises
+        response["status"] = 500
+    return response["status"], response["headers"], bytes(response["body"])
+
+def decode_body(status_code: int, headers: dict, body: bytes):
+    # Decodes a collected sub-response; an error that is not JSON keeps its text under detail
+    if headers.get("content-type", "").startswith("application/json") and body:
+        return json.loads(body)
+    text = body.decode("utf-8", errors="replace")
+    if not 200 <= status_code < 300:
+        return {"detail": text}
+    return text
+
+async def run_sub_request(request: Request, path: str) -> dict:
+    # Runs one distinct sub-request and shapes its result
+    scope = sub_request_scope(request, path)
+    if not is_batchable(scope):
+        return {"status": 404, "headers": {}, "body": {"detail": "Not available in a batch"}}
+    if wants_stream(scope):
+        return {"status": 400, "headers": {}, "body": {"detail": "Streamed responses are not available in a batch"}}
+    status_code, headers, body = await call_app(request.app, scope)
+    return {
+        "status": status_code,
+        "headers": {name: headers[name] for name in RETURNED_HEADERS if name in headers},
+        "body": decode_body(status_code, headers, body),
+    }
+
+async def run_batch(request: Request, batch: BatchRequest) -> List[dict]:
+    # Runs the distinct sub-requests of a batch concurrently and returns the results in request order
+    paths = list(dict.fromkeys(sub_request.path for sub_request in batch.requests))
+    results = dict(zip(paths, await asyncio.gather(*(run_sub_request(request, path) for path in paths))))
+    return [
+        {"id": sub_request.id if sub_request.id is not None else str(index), "path": sub_request.path, **results[sub_request.path]}
+        for index, sub_request in enumerate(batch.requests)
+    ]
@@ -0,0 +1,88 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - feed_controller.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The feed_controller.py file owns the materialized home feed. user_controller.py writes to it when a post is
+    created or a profile changes, user_router.py serves it on /feed, and scripts/rebuild_feed.py rebuilds it.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of feed_controller.py is to make reading the feed cost one indexed page read, no matter how
+    many posts or users exist, by doing the work of joining each post to its author once, when it is written.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    Each entry of the feed collection is a copy of one post under the same _id, with the author's display
+    fields denormalized into an author sub-document. Because post ids grow with time, reading the feed newest
+    first is a keyset page over the _id index, using the same `after` cursor as the other list endpoints.
+    Entries are written with an upsert keyed on the post id, so the write path and the rebuild command can
+    both run without creating duplicates. When a user changes a display field, their entries are updated in
+    one update_many. Feed pages are read with READ_SECONDARY, so a replica can serve them within the
+    configured staleness bound.
+"""
+
+from pymongo import ReplaceOne
+from typing import List, Optional, Tuple
+from config.db import READ_SECONDARY, get_database
+from utils.pagination import fetch_page
+
+FEED_AUTHOR_FIELDS = ["firstname", "lastname", "profile_photo_id"]
+
+def feed_entry(post: dict, author: Optional[dict]) -> dict:
+    # Builds the feed document of a post, copying the author's display fields
+    author = author or {}
+    return {
+        "_id": post["_id"],
+        "username": post["username"],
+        "post_content": post["post_content"],
+        "date_posted": post["date_posted"],
+        "author": {field: author.get(field) for field in FEED_AUTHOR_FIELDS},
+    }
+
+def feed_summary(entry: dict) -> dict:
+    # Shapes a feed entry for responses, in the same shape as the /all-user-posts items
+    author = entry.get("author") or {}
+    return {
+        "username": entry["username"],
+        "post_id": str(entry["_id"]),
+        "post_content": entry["post_content"],
+        "date_posted": entry["date_posted"],
+        "firstname": author.get("firstname"),
+        "lastname": author.get("lastname"),
+        "profile_photo_id": author.get("profile_photo_id"),
+    }
+
+async def add_feed_entry(post: dict, author: Optional[dict]):
+    # Writes the feed entry of a new post
+    db = get_database()
+    entry = feed_entry(post, author)
+    await db.feed.replace_one({"_id": entry["_id"]}, entry, upsert=True)
+
+async def add_feed_entries(entries: List[dict]) -> int:
+    # Upserts a batch of feed entries and returns how many were written
+    if not entries:
+        return 0
+    db = get_database()
+    result = await db.feed.bulk_write([ReplaceOne({"_id": entry["_id"]}, entry, upsert=True) for entry in entries], ordered=False)
+    return result.upserted_count + result.modified_count
+
+async def refresh_feed_author(username: str, changes: dict):
+    # Copies changed display fields of a user into all of their feed entries
+    updates = {f"author.{field}": changes[field] for field in FEED_AUTHOR_FIELDS if field in changes}
+    if updates:
+        db = get_database()
+        await db.feed.update_many({"username": username}, {"$set": updates})
+
+async def get_feed(after: Optional[str] = None, limit: Optional[int] = None) -> Tuple[List[dict], Optional[str]]:
+    # Reads one newest-first page of the feed
+    db = get_database(READ_SECONDARY)
+    entries, next_cursor = await fetch_page(db.feed, {}, None, after, limit)
+    return [feed_summary(entry) for entry in entries], next_cursor
@@ -0,0 +1,60 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - media_controller.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The media_controller.py file handles the logic behind the /media endpoint. It sits between media_router.py
+    and the media store in config/media.py, turning a stored photo into an HTTP response for the mobile app.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of media_controller.py is to serve pet, profile and identity photos by their content hash. Since a
+    hash always names the same bytes, responses carry long-lived cache headers and repeated requests from a
+    client that already holds the photo are answered with 304 Not Modified.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program validates the requested hash, checks the If-None-Match header against the hash-based ETag, and
+    otherwise streams the blob chunk by chunk with FastAPI's StreamingResponse so memory use does not depend on
+    the size of the photo. Missing blobs are reported with an HTTPException. With a width hint it serves the
+    smallest resized variant at least that wide, as chosen by thumbnails.py. While the variants of a photo are
+    still being made, it serves the original with a short max-age instead of the immutable cache header, so
+    clients come back for the variant.
+"""
+
+from fastapi import HTTPException, Response, status
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from config.media import get_media_store, MediaNotFound
+from config.thumbnails import resolve_variant
+import re
+
+DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+PENDING_CACHE_CONTROL = "public, max-age=60"
+
+async def stream_media(digest: str, if_none_match: Optional[str] = None, width: Optional[int] = None):
+    # Streams a stored photo by its content hash, or its resized variant for a width hint
+    if not DIGEST_PATTERN.match(digest):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media not found")
+
+    final = True
+    if width:
+        digest, final = await resolve_variant(digest, width)
+    etag = f'"{digest}"'
+    headers = {"Cache-Control": CACHE_CONTROL if final else PENDING_CACHE_CONTROL, "ETag": etag}
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    try:
+        content_type, chunks = await get_media_store().open(digest)
+    except MediaNotFound:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media not found")
+    return StreamingResponse(chunks, media_type=content_type, headers=headers)
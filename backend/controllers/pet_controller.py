@@ -14,7 +14,7 @@ DATE WRITTEN:
     May 8, 2024
 
 DATE REVISED:
-    January 25, 2025
+    October 18, 2026
 
 PURPOSE:
    The purpose of pet_controller.py is to handle pet data, including adding new pets, fetching pet details, 
@@ -22,66 +22,265 @@ PURPOSE:
    enabling smooth adoption processes within the platform.
 
 DATA STRUCTURES, ALGORITHMS, AND CONTROL:
-    The program uses MongoDB to store and retrieve pet and adoption data, employing FastAPI's asynchronous 
-    functions for efficiency. It handles errors with exception handling, returning appropriate HTTP error messages 
-    for reliable pet data interactions.
+    The program uses MongoDB to store and retrieve pet and adoption data through the asynchronous motor 
+    driver, awaiting every query so FastAPI's event loop keeps serving other requests while a round trip is in 
+    flight. Pet lists are read one keyset page at a time, newest first, with an optional field projection so 
+    list views can skip fields they do not show. The NDJSON export mode instead yields pets from the cursor 
+    one batch at a time. Pet search combines a location prefix, sex, an age range, full-text search over the 
+    name and description, and a radius around a point into one query that the indexes declared in 
+    config/indexes.py can serve. When the caller sends a valid access token, the token already proves the user 
+    exists, so the users lookup before adding a pet or applying for one is skipped. Bulk imports check the 
+    owner once, validate each NDJSON row on its own, and insert valid rows in chunks with an unordered 
+    insert_many, collecting a per-row error report. A batch past BULK_MAX_ROWS, or past the line and body caps 
+    of streaming.py, stops with 413, naming how many pets were already imported. Each new pet, and each 
+    finished import, is published to the event bus for the /events stream. An adoption application is counted 
+    on its pet with one conditional update that also checks the pet exists and belongs to someone else, then 
+    inserted with status pending; the unique (pet_id, username) index turns a second application into 409 
+    Conflict, and the count is given back whenever the insert does not happen. The all-pets list, search and 
+    the all-pets NDJSON export declare READ_SECONDARY, so they can be served by a replica within the 
+    configured staleness bound; an owner's own list, its export and single pets are read from the primary. Pet 
+    and identity photos are written to the media store and the documents only keep the hash of each photo. It 
+    handles errors with exception handling, returning appropriate HTTP error messages for reliable pet data 
+    interactions.
 """
 
 from fastapi import HTTPException, status
-from typing import List
+from typing import AsyncIterator, List, Optional, Tuple
 from bson import ObjectId
+from bson.errors import InvalidId
+from pydantic import ValidationError
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from datetime import datetime
+import asyncio
+import os
+import re
 from models.pet_model import Pet, AdoptionApplication
-from config.db import get_database
+from config.db import READ_PRIMARY, READ_SECONDARY, get_database
+from config.media import store_photo
+from config.auth import CurrentUser, ensure_same_user
+from config.events import event_bus
+from utils.pagination import fetch_page, build_projection, keyset_query
+from utils.streaming import STREAM_BATCH_SIZE
 
-async def add_pet(pet: Pet):
+EARTH_RADIUS_KM = 6378.1
+BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", 500))
+BULK_MAX_ROWS = int(os.getenv("BULK_MAX_ROWS", 10000))
+BULK_MAX_REPORTED_ERRORS = 1000
+PET_FIELDS = ["pet_name", "pet_age", "sex", "location", "description", "username", "pet_photo_id", "pending_applications"]
+
+def pet_summary(pet: dict) -> dict:
+    # Shapes a projected pet document for list responses
+    summary = {"id": str(pet["_id"])}
+    summary.update({field: pet[field] for field in PET_FIELDS if field in pet})
+    return summary
+
+def pet_event(pet: dict) -> dict:
+    # Shapes a new pet for the event stream, leaving out the description
+    return {field: value for field, value in pet_summary(pet).items() if field != "description"}
+
+async def add_pet(pet: Pet, current_user: Optional[CurrentUser] = None, photo_id: Optional[str] = None):
     # Adds a new pet to the database
     db = get_database()
-    user = db.users.find_one({"username": pet.username})
-    if not user:
+    if current_user:
+        ensure_same_user(current_user, pet.username)
+    elif not await db.users.find_one({"username": pet.username}, {"_id": 1}):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Username does not exist")
+    document = await pet_document(pet, photo_id)
+    await db.pets.insert_one(document)
+    await event_bus.publish("pet", pet_event(document))
+    return pet_summary(document)
+
+async def pet_document(pet: Pet, photo_id: Optional[str] = None) -> dict:
+    # Builds the stored form of a pet, moving its photo to the media store unless it was streamed there already
+    document = pet.dict(exclude_unset=True, exclude={"pet_photo", "latitude", "longitude"})
+    if pet.latitude is not None and pet.longitude is not None:
+        document["geo"] = {"type": "Point", "coordinates": [pet.longitude, pet.latitude]}
+    document["pet_photo_id"] = photo_id or await store_photo(pet.pet_photo)
+    document["pending_applications"] = 0
+    return document
+
+def validation_message(error: ValidationError) -> str:
+    # Flattens a Pydantic validation error into one line for the bulk import report
+    return "; ".join(f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}" for item in error.errors())
+
+async def insert_pet_chunk(rows: List[Tuple[int, Pet]], report: dict):
+    # Stores the photos of a chunk of pets concurrently and inserts the chunk with one unordered insert_many
+    db = get_database()
+    documents = await asyncio.gather(*(pet_document(pet) for _, pet in rows), return_exceptions=True)
+    pending = []
+    for (row, _), document in zip(rows, documents):
+        if isinstance(document, Exception):
+            report_error(report, row, f"Could not store photo: {document}")
+        else:
+            pending.append((row, document))
+    if not pending:
+        return
+    try:
+        result = await db.pets.insert_many([document for _, document in pending], ordered=False)
+        report["inserted"] += len(result.inserted_ids)
+    except BulkWriteError as e:
+        failed = {error["index"]: error["errmsg"] for error in e.details.get("writeErrors", [])}
+        report["inserted"] += e.details.get("nInserted", 0)
+        for index, message in failed.items():
+            report_error(report, pending[index][0], message)
+
+def report_error(report: dict, row: int, message: str):
+    # Records a failed row, keeping at most BULK_MAX_REPORTED_ERRORS messages
+    report["failed"] += 1
+    if len(report["errors"]) < BULK_MAX_REPORTED_ERRORS:
+        report["errors"].append({"row": row, "error": message})
+
+async def bulk_add_pets(lines: AsyncIterator[bytes], owner: str, current_user: Optional[CurrentUser] = None):
+    # Imports a batch of NDJSON pet records for one owner, reporting every row that could not be added
+    db = get_database()
+    if current_user:
+        ensure_same_user(current_user, owner)
+    elif not await db.users.find_one({"username": owner}, {"_id": 1}):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Username does not exist")
-    db.pets.insert_one(pet.dict(exclude_unset=True))
-    return pet
+
+    report = {"inserted": 0, "failed": 0, "errors": []}
+    chunk = []
+    row = 0
+    try:
+        async for line in lines:
+            if not line.strip():
+                continue
+            row += 1
+            if row > BULK_MAX_ROWS:
+                raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=f"Batch is limited to {BULK_MAX_ROWS} rows")
+            try:
+                pet = Pet.model_validate_json(line)
+            except ValidationError as e:
+                report_error(report, row, validation_message(e))
+                continue
+            if pet.username != owner:
+                report_error(report, row, f"Pet belongs to '{pet.username}', not to '{owner}'")
+                continue
+            chunk.append((row, pet))
+            if len(chunk) >= BULK_CHUNK_SIZE:
+                await insert_pet_chunk(chunk, report)
+                chunk = []
+    except HTTPException as e:
+        # A batch over a size cap stops at that row; say how much of it was already stored
+        if e.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE and report["inserted"]:
+            await event_bus.publish("pets-imported", {"username": owner, "count": report["inserted"]})
+            raise HTTPException(status_code=e.status_code, detail=f"{e.detail}; {report['inserted']} pet(s) were imported before row {row}")
+        raise
+    if chunk:
+        await insert_pet_chunk(chunk, report)
+    report["rows"] = row
+    if report["inserted"]:
+        await event_bus.publish("pets-imported", {"username": owner, "count": report["inserted"]})
+    return report
 
 async def get_pet(pet_id: str):
-    # Fetches a specific pet by ID
+    # Fetches a specific pet by ID, shaped as a PetRecord
+    try:
+        pet_oid = ObjectId(pet_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pet not found")
     db = get_database()
-    pet = db.pets.find_one({"_id": ObjectId(pet_id)})
+    pet = await db.pets.find_one({"_id": pet_oid}, {field: 1 for field in PET_FIELDS})
     if pet:
-        return pet
+        return pet_summary(pet)
     else:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pet not found")
 
-async def get_pets(username: str):
-    # Fetches all pets for a specific user
+async def get_pets(username: str, after: Optional[str] = None, limit: Optional[int] = None, fields: Optional[str] = None):
+    # Fetches one page of pets for a specific user
     db = get_database()
-    pets = db.pets.find({"username": username})
-    if pets:
-        return list(pets)
+    pets, next_cursor = await fetch_page(db.pets, {"username": username}, build_projection(fields, PET_FIELDS), after, limit)
+    if pets or after:
+        return [pet_summary(pet) for pet in pets], next_cursor
     else:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No pets found for this user")
 
-async def get_all_pets() -> List[dict]:
-    # Fetches all pets from the database
-    db = get_database()
-    pets = db.pets.find({}, {"pet_name": 1, "pet_age": 1, "sex": 1, "location": 1, "description": 1, "username": 1, "pet_photo": 1})
-    if pets:
-        return [{"pet_name": pet["pet_name"], "pet_age": pet["pet_age"], "sex": pet["sex"], "location": pet["location"], "description": pet["description"], "username": pet["username"], "pet_photo": pet["pet_photo"]} for pet in pets]
+async def get_all_pets(after: Optional[str] = None, limit: Optional[int] = None, fields: Optional[str] = None) -> Tuple[List[dict], Optional[str]]:
+    # Fetches one page of pets from the database
+    db = get_database(READ_SECONDARY)
+    pets, next_cursor = await fetch_page(db.pets, {}, build_projection(fields, PET_FIELDS), after, limit)
+    if pets or after:
+        return [pet_summary(pet) for pet in pets], next_cursor
     else:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No pets found")
 
-async def adopt_pet(pet_id: str, adoption_app: AdoptionApplication):
-    # Processes the adoption application for a specific pet
+async def search_pets(
+    q: Optional[str] = None,
+    location: Optional[str] = None,
+    sex: Optional[str] = None,
+    min_age: Optional[int] = None,
+    max_age: Optional[int] = None,
+    latitude: Optional[float] = None,
+    longitude: Optional[float] = None,
+    radius_km: Optional[float] = None,
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+    fields: Optional[str] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    # Searches pets by field filters, age range, text and distance, one newest-first page at a time
+    db = get_database(READ_SECONDARY)
+    query = {}
+    if location:
+        query["location"] = {"$regex": f"^{re.escape(location)}"}
+    if sex:
+        query["sex"] = sex
+    if min_age is not None or max_age is not None:
+        if min_age is not None and max_age is not None and min_age > max_age:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="min_age cannot be greater than max_age")
+        query["pet_age"] = {}
+        if min_age is not None:
+            query["pet_age"]["$gte"] = min_age
+        if max_age is not None:
+            query["pet_age"]["$lte"] = max_age
+    if q:
+        query["$text"] = {"$search": q}
+    geo_params = [latitude, longitude, radius_km]
+    if any(value is not None for value in geo_params):
+        if any(value is None for value in geo_params):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="latitude, longitude and radius_km must be given together")
+        query["geo"] = {"$geoWithin": {"$centerSphere": [[longitude, latitude], radius_km / EARTH_RADIUS_KM]}}
+
+    pets, next_cursor = await fetch_page(db.pets, query, build_projection(fields, PET_FIELDS), after, limit)
+    return [pet_summary(pet) for pet in pets], next_cursor
+
+def stream_pets(query: dict, after: Optional[str] = None, fields: Optional[str] = None, read: str = READ_PRIMARY) -> AsyncIterator[dict]:
+    # Opens a newest-first pet cursor for the NDJSON export mode; arguments are checked before streaming starts
+    db = get_database(read)
+    cursor = db.pets.find(keyset_query(query, after), build_projection(fields, PET_FIELDS)).sort("_id", -1).batch_size(STREAM_BATCH_SIZE)
+    return (pet_summary(pet) async for pet in cursor)
+
+async def adopt_pet(pet_id: str, adoption_app: AdoptionApplication, current_user: Optional[CurrentUser] = None, photo_id: Optional[str] = None):
+    # Submits an adoption application for a specific pet and counts it as pending on the pet
     db = get_database()
-    user = db.users.find_one({"username": adoption_app.username})
-    if not user:
+    if current_user:
+        ensure_same_user(current_user, adoption_app.username)
+    elif not await db.users.find_one({"username": adoption_app.username}, {"_id": 1}):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Username does not exist")
-    
-    pet = db.pets.find_one({"_id": ObjectId(pet_id)})
-    if not pet:
+    try:
+        pet_oid = ObjectId(pet_id)
+    except (InvalidId, TypeError):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pet not found")
 
-    if pet["username"] == adoption_app.username:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="You cannot adopt your own pet")
+    # One conditional update checks that the pet exists and is not the applicant's own, and counts the application
+    pet = await db.pets.find_one_and_update(
+        {"_id": pet_oid, "username": {"$ne": adoption_app.username}},
+        {"$inc": {"pending_applications": 1}},
+        projection={"pet_name": 1},
+    )
+    if not pet:
+        if await db.pets.find_one({"_id": pet_oid}, {"_id": 1}):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="You cannot adopt your own pet")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pet not found")
 
-    db.adoption_applications.insert_one(adoption_app.dict(exclude_unset=True))
-    return {"message": f"Adoption application for {pet['pet_name']} submitted successfully"}
\ No newline at end of file
+    application = adoption_app.dict(exclude_unset=True, exclude={"proof_of_identity_photo"})
+    application.update(pet_id=pet_oid, status="pending", submitted_at=datetime.utcnow())
+    try:
+        application["proof_of_identity_photo_id"] = photo_id or await store_photo(adoption_app.proof_of_identity_photo)
+        await db.adoption_applications.insert_one(application)
+    except Exception as e:
+        # The unique (pet_id, username) index rejects a second application; either way the count is given back
+        await db.pets.update_one({"_id": pet_oid}, {"$inc": {"pending_applications": -1}})
+        if isinstance(e, DuplicateKeyError):
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"You have already applied to adopt {pet['pet_name']}")
+        raise
+    return {"message": f"Adoption application for {pet['pet_name']} submitted successfully", "application_id": str(application["_id"])}
\ No newline at end of file
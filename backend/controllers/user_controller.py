@@ -14,7 +14,7 @@ DATE WRITTEN:
     May 8, 2024
 
 DATE REVISED:
-    January 25, 2025
+    October 18, 2026
 
 PURPOSE:
     The purpose of user_controller.py is to manage user actions, such as creating accounts, authenticating 
@@ -22,91 +22,161 @@ PURPOSE:
     storage and retrieval from the database, providing smooth user interaction.
 
 DATA STRUCTURES, ALGORITHMS, AND CONTROL:
-    The program uses bcrypt for secure password hashing and pymongo for MongoDB queries to manage user data. 
-    It employs FastAPI's asynchronous patterns for efficient operations, handling errors with proper HTTP 
-    messages and validating data before processing.
+    The program uses bcrypt for secure password hashing and the asynchronous motor driver for MongoDB queries 
+    to manage user data. Every query is awaited and bcrypt runs on the bounded hashing pool from 
+    config/passwords.py, so neither database round trips nor password hashing block the event loop. Profile 
+    photos are written to the media store and user documents only keep the hash of the photo. The post feed is 
+    read newest first, one keyset page at a time, with each post joined to its author by a single $lookup 
+    aggregation instead of one user query per post. The NDJSON export mode yields posts from the same 
+    aggregation as the cursor delivers them. A successful login issues signed session tokens, and posts made 
+    with a valid access token skip the users lookup. Profile reads go through a read-through cache that is 
+    invalidated on registration and on profile updates. Each new post is also written to the materialized feed 
+    with its author's display fields, and profile updates copy changed display fields into the author's feed 
+    entries. New posts are also published to the event bus for the /events stream once their feed entry is 
+    written; a post whose author or feed entry could not be written is logged and not published. The post 
+    lists declare READ_SECONDARY and may trail the primary by the configured staleness bound, while logins and 
+    the profile cache read the primary so users always see their own writes. It handles errors with proper 
+    HTTP messages and validates data before processing.
 """
 
 from fastapi import HTTPException, status
 from bson import ObjectId
-from passlib.context import CryptContext
+from pymongo.errors import DuplicateKeyError
 from models.user_model import UserPost
-from config.db import get_database
+from config.db import READ_SECONDARY, get_database
+from config.media import store_photo
+from config.passwords import hash_password, verify_password
+from config.auth import CurrentUser, ensure_same_user, issue_tokens
+from config.events import event_bus
+from config.cache import user_profile_cache
+from controllers.feed_controller import add_feed_entry, feed_entry, feed_summary, refresh_feed_author
+from utils.pagination import page_limit, keyset_query, split_page
+from utils.streaming import STREAM_BATCH_SIZE
 from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+import logging
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger(__name__)
 
-def hash_password(password: str) -> str:
-    # Hashes the user's password using bcrypt
-    return pwd_context.hash(password)
+USER_PROFILE_FIELDS = {
+    "_id": 0, "birthday": 1, "firstname": 1, "lastname": 1, "email": 1, "mobilenum": 1, "address": 1,
+    "pet_knowledge": 1, "stable_living": 1, "flex_time_sched": 1, "environment": 1, "profile_photo_id": 1,
+}
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    # Verifies if the plain password matches the hashed password
-    return pwd_context.verify(plain_password, hashed_password)
+async def load_user_profile(username: str):
+    # Fetches the profile fields of a user through the profile cache, refilled from the primary so it never caches a stale profile
+    db = get_database()
+    return await user_profile_cache.get_or_load(username, lambda: db.users.find_one({"username": username}, USER_PROFILE_FIELDS))
 
-async def register_user(user: UserPost):
+async def register_user(user: UserPost, photo_id: Optional[str] = None):
     # Registers a new user by inserting their data into the database
-    user.password = hash_password(user.password)
+    user.password = await hash_password(user.password)
     db = get_database()
-    db.users.insert_one(user.dict(exclude_unset=True))
-    return user
+    document = user.dict(exclude_unset=True, exclude={"profile_photo"})
+    document["profile_photo_id"] = photo_id or await store_photo(user.profile_photo)
+    try:
+        await db.users.insert_one(dict(document))
+    except DuplicateKeyError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Username already exists")
+    await user_profile_cache.invalidate(user.username)
+    return document
 
 async def get_user_by_id(user_id: str):
     # Fetches a user by their ID
     db = get_database()
-    user = db.users.find_one({"_id": ObjectId(user_id)})
+    user = await db.users.find_one({"_id": ObjectId(user_id)})
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return user
 
-async def post_user_post_action(user_post: UserPost):
+async def post_user_post_action(user_post: UserPost, current_user: Optional[CurrentUser] = None):
     # Creates a post for a specific user
     db = get_database()
     username = user_post.username
     post_content = user_post.sharedpost
     date_posted = user_post.date_posted
     
-    user = db.users.find_one({"username": username})
-    if not user:
+    if current_user:
+        ensure_same_user(current_user, username)
+    elif not await db.users.find_one({"username": username}, {"_id": 1}):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    post = {"username": username, "post_content": post_content, "date_posted": date_posted}
     try:
-        result = db.posts.insert_one({"username": username, "post_content": post_content, "date_posted": date_posted})
-        return result.inserted_id
+        result = await db.posts.insert_one(post)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Error creating post: {str(e)}")
-
-async def fetch_all_posts():
-    # Fetches all posts from the database
-    db = get_database()
-    posts = db.posts.find()
-    all_posts = []
-
-    for post in posts:
-        user = db.users.find_one({"username": post["username"]})
-        if user:
-            all_posts.append({
-                "username": post["username"],
-                "post_id": str(post["_id"]),
-                "post_content": post["post_content"],
-                "date_posted": post["date_posted"],
-                "profile_photo": user.get("profile_photo"), 
-            })
-    
-    return all_posts
+    try:
+        author = await load_user_profile(username)
+        await add_feed_entry(post, author)
+    except Exception:
+        # The post is saved; scripts/rebuild_feed.py restores any entry that failed here
+        logger.exception("Could not add post %s to the feed", result.inserted_id)
+    else:
+        # Announced only with its author, so listeners never show a post without a name
+        await event_bus.publish("post", feed_summary(feed_entry(post, author)))
+    return result.inserted_id
+
+def post_feed_pipeline(after: Optional[str], limit: Optional[int] = None) -> List[dict]:
+    # Builds the newest-first feed aggregation that joins each post to its author
+    pipeline = [
+        {"$match": keyset_query({}, after)},
+        {"$sort": {"_id": -1}},
+        {"$lookup": {"from": "users", "localField": "username", "foreignField": "username", "as": "author"}},
+        {"$unwind": "$author"},
+    ]
+    if limit is not None:
+        pipeline.append({"$limit": limit})
+    pipeline.append({"$project": {
+        "username": 1,
+        "post_content": 1,
+        "date_posted": 1,
+        "profile_photo_id": "$author.profile_photo_id",
+    }})
+    return pipeline
+
+def post_summary(post: dict) -> dict:
+    # Shapes a joined post for feed responses
+    return {
+        "username": post["username"],
+        "post_id": str(post["_id"]),
+        "post_content": post["post_content"],
+        "date_posted": post["date_posted"],
+        "profile_photo_id": post.get("profile_photo_id"),
+    }
+
+async def fetch_all_posts(after: Optional[str] = None, limit: Optional[int] = None) -> Tuple[List[dict], Optional[str]]:
+    # Fetches one newest-first page of posts with their authors in a single aggregation
+    db = get_database(READ_SECONDARY)
+    limit = page_limit(limit)
+    posts = await db.posts.aggregate(post_feed_pipeline(after, limit + 1)).to_list(length=limit + 1)
+    posts, next_cursor = split_page(posts, limit)
+    all_posts = [post_summary(post) for post in posts]
+
+    return all_posts, next_cursor
+
+def stream_all_posts(after: Optional[str] = None) -> AsyncIterator[dict]:
+    # Opens a newest-first feed cursor for the NDJSON export mode; the cursor is checked before streaming starts
+    db = get_database(READ_SECONDARY)
+    cursor = db.posts.aggregate(post_feed_pipeline(after), batchSize=STREAM_BATCH_SIZE)
+    return (post_summary(post) async for post in cursor)
 
 async def verify_user(username: str, password: str):
-    # Verifies if the user's credentials are valid
+    # Verifies if the user's credentials are valid, on the primary so a login right after registering finds the user
     db = get_database()
-    user = db.users.find_one({"username": username})
-    if not user or not verify_password(password, user["password"]):
+    user = await db.users.find_one({"username": username}, {"username": 1, "password": 1})
+    if not user or not await verify_password(password, user["password"]):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid username or password")
-    return True
+    return user
+
+async def login_user(username: str, password: str):
+    # Verifies the user's credentials and issues a session token pair
+    user = await verify_user(username, password)
+    return issue_tokens(str(user["_id"]), user["username"])
 
 async def get_user_by_username(username: str):
     # Fetches a user by their username
-    db = get_database()
     print(f"Searching for user with username: {username}")
-    user = db.users.find_one({"username": username})
+    user = await load_user_profile(username)
     if user:
         return {
             "bdate": user.get("birthday"),
@@ -117,8 +187,7 @@ async def get_user_by_username(username: str):
 
 async def get_user_details_by_username(username: str):
     # Fetches detailed user information by their username
-    db = get_database()
-    user = db.users.find_one({"username": username})
+    user = await load_user_profile(username)
     if user:
         return {
             "birthday": user.get("birthday"),
@@ -131,14 +200,19 @@ async def get_user_details_by_username(username: str):
             "stable_living": user.get("stable_living"),
             "flex_time_sched": user.get("flex_time_sched"),
             "environment": user.get("environment"),
-            "profile_photo":user.get("profile_photo"),
+            "profile_photo_id": user.get("profile_photo_id"),
         }
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     
 async def update_user_details_by_username(username: str, new_details: dict):
     # Updates the user's details by their username
     db = get_database()
-    result = db.users.update_one({"username": username}, {"$set": new_details})
+    profile_photo = new_details.pop("profile_photo", None)
+    if profile_photo:
+        new_details["profile_photo_id"] = await store_photo(profile_photo.encode())
+    result = await db.users.update_one({"username": username}, {"$set": new_details})
+    await user_profile_cache.invalidate(username)
     if result.modified_count == 1:
+        await refresh_feed_author(username, new_details)
         return {"message": "User details updated successfully"}
     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Failed to update user details")
\ No newline at end of file
@@ -13,7 +13,7 @@ DATE WRITTEN:
     May 8, 2024
 
 DATE REVISED:
-    January 25, 2025
+    October 18, 2026
 
 PURPOSE:
     The main.py file's purpose is to set up and run the FastAPI web application, allowing the server to handle 
@@ -21,25 +21,134 @@ PURPOSE:
 
 DATA STRUCTURES, ALGORITHMS, AND CONTROL:
     The program uses FastAPI to structure the application into modular components with routers for user and 
-    pet management. It handles environment variables for server port settings and uses uvicorn to run the server, 
-    which responds to API requests.
+    pet management, plus a media router that serves stored photos and a batch router that runs several of 
+    those reads in one request. An events router pushes new pets and posts to connected clients. A lifespan 
+    hook opens the MongoDB connection pool, creates the declared indexes and starts the thumbnail workers and 
+    the event bus when the server starts, and stops them and closes the pool on shutdown. A middleware from 
+    metrics.py times every request for the /metrics endpoint. It handles environment variables for server port 
+    settings and uses uvicorn to run the server, which responds to API requests. It starts --workers or 
+    WEB_CONCURRENCY worker processes without reload. When neither is given it starts one per CPU if 
+    AUTH_SECRET_KEY is set and CACHE_BACKEND and EVENTS_BACKEND are "redis", and one worker with a notice 
+    otherwise, because tokens, cache invalidation and event ids must be shared between the workers. Asking for 
+    more than one worker without that shared state is refused. Each worker opens its own MongoDB pool in the 
+    lifespan after it is forked. On shutdown, open /events streams are ended as soon as the exit signal 
+    arrives, then uvicorn stops accepting connections and waits up to GRACEFUL_SHUTDOWN_SECONDS for in-flight 
+    requests before the pool is closed. --reload keeps the single-process development mode. /health/live and 
+    /health/ready ping the database for the supervisor.
+
+USAGE:
+    cd backend && python main.py                # one worker, or one per CPU once the shared state below is set
+    cd backend && python main.py --reload       # development: one process, reloads on change
+    export AUTH_SECRET_KEY=... CACHE_BACKEND=redis EVENTS_BACKEND=redis
+    cd backend && python main.py                # production: one worker per CPU
+    cd backend && python main.py --workers 4    # production: four workers
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from routes.user_router import router as user_router
 from routes.pet_router import router as pet_router
+from routes.media_router import router as media_router
+from routes.metrics_router import router as metrics_router
+from routes.health_router import router as health_router
+from routes.batch_router import router as batch_router
+from routes.events_router import router as events_router
+from config.db import connect_to_database, close_database_connection
+from config.events import event_bus
+from config.indexes import ensure_indexes
+from config.metrics import metrics_middleware
+from config.passwords import shutdown_password_pool
+from config.thumbnails import start_thumbnail_workers, stop_thumbnail_workers
+import asyncio
 import os
+import signal
+import threading
+
+def end_streams_on_exit_signal():
+    # Chains onto the server's SIGINT and SIGTERM handlers so open /events streams end as soon as shutdown
+    # starts, instead of holding up uvicorn's wait for in-flight requests
+    if threading.current_thread() is not threading.main_thread():
+        return
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        previous = signal.getsignal(sig)
+        if not callable(previous):
+            continue
+
+        def handler(signum, frame, previous=previous):
+            loop.call_soon_threadsafe(event_bus.close_subscribers)
+            previous(signum, frame)
+
+        signal.signal(sig, handler)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Opens the database connection pool, ensures indexes and starts the thumbnail workers and the event bus on
+    # startup, and stops them and closes the pool on shutdown
+    connect_to_database()
+    await ensure_indexes()
+    start_thumbnail_workers()
+    await event_bus.start()
+    end_streams_on_exit_signal()
+    yield
+    await event_bus.stop()
+    await stop_thumbnail_workers()
+    close_database_connection()
+    shutdown_password_pool()
+
+app = FastAPI(lifespan=lifespan)
 
-app = FastAPI()
+app.middleware("http")(metrics_middleware)
 
-# Including routers for user and pet functionalities
+# Including routers for user, pet and media functionalities, the batch and event endpoints, and the metrics and health endpoints
 app.include_router(user_router)
 app.include_router(pet_router)
+app.include_router(media_router)
+app.include_router(batch_router)
+app.include_router(events_router)
+app.include_router(metrics_router)
+app.include_router(health_router)
+
+def multi_worker_problems() -> list:
+    # Lists the per-process defaults that break when requests are spread over several workers
+    from config.cache import CACHE_BACKEND
+    from config.events import EVENTS_BACKEND
+
+    problems = []
+    if not os.getenv("AUTH_SECRET_KEY"):
+        problems.append("AUTH_SECRET_KEY is not set, so each worker would sign tokens with its own random key")
+    if CACHE_BACKEND != "redis":
+        problems.append("CACHE_BACKEND is not redis, so a profile update would only clear the cache of one worker")
+    if EVENTS_BACKEND != "redis":
+        problems.append("EVENTS_BACKEND is not redis, so event ids and Last-Event-ID replay would differ per worker")
+    return problems
 
 if __name__ == "__main__":
+    import argparse
     import uvicorn
-    
+
+    parser = argparse.ArgumentParser(description="Run the FurEver Pals API server")
+    parser.add_argument("--reload", action="store_true", help="Development mode: one process that restarts on code changes")
+    parser.add_argument("--workers", type=int, help="Worker processes; defaults to WEB_CONCURRENCY, else one per CPU when shared state is set up")
+    args = parser.parse_args()
+
     port = int(os.getenv("PORT", 8000))  # Default to port 8000
-    
-    print(f"Server is running on port {port}")
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
\ No newline at end of file
+    graceful_timeout = int(os.getenv("GRACEFUL_SHUTDOWN_SECONDS", 30))
+
+    problems = [] if args.reload else multi_worker_problems()
+    if args.workers is None and os.getenv("WEB_CONCURRENCY"):
+        args.workers = int(os.getenv("WEB_CONCURRENCY"))
+    if args.workers is None:
+        # Nothing asked for a worker count, so one per CPU only when the workers can share state
+        args.workers = 1 if problems else os.cpu_count() or 1
+        if problems and (os.cpu_count() or 1) > 1:
+            print("Running one worker because " + "; ".join(problems) + ". Set these up to use one worker per CPU.")
+    elif args.workers > 1 and problems:
+        parser.error(f"{args.workers} workers need shared state, but " + "; ".join(problems) + ". Fix these or run with --workers 1.")
+
+    if args.reload:
+        print(f"Server is running on port {port} in development mode")
+        uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
+    else:
+        print(f"Server is running on port {port} with {args.workers} worker(s)")
+        uvicorn.run("main:app", host="0.0.0.0", port=port, workers=args.workers, timeout_graceful_shutdown=graceful_timeout)
@@ -0,0 +1,39 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - batch_model.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The batch_model.py file defines the request body of the /batch endpoint, which lets the mobile app load
+    everything a screen needs in one round trip. It is used by batch_router.py and batch_controller.py.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of batch_model.py is to validate a batch before any of it runs: every sub-request must be a GET
+    on an absolute path, and a batch may hold at most MAX_BATCH_REQUESTS of them.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program uses Pydantic models. SubRequest holds an optional caller-chosen id, the method and the path
+    with its query string. BatchRequest holds the list of sub-requests, bounded in length.
+"""
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+import os
+
+MAX_BATCH_REQUESTS = int(os.getenv("MAX_BATCH_REQUESTS", 20))
+
+class SubRequest(BaseModel):
+    id: Optional[str] = Field(None, max_length=100)
+    method: str = Field("GET", pattern='^GET$')
+    path: str = Field(..., min_length=1, max_length=2000, pattern='^/')
+
+class BatchRequest(BaseModel):
+    requests: List[SubRequest] = Field(..., min_length=1, max_length=MAX_BATCH_REQUESTS)
@@ -14,7 +14,7 @@ DATE WRITTEN:
     May 8, 2024
 
 DATE REVISED:
-    January 25, 2025
+    October 18, 2026
 
 PURPOSE:
     The purpose of pet_model.py is to define the data structures for pet details and adoption applications, 
@@ -24,11 +24,15 @@ PURPOSE:
 DATA STRUCTURES, ALGORITHMS, AND CONTROL:
     The program uses Pydantic to define schemas for pet data and adoption applications, with validation rules 
     for fields like pet name, age, and sex. It also validates adoption details such as personal information, 
-    pet care plans, and identity documents, ensuring only correctly formatted data is processed.
+    pet care plans, and identity documents, ensuring only correctly formatted data is processed. A pet may 
+    also carry the latitude and longitude of its location, which are stored as a GeoJSON point for radius 
+    search. PetRecord is the read-side shape of a stored pet, where the photo is replaced by the hash of its 
+    blob in the media store, and which carries the pet's count of pending applications. 
+    ApplicationStatusUpdate is the owner's decision on one application.
 """
 
 from pydantic import BaseModel, Field, validator
-from typing import Optional
+from typing import Literal, Optional
 
 class Pet(BaseModel):
     pet_name: str = Field(..., min_length=1, max_length=100)
@@ -38,6 +42,8 @@ class Pet(BaseModel):
     description: Optional[str] = Field(None)
     pet_photo: bytes = Field(...)
     username: str = Field(..., min_length=1)
+    latitude: Optional[float] = Field(None, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, ge=-180, le=180)
 
     @validator('pet_photo')
     def validate_pet_photo(cls, v):
@@ -46,6 +52,17 @@ class Pet(BaseModel):
             raise ValueError("Pet photo must be provided")
         return v
     
+class PetRecord(BaseModel):
+    id: Optional[str] = None
+    pet_name: str
+    pet_age: Optional[int] = None
+    sex: Optional[str] = None
+    location: str
+    description: Optional[str] = None
+    pet_photo_id: Optional[str] = None
+    username: str
+    pending_applications: int = 0
+
 class AdoptionApplication(BaseModel):
     username: str = Field(..., min_length=1, max_length=100)
     name: str = Field(..., min_length=1, max_length=100)
@@ -62,4 +79,8 @@ class AdoptionApplication(BaseModel):
         # Ensure that proof of identity photo is provided
         if not v:
             raise ValueError("Proof of identity photo must be provided")
-        return v
\ No newline at end of file
+        return v
+
+
+class ApplicationStatusUpdate(BaseModel):
+    status: Literal["pending", "approved", "rejected"]
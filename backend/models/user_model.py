@@ -14,7 +14,7 @@ DATE WRITTEN:
     May 8, 2024
 
 DATE REVISED:
-    January 25, 2025
+    October 18, 2026
 
 PURPOSE:
     The purpose of user_model.py is to define the structure of user data, including account registration, 
@@ -23,8 +23,10 @@ PURPOSE:
 
 DATA STRUCTURES, ALGORITHMS, AND CONTROL:
     The program uses the Pydantic library to define structured models for user data, such as User, LoginModel, 
-    and UserPost, with validation checks for fields like username, email, and password. The control flow 
-    ensures that data is validated and cleaned automatically before being used in the application.
+    RefreshModel, and UserPost, with validation checks for fields like username, email, and password. The 
+    control flow ensures that data is validated and cleaned automatically before being used in the 
+    application. UserSummary and UserDetails are the read-side shapes of the profile routes and are used for 
+    the API schema only; the routes return them already shaped instead of revalidating them.
 """
 
 from pydantic import BaseModel, EmailStr, validator, Field
@@ -58,7 +60,28 @@ class LoginModel(BaseModel):
     username: str
     password: str
 
+class RefreshModel(BaseModel):
+    refresh_token: str
+
 class UserPost(BaseModel):
     username: str
     sharedpost: str
-    date_posted: datetime
\ No newline at end of file
+    date_posted: datetime
+
+class UserSummary(BaseModel):
+    bdate: Optional[datetime] = None
+    email: Optional[str] = None
+    address: Optional[str] = None
+
+class UserDetails(BaseModel):
+    birthday: Optional[datetime] = None
+    firstname: Optional[str] = None
+    lastname: Optional[str] = None
+    email: Optional[str] = None
+    mobilenum: Optional[str] = None
+    address: Optional[str] = None
+    pet_knowledge: Optional[int] = None
+    stable_living: Optional[int] = None
+    flex_time_sched: Optional[int] = None
+    environment: Optional[int] = None
+    profile_photo_id: Optional[str] = None
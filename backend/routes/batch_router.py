@@ -0,0 +1,39 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - batch_router.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The batch_router.py file is part of the API layer in the FurEver Pals system. It exposes the /batch endpoint
+    the mobile app uses to load a whole screen, such as a pet detail page, in one request.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+   The purpose of batch_router.py is to accept a list of read requests against the user and pet routes and to
+   return all of their results together, cutting the round trips a screen makes over a slow mobile link.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The file uses FastAPI's APIRouter to define the route, which validates the body with the BatchRequest model
+    and runs it through batch_controller.py. The combined result goes through conditional_json_response, so it
+    carries an ETag and is compressed when large, like the other polled responses.
+"""
+
+from fastapi import APIRouter, Request
+from models.batch_model import BatchRequest
+from controllers.batch_controller import run_batch
+from utils.responses import conditional_json_response
+
+# Initialize router
+router = APIRouter()
+
+@router.post("/batch")
+async def batch_endpoint(batch: BatchRequest, request: Request):
+    # Run several GET requests against the user and pet routes in one round trip
+    return conditional_json_response(request, {"responses": await run_batch(request, batch)})
@@ -0,0 +1,70 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - events_router.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The events_router.py file is part of the API layer in the FurEver Pals system. The mobile app keeps one
+    connection open to it and receives the change events published by the pet and user controllers.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+   The purpose of events_router.py is to push new pets and posts to the app as server-sent events, so screens
+   can add them to the lists they already hold instead of polling /all-pets and /all-user-posts.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The file uses FastAPI's APIRouter to define GET /events, a StreamingResponse in the text/event-stream
+    format fed by the event bus from events.py. Each message carries the event id, its type ("pet", "post" or
+    "pets-imported") and a compact JSON body. The optional types parameter limits the stream to some event
+    types. A client that reconnects sends the last id it saw in the Last-Event-ID header, or in the
+    last_event_id parameter, and first receives the events it missed. When those are no longer kept, or when
+    the client falls too far behind, it receives a "reset" event and should reload its lists once. A comment
+    line is sent whenever the stream has been idle for EVENT_HEARTBEAT_SECONDS, so proxies keep the
+    connection open.
+"""
+
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Optional
+from config.events import Event, event_bus
+from utils.responses import serialize
+
+# Initialize router
+router = APIRouter()
+
+RETRY_MILLISECONDS = 3000
+
+def sse_message(event: Event) -> bytes:
+    # Formats one event in the server-sent events wire format
+    lines = [f"id: {event.id}".encode()] if event.id else []
+    lines.append(f"event: {event.type}".encode())
+    lines.append(b"data: " + serialize(event.data))
+    return b"\n".join(lines) + b"\n\n"
+
+async def sse_stream(last_event_id: Optional[str], types: Optional[set]) -> AsyncIterator[bytes]:
+    # Streams the bus to one client until it disconnects or is reset
+    yield f"retry: {RETRY_MILLISECONDS}\n\n".encode()
+    async for event in event_bus.listen(last_event_id):
+        if event is None:
+            yield b": keepalive\n\n"
+        elif types is None or event.type in types or event.type == "reset":
+            yield sse_message(event)
+
+@router.get("/events")
+async def events_endpoint(
+    types: Optional[str] = Query(None, description="Comma-separated event types, e.g. pet,post"),
+    last_event_id: Optional[str] = Query(None),
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    # Open a server-sent event stream of new pets and posts
+    wanted = {name.strip() for name in types.split(",") if name.strip()} if types else None
+    resume_from = last_event_id_header or last_event_id
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return StreamingResponse(sse_stream(resume_from, wanted), media_type="text/event-stream", headers=headers)
@@ -0,0 +1,48 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - health_router.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The health_router.py file is part of the API layer in the FurEver Pals system. It is called by the process
+    supervisor or load balancer in front of the server workers rather than by the mobile app.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+   The purpose of health_router.py is to tell a supervisor whether a worker process is alive and whether it is
+   ready to take traffic, so that workers are only sent requests once they can reach MongoDB.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The file uses FastAPI's APIRouter to define two routes, both of which ping the database through
+    ping_database(). /health/live always answers 200 while the worker can serve HTTP and reports the database
+    state in the body, so a database outage does not get every worker restarted. /health/ready answers 503
+    when the ping fails, so the worker is taken out of rotation until MongoDB is reachable again. Both routes
+    are left out of the OpenAPI schema.
+"""
+
+from fastapi import APIRouter, status
+from config.db import ping_database
+from utils.responses import json_response
+
+# Initialize router
+router = APIRouter()
+
+@router.get("/health/live", include_in_schema=False)
+async def liveness_endpoint():
+    # Report that the worker is running, with the database state for information
+    database = "ok" if await ping_database() else "unreachable"
+    return json_response({"status": "ok", "database": database})
+
+@router.get("/health/ready", include_in_schema=False)
+async def readiness_endpoint():
+    # Report whether the worker can reach the database and should receive traffic
+    if await ping_database():
+        return json_response({"status": "ready", "database": "ok"})
+    return json_response({"status": "unavailable", "database": "unreachable"}, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -0,0 +1,37 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - media_router.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The media_router.py file is part of the API layer in the FurEver Pals system. It exposes the endpoint the
+    mobile app uses to download pet, profile and identity photos referenced by pet and user records.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+   The purpose of media_router.py is to let clients fetch a photo by the content hash stored in the documents,
+   so list and detail endpoints can return small references instead of the photo bytes themselves.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The file uses FastAPI's APIRouter to define the route, which passes the hash, the optional ?w= width hint
+    and the If-None-Match header to media_controller.py and returns its streaming response.
+"""
+
+from fastapi import APIRouter, Header, Query
+from typing import Optional
+from controllers.media_controller import stream_media
+
+# Initialize router
+router = APIRouter()
+
+@router.get("/media/{digest}")
+async def get_media_endpoint(digest: str, w: Optional[int] = Query(None, ge=1, le=4096), if_none_match: Optional[str] = Header(None)):
+    # Stream a stored photo by its content hash, resized to about w pixels wide when a variant exists
+    return await stream_media(digest, if_none_match, w)
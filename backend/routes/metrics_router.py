@@ -0,0 +1,38 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - metrics_router.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The metrics_router.py file is part of the API layer in the FurEver Pals system. It is scraped by a
+    Prometheus server rather than called by the mobile app.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+   The purpose of metrics_router.py is to expose the request, MongoDB command and cache metrics collected by
+   metrics.py, so slow endpoints can be broken down into database time and everything else.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The file uses FastAPI's APIRouter to define the route, which returns the output of render_metrics() as
+    plain text in the Prometheus exposition format. The route is left out of the OpenAPI schema. Metrics are
+    kept per process, so with several workers each scrape reports the worker that answered it.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from config.metrics import render_metrics
+
+# Initialize router
+router = APIRouter()
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    # Serve every collected metric in the Prometheus text format
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
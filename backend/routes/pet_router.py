@@ -14,7 +14,7 @@ DATE WRITTEN:
     May 8, 2024
 
 DATE REVISED:
-    January 25, 2025
+    October 18, 2026
 
 PURPOSE:
    The purpose of pet_router.py is to handle all pet-related API requests, such as adding new pets, retrieving 
@@ -23,63 +23,175 @@ PURPOSE:
 
 DATA STRUCTURES, ALGORITHMS, AND CONTROL:
     The file uses FastAPI's APIRouter to define modular routes, which are linked to controller functions in 
-    pet_controller.py. It employs Pydantic models like Pet and AdoptionApplication for data formatting, and 
-    handles exceptions with HTTPException to ensure correct responses and maintain data integrity.
+    pet_controller.py. It employs Pydantic models like Pet and AdoptionApplication for incoming data and 
+    PetRecord for stored pets, whose photos are referenced by media hash. List routes accept `after`, `limit` 
+    and `fields` query parameters and return the next page cursor in the X-Next-Cursor header. Adding a pet 
+    and applying for one accept an optional bearer token. List responses carry an ETag, answer 304 Not 
+    Modified when it matches If-None-Match, and are compressed when large. With ?stream=1 or Accept: 
+    application/x-ndjson the list routes stream every matching pet as NDJSON instead of one page. /pets/search 
+    is declared before /pets/{pet_id} so the literal path is matched first. /pets/{pet_id}/applications 
+    requires the pet owner's access token and ranks applicants through adoption_controller.py, or with 
+    sort=newest pages them by `after` with the cursor in X-Next-Cursor; PATCH on one application sets its 
+    status. Applying twice for the same pet answers 409 Conflict. /add-pet/bulk reads an NDJSON batch of pets, 
+    either as the request body or as the "file" part of a multipart form read with the push parser of 
+    uploads.py, line by line as it arrives and within the NDJSON caps of streaming.py. Single-pet and 
+    applications responses are already shaped by the controllers and are returned through json_response(), 
+    skipping FastAPI's response_model revalidation. /add-pet/upload and /adopt-pet/{pet_id}/upload take the 
+    same fields as a multipart form and stream the photo part to the media store through uploads.py, within 
+    its size caps, and the photo is removed again when the pet or application is refused. JSON bodies are read 
+    within the same request cap through CappedBodyRoute. It handles exceptions with HTTPException to ensure 
+    correct responses and maintain data integrity.
 """
 
-from fastapi import APIRouter, HTTPException, status
-from typing import List
-from models.pet_model import Pet, AdoptionApplication
-from controllers.pet_controller import add_pet, get_pet, get_pets, get_all_pets, adopt_pet
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from typing import List, Optional
+from models.pet_model import Pet, PetRecord, AdoptionApplication, ApplicationStatusUpdate
+from config.auth import CurrentUser, get_current_user, get_optional_user
+from config.db import READ_SECONDARY
+from controllers.pet_controller import add_pet, get_pet, get_pets, get_all_pets, adopt_pet, stream_pets, search_pets, bulk_add_pets
+from controllers.adoption_controller import get_ranked_applications, update_application_status
+from utils.pagination import DEFAULT_PAGE_SIZE, NEXT_CURSOR_HEADER
+from utils.responses import conditional_json_response, json_response
+from utils.streaming import MAX_NDJSON_BYTES, wants_ndjson, ndjson_response, ndjson_lines
+from utils.uploads import CappedBodyRoute, check_declared_length, multipart_file_chunks, multipart_upload, validate_upload_form
 
 # Initialize router
-router = APIRouter()
+router = APIRouter(route_class=CappedBodyRoute)
 
-@router.post("/add-pet", response_model=Pet)
-async def add_pet_endpoint(pet: Pet):
+@router.post("/add-pet", response_model=PetRecord)
+async def add_pet_endpoint(pet: Pet, current_user: Optional[CurrentUser] = Depends(get_optional_user)):
     # Add a new pet to the database
     try:
-        return await add_pet(pet)
+        return json_response(await add_pet(pet, current_user))
     except HTTPException as e:
         raise e
 
-@router.get("/pets/{pet_id}", response_model=Pet)
+@router.post("/add-pet/upload", response_model=PetRecord)
+async def add_pet_upload_endpoint(request: Request, current_user: Optional[CurrentUser] = Depends(get_optional_user)):
+    # Add a new pet from a multipart form whose "pet_photo" file part is streamed to the media store
+    try:
+        async with multipart_upload(request, {"pet_photo"}) as (fields, photos):
+            pet = validate_upload_form(Pet, fields, photos, "pet_photo")
+            return json_response(await add_pet(pet, current_user, photos["pet_photo"].digest))
+    except HTTPException as e:
+        raise e
+
+@router.post("/add-pet/bulk")
+async def bulk_add_pets_endpoint(request: Request, username: str = Query(..., min_length=1), current_user: Optional[CurrentUser] = Depends(get_optional_user)):
+    # Import many pets for one owner from an NDJSON body or an NDJSON file sent as multipart field "file"
+    try:
+        if request.headers.get("content-type", "").startswith("multipart/form-data"):
+            lines = ndjson_lines(multipart_file_chunks(request, "file", MAX_NDJSON_BYTES))
+        else:
+            check_declared_length(request, MAX_NDJSON_BYTES)
+            lines = ndjson_lines(request.stream())
+        return await bulk_add_pets(lines, username, current_user)
+    except HTTPException as e:
+        raise e
+
+@router.get("/pets/search", response_model=List[dict])
+async def search_pets_endpoint(
+    request: Request,
+    q: Optional[str] = Query(None, min_length=1, max_length=100),
+    location: Optional[str] = Query(None, min_length=1, max_length=100),
+    sex: Optional[str] = Query(None, pattern='^(Female|Male)$'),
+    min_age: Optional[int] = Query(None, ge=0),
+    max_age: Optional[int] = Query(None, ge=0),
+    latitude: Optional[float] = Query(None, ge=-90, le=90),
+    longitude: Optional[float] = Query(None, ge=-180, le=180),
+    radius_km: Optional[float] = Query(None, gt=0, le=500),
+    after: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1),
+    fields: Optional[str] = None,
+):
+    # Search pets by location prefix, sex, age range, text and distance
+    try:
+        pets, next_cursor = await search_pets(q, location, sex, min_age, max_age, latitude, longitude, radius_km, after, limit, fields)
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+        return conditional_json_response(request, pets, headers)
+    except HTTPException as e:
+        raise e
+
+@router.get("/pets/{pet_id}", response_model=PetRecord)
 async def get_pet_endpoint(pet_id: str):
     # Get a pet by its ID
     try:
         pet = await get_pet(pet_id)
         if not pet:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Pet not found")
-        return pet
+        return json_response(pet)
     except HTTPException as e:
         raise e
 
-@router.get("/user-pets/{username}", response_model=List[Pet])
-async def get_pets_endpoint(username: str):
-    # Get all pets associated with a user
+@router.get("/user-pets/{username}", response_model=List[dict])
+async def get_pets_endpoint(username: str, request: Request, after: Optional[str] = None, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1), fields: Optional[str] = None, stream: bool = False):
+    # Get one page of pets associated with a user, or all of them as NDJSON
     try:
-        pets = await get_pets(username)
-        if not pets:
+        if wants_ndjson(request, stream):
+            return ndjson_response(stream_pets({"username": username}, after, fields))
+        pets, next_cursor = await get_pets(username, after, limit, fields)
+        if not pets and not after:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No pets found for this user")
-        return pets
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+        return conditional_json_response(request, pets, headers)
     except HTTPException as e:
         raise e
 
 @router.get("/all-pets", response_model=List[dict])
-async def get_all_pets_endpoint():
-    # Get all pets in the database
+async def get_all_pets_endpoint(request: Request, after: Optional[str] = None, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1), fields: Optional[str] = None, stream: bool = False):
+    # Get one page of pets in the database, or all of them as NDJSON
     try:
-        pets = await get_all_pets()
-        if not pets:
+        if wants_ndjson(request, stream):
+            return ndjson_response(stream_pets({}, after, fields, READ_SECONDARY))
+        pets, next_cursor = await get_all_pets(after, limit, fields)
+        if not pets and not after:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No pets found")
-        return pets
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+        return conditional_json_response(request, pets, headers)
     except HTTPException as e:
         raise e
 
 @router.post("/adopt-pet/{pet_id}", status_code=status.HTTP_201_CREATED)
-async def adopt_pet_endpoint(pet_id: str, adoption_app: AdoptionApplication):
+async def adopt_pet_endpoint(pet_id: str, adoption_app: AdoptionApplication, current_user: Optional[CurrentUser] = Depends(get_optional_user)):
     # Adopt a pet by submitting an adoption application
     try:
-        return await adopt_pet(pet_id, adoption_app)
+        return await adopt_pet(pet_id, adoption_app, current_user)
     except HTTPException as e:
-        raise e
\ No newline at end of file
+        raise e
+
+@router.post("/adopt-pet/{pet_id}/upload", status_code=status.HTTP_201_CREATED)
+async def adopt_pet_upload_endpoint(pet_id: str, request: Request, current_user: Optional[CurrentUser] = Depends(get_optional_user)):
+    # Apply to adopt a pet from a multipart form whose "proof_of_identity_photo" file part is streamed to the media store
+    try:
+        async with multipart_upload(request, {"proof_of_identity_photo"}) as (fields, photos):
+            adoption_app = validate_upload_form(AdoptionApplication, fields, photos, "proof_of_identity_photo")
+            return await adopt_pet(pet_id, adoption_app, current_user, photos["proof_of_identity_photo"].digest)
+    except HTTPException as e:
+        raise e
+
+@router.get("/pets/{pet_id}/applications")
+async def get_pet_applications_endpoint(
+    pet_id: str,
+    sort: str = Query("score", pattern="^(score|newest)$"),
+    weights: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1),
+    after: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status", pattern="^(pending|approved|rejected)$"),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    # List the adoption applications for a pet, ranked by adopter fit or newest first; only the pet's owner may see them
+    try:
+        applications, next_cursor = await get_ranked_applications(pet_id, current_user, sort, weights, offset, limit, after, status_filter)
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+        return json_response(applications, headers=headers)
+    except HTTPException as e:
+        raise e
+
+@router.patch("/pets/{pet_id}/applications/{application_id}")
+async def update_application_status_endpoint(pet_id: str, application_id: str, update: ApplicationStatusUpdate, current_user: CurrentUser = Depends(get_current_user)):
+    # Approve, reject or reopen an application; only the pet's owner may decide it
+    try:
+        return await update_application_status(pet_id, application_id, update.status, current_user)
+    except HTTPException as e:
+        raise e
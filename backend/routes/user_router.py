@@ -14,7 +14,7 @@ DATE WRITTEN:
     May 8, 2024
 
 DATE REVISED:
-    January 25, 2025
+    October 18, 2026
 
 PURPOSE:
    The purpose of user_router.py is to provide API endpoints for user operations such as registration, login, 
@@ -24,49 +24,82 @@ PURPOSE:
 DATA STRUCTURES, ALGORITHMS, AND CONTROL:
     The file uses FastAPI's APIRouter to define routes and manage request and response flow, relying on 
     controller functions from user_controller.py. It validates user input and handles errors with FastAPI's 
-    HTTPException, using Pydantic models to define data format and validation rules for user data.
+    HTTPException, using Pydantic models to define data format and validation rules for user data. The post 
+    feed is paginated with `after` and `limit`, returning the next page cursor in the X-Next-Cursor header. 
+    Login returns an access and refresh token pair, /refresh exchanges a refresh token for a new pair, and the 
+    post route accepts an optional bearer token. The feed response carries an ETag, answers 304 Not Modified 
+    when it matches If-None-Match, and is compressed when large. With ?stream=1 or Accept: 
+    application/x-ndjson it streams every post as NDJSON instead of one page. The profile routes return their 
+    read-side shapes through json_response(), so FastAPI does not revalidate them against the response model. 
+    /register/upload takes the registration fields as a multipart form and streams the profile photo part to 
+    the media store through uploads.py, which removes the photo again when the registration is refused. JSON 
+    bodies, including the inline photos of /register, are read within the upload cap through CappedBodyRoute. 
+    /feed reads the materialized feed from feed_controller.py, one keyset page at a time, with each post's 
+    author names and photo already copied in. /users/{username}/applications pages the user's own adoption 
+    applications, with their status, and requires that user's access token.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from models.user_model import User, LoginModel, UserPost
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from typing import Optional
+from models.user_model import User, LoginModel, RefreshModel, UserPost, UserSummary, UserDetails
+from config.auth import CurrentUser, get_current_user, get_optional_user, refresh_tokens
 from controllers.user_controller import (
-    register_user, get_user_by_id, verify_user, 
+    register_user, get_user_by_id, login_user, 
     get_user_by_username, get_user_details_by_username, 
     update_user_details_by_username, post_user_post_action, 
-    fetch_all_posts
+    fetch_all_posts, stream_all_posts
 )
+from controllers.feed_controller import get_feed
+from controllers.adoption_controller import get_user_applications
+from utils.pagination import DEFAULT_PAGE_SIZE, NEXT_CURSOR_HEADER
+from utils.responses import conditional_json_response, json_response
+from utils.streaming import wants_ndjson, ndjson_response
+from utils.uploads import CappedBodyRoute, multipart_upload, validate_upload_form
 
 # Initialize router
-router = APIRouter()
+router = APIRouter(route_class=CappedBodyRoute)
 
 @router.post("/register")
 async def register_endpoint(user: User):
     # Register a new user
     return await register_user(user)
 
-@router.get("/users/{username}")
+@router.post("/register/upload")
+async def register_upload_endpoint(request: Request):
+    # Register a new user from a multipart form whose "profile_photo" file part is streamed to the media store
+    async with multipart_upload(request, {"profile_photo"}) as (fields, photos):
+        user = validate_upload_form(User, fields, photos, "profile_photo")
+        return await register_user(user, photos["profile_photo"].digest)
+
+@router.get("/users/{username}", response_model=UserSummary)
 async def get_user_by_username_endpoint(username: str):
     # Get user information by username
     user = await get_user_by_username(username)
     if user:
-        return user
+        return json_response(user)
     else:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
 @router.post("/login")
 async def login_endpoint(user: LoginModel):
-    # User login endpoint to verify credentials
-    if await verify_user(user.username, user.password):
-        return {"message": "Login successful"}
+    # User login endpoint to verify credentials and issue session tokens
+    tokens = await login_user(user.username, user.password)
+    if tokens:
+        return {"message": "Login successful", **tokens}
     else:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
-@router.get("/user-details/{username}")
+@router.post("/refresh")
+async def refresh_endpoint(body: RefreshModel):
+    # Exchange a refresh token for a new token pair
+    return refresh_tokens(body.refresh_token)
+
+@router.get("/user-details/{username}", response_model=UserDetails)
 async def get_user_details_endpoint(username: str):
     # Fetch detailed user information by username
     user_details = await get_user_details_by_username(username)
     if user_details:
-        return user_details
+        return json_response(user_details)
     else:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User details not found")
 
@@ -77,19 +110,42 @@ async def update_user_details_endpoint(username: str, new_details: dict):
     return update_result
 
 @router.post("/user-posts/{username}")
-async def create_user_post_endpoint(username: str, user_post: UserPost):
+async def create_user_post_endpoint(username: str, user_post: UserPost, current_user: Optional[CurrentUser] = Depends(get_optional_user)):
     # Create a post for a specific user
-    post_id = await post_user_post_action(user_post)
+    post_id = await post_user_post_action(user_post, current_user)
     if post_id:
         return {"message": "Post created successfully", "post_id": str(post_id)}
     else:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Failed to create post for user '{username}'")
 
 @router.get("/all-user-posts")
-async def get_all_user_posts_endpoint():
-    # Fetch all posts from users
-    all_posts = await fetch_all_posts()
-    if all_posts:
-        return {"posts": all_posts}
+async def get_all_user_posts_endpoint(request: Request, after: Optional[str] = None, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1), stream: bool = False):
+    # Fetch one newest-first page of posts from users, or all of them as NDJSON
+    if wants_ndjson(request, stream):
+        return ndjson_response(stream_all_posts(after))
+    all_posts, next_cursor = await fetch_all_posts(after, limit)
+    if all_posts or after:
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+        return conditional_json_response(request, {"posts": all_posts}, headers)
     else:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No posts found")
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No posts found")
+
+@router.get("/feed")
+async def get_feed_endpoint(request: Request, after: Optional[str] = None, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1)):
+    # Fetch one newest-first page of the materialized feed
+    entries, next_cursor = await get_feed(after, limit)
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return conditional_json_response(request, {"posts": entries}, headers)
+
+@router.get("/users/{username}/applications")
+async def get_user_applications_endpoint(
+    username: str,
+    after: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1),
+    status_filter: Optional[str] = Query(None, alias="status", pattern="^(pending|approved|rejected)$"),
+    current_user: CurrentUser = Depends(get_current_user),
+):
+    # Fetch one newest-first page of the adoption applications a user has submitted; only that user may see them
+    applications, next_cursor = await get_user_applications(username, current_user, after, limit, status_filter)
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return json_response({"applications": applications}, headers=headers)
@@ -0,0 +1,73 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - build_thumbnails.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The build_thumbnails.py file is a maintenance command for the backend. It makes the resized photo variants
+    of thumbnails.py for photos that the background workers never processed.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of build_thumbnails.py is to backfill variants for photos stored before the pipeline existed,
+    and for photos that were skipped because the queue was full or the server stopped first. Running it again
+    is harmless because photos that already have a variants record are skipped.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program collects the distinct photo hashes referenced by users and pets with distinct(), then runs
+    process_photo() on them with at most --concurrency in flight, on the same image pool the server uses.
+
+USAGE:
+    cd backend && python -m scripts.build_thumbnails --concurrency 4
+"""
+
+import argparse
+import asyncio
+from config.db import connect_to_database, close_database_connection, get_database
+from config.thumbnails import Image, process_photo, stop_thumbnail_workers
+
+PHOTO_REFERENCE_FIELDS = [
+    ("users", "profile_photo_id"),
+    ("pets", "pet_photo_id"),
+]
+
+async def build_thumbnails(concurrency: int) -> int:
+    # Processes every referenced photo and returns how many were looked at
+    db = get_database()
+    digests = set()
+    for collection_name, field in PHOTO_REFERENCE_FIELDS:
+        digests.update(digest for digest in await db[collection_name].distinct(field) if digest)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def process(digest: str):
+        async with semaphore:
+            await process_photo(digest)
+
+    await asyncio.gather(*(process(digest) for digest in digests))
+    return len(digests)
+
+async def main():
+    parser = argparse.ArgumentParser(description="Make resized variants of stored photos that have none yet")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    if Image is None:
+        print("Pillow is not installed; nothing to do")
+        return
+    connect_to_database()
+    try:
+        processed = await build_thumbnails(args.concurrency)
+        print(f"thumbnails: checked {processed} photo(s)")
+    finally:
+        await stop_thumbnail_workers()
+        close_database_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
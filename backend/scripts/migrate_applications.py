@@ -0,0 +1,100 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - migrate_applications.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The migrate_applications.py file is a maintenance command for the backend. It brings the existing
+    adoption_applications and pets collections in line with what adoption_controller.py and pet_controller.py
+    now expect.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of migrate_applications.py is to give applications written before statuses existed a status
+    and a submission time, to remove repeated applications so the unique (pet_id, username) index can be
+    built, and to set every pet's pending_applications counter from the applications it actually has.
+    Running it again is harmless.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program sets status "pending" and a submitted_at taken from the ObjectId on applications that lack them,
+    with two pipeline updates. It groups the applications that have a pet_id by pet and applicant and deletes
+    all but the oldest of each group. Applications written before pet_id was stored cannot be told apart by pet,
+    so they are kept as they are. Then it runs ensure_indexes() to replace the old index with the unique one.
+    Last, it counts pending applications per pet in one aggregation, resets every counter and writes the counts
+    back in unordered batches. Counters can drift if applications arrive during the recount, so run it while
+    submissions are quiet.
+
+USAGE:
+    cd backend && python -m scripts.migrate_applications
+"""
+
+import argparse
+import asyncio
+from pymongo import UpdateOne
+from config.db import connect_to_database, close_database_connection, get_database
+from config.indexes import ensure_indexes
+
+async def backfill_fields() -> int:
+    # Gives older applications a pending status and a submission time
+    db = get_database()
+    statuses = await db.adoption_applications.update_many({"status": {"$exists": False}}, {"$set": {"status": "pending"}})
+    await db.adoption_applications.update_many({"submitted_at": {"$exists": False}}, [{"$set": {"submitted_at": {"$toDate": "$_id"}}}])
+    return statuses.modified_count
+
+async def remove_duplicates() -> int:
+    # Keeps the oldest application of each applicant for each pet and deletes the rest; applications without a pet_id are left alone
+    db = get_database()
+    pipeline = [
+        {"$match": {"pet_id": {"$exists": True}}},
+        {"$sort": {"_id": 1}},
+        {"$group": {"_id": {"pet_id": "$pet_id", "username": "$username"}, "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}},
+    ]
+    removed = 0
+    async for group in db.adoption_applications.aggregate(pipeline, allowDiskUse=True):
+        result = await db.adoption_applications.delete_many({"_id": {"$in": group["ids"][1:]}})
+        removed += result.deleted_count
+    return removed
+
+async def recount_pending(batch_size: int) -> int:
+    # Sets every pet's pending_applications counter from its pending applications
+    db = get_database()
+    await db.pets.update_many({}, {"$set": {"pending_applications": 0}})
+    pipeline = [
+        {"$match": {"status": "pending", "pet_id": {"$exists": True}}},
+        {"$group": {"_id": "$pet_id", "pending": {"$sum": 1}}},
+    ]
+    updated = 0
+    batch = []
+    async for group in db.adoption_applications.aggregate(pipeline):
+        batch.append(UpdateOne({"_id": group["_id"]}, {"$set": {"pending_applications": group["pending"]}}))
+        if len(batch) >= batch_size:
+            updated += (await db.pets.bulk_write(batch, ordered=False)).modified_count
+            batch = []
+    if batch:
+        updated += (await db.pets.bulk_write(batch, ordered=False)).modified_count
+    return updated
+
+async def main():
+    parser = argparse.ArgumentParser(description="Backfill application statuses, dedupe applications and recount pending applications")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    connect_to_database()
+    try:
+        print(f"adoption_applications: marked {await backfill_fields()} as pending")
+        print(f"adoption_applications: removed {await remove_duplicates()} duplicate(s)")
+        await ensure_indexes()
+        print(f"pets: set pending_applications on {await recount_pending(args.batch_size)} pet(s)")
+    finally:
+        close_database_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
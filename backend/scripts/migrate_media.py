@@ -0,0 +1,67 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - migrate_media.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The migrate_media.py file is a one-off maintenance command for the backend. It moves photos that older
+    versions stored inline in MongoDB documents into the media store used by the rest of the system.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of migrate_media.py is to rewrite existing users, pets and adoption applications so each inline
+    photo field is replaced by the hash of the same photo in the media store. Running it again is harmless
+    because only documents that still carry an inline photo are touched.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program walks each collection with a cursor filtered on the inline field, stores the photo with
+    store_photo(), then sets the reference field and unsets the inline field in a single update per document.
+
+USAGE:
+    cd backend && python -m scripts.migrate_media
+"""
+
+import asyncio
+from config.db import connect_to_database, close_database_connection, get_database
+from config.media import store_photo
+
+INLINE_PHOTO_FIELDS = [
+    ("users", "profile_photo"),
+    ("pets", "pet_photo"),
+    ("adoption_applications", "proof_of_identity_photo"),
+]
+
+async def migrate_collection(collection_name: str, field: str) -> int:
+    # Moves one inline photo field of a collection into the media store
+    db = get_database()
+    migrated = 0
+    async for document in db[collection_name].find({field: {"$exists": True}}, {field: 1}):
+        data = document[field]
+        if isinstance(data, str):
+            data = data.encode()
+        digest = await store_photo(data)
+        await db[collection_name].update_one(
+            {"_id": document["_id"]},
+            {"$set": {f"{field}_id": digest}, "$unset": {field: ""}},
+        )
+        migrated += 1
+    return migrated
+
+async def main():
+    connect_to_database()
+    try:
+        for collection_name, field in INLINE_PHOTO_FIELDS:
+            migrated = await migrate_collection(collection_name, field)
+            print(f"{collection_name}: moved {migrated} {field} value(s) to the media store")
+    finally:
+        close_database_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
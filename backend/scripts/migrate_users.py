@@ -0,0 +1,80 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - migrate_users.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The migrate_users.py file is a maintenance command for the backend. It brings the existing users
+    collection in line with the unique username index that config/indexes.py declares.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of migrate_users.py is to remove repeated accounts that were signed up under the same username
+    before the database enforced uniqueness, so the username_unique index can be built and the server can
+    start. Running it again is harmless.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program groups users by username and keeps the oldest account of each group, the one signed up first.
+    The other accounts of a group are copied to the users_duplicates collection before they are deleted, so a
+    removed profile or password can still be looked up and restored by hand. Pets, posts and applications refer
+    to their user by username, so they stay with the kept account. Then it runs ensure_indexes() to build the
+    unique index. With --dry-run it only lists the repeated usernames and how many accounts each has.
+
+USAGE:
+    cd backend && python -m scripts.migrate_users --dry-run  # list repeated usernames
+    cd backend && python -m scripts.migrate_users            # remove the repeats and build the index
+"""
+
+import argparse
+import asyncio
+from pymongo import ReplaceOne
+from config.db import connect_to_database, close_database_connection, get_database
+from config.indexes import ensure_indexes
+
+async def remove_duplicates(dry_run: bool) -> int:
+    # Keeps the oldest account of each username, moving the rest to users_duplicates
+    db = get_database()
+    pipeline = [
+        {"$sort": {"_id": 1}},
+        {"$group": {"_id": "$username", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}},
+    ]
+    removed = 0
+    async for group in db.users.aggregate(pipeline, allowDiskUse=True):
+        if dry_run:
+            print(f"users: {group['_id']!r} has {group['count']} accounts")
+            removed += group["count"] - 1
+            continue
+        duplicates = await db.users.find({"_id": {"$in": group["ids"][1:]}}).to_list(None)
+        if duplicates:
+            # Upserts, so a run interrupted between the copy and the delete can be repeated
+            await db.users_duplicates.bulk_write([ReplaceOne({"_id": user["_id"]}, user, upsert=True) for user in duplicates], ordered=False)
+        result = await db.users.delete_many({"_id": {"$in": [user["_id"] for user in duplicates]}})
+        removed += result.deleted_count
+    return removed
+
+async def main():
+    parser = argparse.ArgumentParser(description="Remove repeated usernames so the unique username index can be built")
+    parser.add_argument("--dry-run", action="store_true", help="List repeated usernames without changing anything")
+    args = parser.parse_args()
+
+    connect_to_database()
+    try:
+        removed = await remove_duplicates(args.dry_run)
+        if args.dry_run:
+            print(f"users: {removed} duplicate(s) would be moved to users_duplicates")
+            return
+        print(f"users: moved {removed} duplicate(s) to users_duplicates")
+        await ensure_indexes()
+    finally:
+        close_database_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,81 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - rebuild_feed.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The rebuild_feed.py file is a maintenance command for the backend. It fills the materialized feed that
+    feed_controller.py serves from the posts and users collections.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of rebuild_feed.py is to backfill the feed with the posts written before it existed, and to
+    repair it after a feed write failed or author display data drifted. Running it again is harmless because
+    every entry is upserted under its post id.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program reads the posts oldest first through one aggregation that joins each post to the display
+    fields of its author, builds the entries with feed_entry(), and upserts them in unordered batches. With
+    --clear it empties the feed first, which also drops the entries of posts that no longer exist.
+
+USAGE:
+    cd backend && python -m scripts.rebuild_feed
+    cd backend && python -m scripts.rebuild_feed --clear --batch-size 2000
+"""
+
+import argparse
+import asyncio
+from config.db import connect_to_database, close_database_connection, get_database
+from controllers.feed_controller import FEED_AUTHOR_FIELDS, add_feed_entries, feed_entry
+
+def backfill_pipeline() -> list:
+    # Joins every post to its author's display fields, oldest first
+    return [
+        {"$sort": {"_id": 1}},
+        {"$lookup": {
+            "from": "users",
+            "localField": "username",
+            "foreignField": "username",
+            "pipeline": [{"$project": {"_id": 0, **{field: 1 for field in FEED_AUTHOR_FIELDS}}}],
+            "as": "author",
+        }},
+        {"$project": {"username": 1, "post_content": 1, "date_posted": 1, "author": {"$arrayElemAt": ["$author", 0]}}},
+    ]
+
+async def rebuild_feed(batch_size: int, clear: bool) -> int:
+    # Upserts a feed entry for every post and returns how many entries were written
+    db = get_database()
+    if clear:
+        await db.feed.delete_many({})
+    written = 0
+    batch = []
+    async for post in db.posts.aggregate(backfill_pipeline(), batchSize=batch_size):
+        batch.append(feed_entry(post, post.get("author")))
+        if len(batch) >= batch_size:
+            written += await add_feed_entries(batch)
+            batch = []
+    written += await add_feed_entries(batch)
+    return written
+
+async def main():
+    parser = argparse.ArgumentParser(description="Rebuild the materialized feed from the posts collection")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--clear", action="store_true", help="Empty the feed before rebuilding it")
+    args = parser.parse_args()
+
+    connect_to_database()
+    try:
+        written = await rebuild_feed(args.batch_size, args.clear)
+        print(f"feed: wrote {written} entr{'y' if written == 1 else 'ies'}")
+    finally:
+        close_database_connection()
+
+if __name__ == "__main__":
+    asyncio.run(main())
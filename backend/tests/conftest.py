@@ -0,0 +1,115 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - conftest.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The conftest.py file holds the fixtures shared by the backend test suite. Controller tests use it in place
+    of the MongoDB database that config/db.py would hand them.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of conftest.py is to let controllers run their real queries against canned documents, with no
+    MongoDB server, and to record which read intent each controller asked get_database() for.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    FakeDatabase hands out a FakeCollection per collection name. Every collection keeps the documents it was
+    seeded with, plus those insert_one() adds, and returns them from find(), find_one() and aggregate(),
+    whatever the filter, through a FakeCursor that supports the chaining and async iteration the controllers
+    use. The fake_db fixture replaces get_database in the given controller modules with one that returns the
+    same FakeDatabase and appends each requested intent to fake_db.intents.
+"""
+
+import pytest
+from types import SimpleNamespace
+from bson import ObjectId
+from config.db import READ_PRIMARY
+
+class FakeCursor:
+    def __init__(self, documents: list):
+        self.documents = list(documents)
+
+    def sort(self, *args, **kwargs):
+        return self
+
+    def limit(self, count: int):
+        if count:
+            self.documents = self.documents[:count]
+        return self
+
+    def skip(self, count: int):
+        self.documents = self.documents[count:]
+        return self
+
+    def batch_size(self, size: int):
+        return self
+
+    async def to_list(self, length=None):
+        return self.documents[:length] if length else list(self.documents)
+
+    def __aiter__(self):
+        return self.iterate()
+
+    async def iterate(self):
+        for document in self.documents:
+            yield document
+
+class FakeCollection:
+    def __init__(self, documents=()):
+        self.documents = list(documents)
+
+    def find(self, *args, **kwargs) -> FakeCursor:
+        return FakeCursor(self.documents)
+
+    def aggregate(self, *args, **kwargs) -> FakeCursor:
+        return FakeCursor(self.documents)
+
+    async def find_one(self, *args, **kwargs):
+        return self.documents[0] if self.documents else None
+
+    async def count_documents(self, *args, **kwargs) -> int:
+        return len(self.documents)
+
+    async def insert_one(self, document: dict) -> SimpleNamespace:
+        document.setdefault("_id", ObjectId())
+        self.documents.append(document)
+        return SimpleNamespace(inserted_id=document["_id"])
+
+class FakeDatabase:
+    def __init__(self):
+        self.collections = {}
+        self.intents = []
+
+    def seed(self, name: str, documents: list):
+        self.collections[name] = FakeCollection(documents)
+
+    def __getitem__(self, name: str) -> FakeCollection:
+        return self.collections.setdefault(name, FakeCollection())
+
+    def __getattr__(self, name: str) -> FakeCollection:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self[name]
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    # Returns a function that points get_database of the given modules at one FakeDatabase
+    database = FakeDatabase()
+
+    def fake_get_database(read: str = READ_PRIMARY) -> FakeDatabase:
+        database.intents.append(read)
+        return database
+
+    def install(*modules) -> FakeDatabase:
+        for module in modules:
+            monkeypatch.setattr(module, "get_database", fake_get_database)
+        return database
+
+    return install
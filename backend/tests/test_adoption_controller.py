@@ -0,0 +1,57 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - test_adoption_controller.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The test_adoption_controller.py file is part of the backend test suite. It checks the applicant side of
+    adoption_controller.py, behind /users/{username}/applications.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of test_adoption_controller.py is to make sure a user's application listing still answers
+    when some of their applications were written before pet_id was stored, which migrate_applications.py
+    keeps as they are.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The tests run get_user_applications against the fake database from conftest.py, seeded with the joined
+    rows its aggregation would return, and check the shaped listing.
+
+USAGE:
+    cd backend && python -m pytest tests
+"""
+
+import asyncio
+from bson import ObjectId
+import controllers.adoption_controller as adoption_controller
+from config.auth import CurrentUser
+
+def test_legacy_application_without_pet_id_is_listed(fake_db):
+    db = fake_db(adoption_controller)
+    pet_id = ObjectId()
+    legacy = {"_id": ObjectId(), "status": "pending"}
+    current = {"_id": ObjectId(), "pet_id": pet_id, "status": "approved", "pet": {"pet_name": "Bantay", "username": "owner"}}
+    db.seed("adoption_applications", [current, legacy])
+
+    user = CurrentUser(id=str(ObjectId()), username="applicant")
+    listing, next_cursor = asyncio.run(adoption_controller.get_user_applications("applicant", user))
+
+    assert next_cursor is None
+    assert [entry["pet_id"] for entry in listing] == [str(pet_id), None]
+    assert listing[0]["pet_name"] == "Bantay" and listing[0]["owner"] == "owner"
+    assert listing[1] == {
+        "application_id": str(legacy["_id"]),
+        "pet_id": None,
+        "pet_name": None,
+        "pet_photo_id": None,
+        "owner": None,
+        "status": "pending",
+        "submitted_at": None,
+    }
@@ -0,0 +1,57 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - test_batch_controller.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The test_batch_controller.py file is part of the backend test suite. It checks how batch_controller.py
+    collects the response of one sub-request for /batch.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of test_batch_controller.py is to make sure only successful responses have to be JSON, so an
+    error answered as plain text, such as a 500 from the server error middleware, reaches the client with its
+    own status and its text under detail instead of being reported as 406.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    call_app() is pointed at a small ASGI application that answers with the given status, content type and
+    body, and decode_body() shapes what call_app() collected, as run_sub_request() does.
+"""
+
+import asyncio
+import pytest
+from controllers.batch_controller import call_app, decode_body
+
+def plain_app(status: int, content_type: bytes, body: bytes):
+    # ASGI application that answers every request with the given status, content type and body
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": status, "headers": [(b"content-type", content_type)]})
+        await send({"type": "http.response.body", "body": body})
+    return app
+
+def collect(status: int, content_type: bytes, body: bytes):
+    # Runs one sub-request against plain_app and returns its status and decoded body
+    status_code, headers, raw = asyncio.run(call_app(plain_app(status, content_type, body), {"type": "http"}))
+    return status_code, decode_body(status_code, headers, raw)
+
+def test_successful_json_is_decoded():
+    assert collect(200, b"application/json", b'{"ok": true}') == (200, {"ok": True})
+
+def test_successful_text_is_refused():
+    status_code, body = collect(200, b"text/plain; charset=utf-8", b"hello")
+    assert status_code == 406
+    assert "text/plain" in body["detail"]
+
+@pytest.mark.parametrize("status", [404, 500, 503])
+def test_text_errors_keep_their_status(status):
+    assert collect(status, b"text/plain; charset=utf-8", b"Internal Server Error") == (status, {"detail": "Internal Server Error"})
+
+def test_json_errors_are_passed_through():
+    assert collect(422, b"application/json", b'{"detail": "bad"}') == (422, {"detail": "bad"})
@@ -0,0 +1,100 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - test_db.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The test_db.py file is part of the backend test suite. It checks the read routing of config/db.py, which
+    every controller relies on to choose between the primary and the secondaries.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of test_db.py is to make sure writes and read-your-own-write paths stay on the primary, that
+    stale-tolerant reads get the configured read preference with a staleness bound, and that bad settings are
+    refused when the client is opened.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The tests open the motor client inside a short-lived event loop and only inspect the read preferences of
+    the database handles. The driver connects lazily, so no MongoDB server is needed. Settings are changed
+    through monkeypatch on the module constants that db.py reads when the client is opened.
+
+USAGE:
+    cd backend && python -m pytest tests
+"""
+
+import asyncio
+import pytest
+from pymongo.read_preferences import Nearest, Primary, Secondary, SecondaryPreferred
+import config.db
+from config.db import READ_PRIMARY, READ_SECONDARY, close_database_connection, connect_to_database, get_database, secondary_read_preference
+
+def opened_read_preferences():
+    # Opens the client, returns the read preferences of both intents and closes it again
+    async def inspect():
+        connect_to_database()
+        try:
+            return get_database().read_preference, get_database(READ_SECONDARY).read_preference
+        finally:
+            close_database_connection()
+
+    return asyncio.run(inspect())
+
+def test_get_database_requires_open_connection():
+    close_database_connection()
+    with pytest.raises(RuntimeError):
+        get_database()
+
+def test_default_intent_reads_primary():
+    async def inspect():
+        connect_to_database()
+        try:
+            return get_database(), get_database(READ_PRIMARY)
+        finally:
+            close_database_connection()
+
+    default, primary = asyncio.run(inspect())
+    assert default is primary
+    assert default.read_preference == Primary()
+    assert default.users.read_preference == Primary()
+
+def test_secondary_intent_is_bounded_secondary_preferred():
+    primary, secondary = opened_read_preferences()
+    assert primary == Primary()
+    assert isinstance(secondary, SecondaryPreferred)
+    assert secondary.max_staleness == config.db.MAX_STALENESS_SECONDS
+
+@pytest.mark.parametrize("name, expected", [
+    ("secondaryPreferred", SecondaryPreferred),
+    ("secondary", Secondary),
+    ("nearest", Nearest),
+])
+def test_secondary_read_preference_mode_and_staleness(monkeypatch, name, expected):
+    monkeypatch.setattr(config.db, "SECONDARY_READ_PREFERENCE", name)
+    monkeypatch.setattr(config.db, "MAX_STALENESS_SECONDS", 120)
+    preference = secondary_read_preference()
+    assert isinstance(preference, expected)
+    assert preference.max_staleness == 120
+
+def test_secondary_read_preference_can_be_primary(monkeypatch):
+    monkeypatch.setattr(config.db, "SECONDARY_READ_PREFERENCE", "primary")
+    assert secondary_read_preference() == Primary()
+
+def test_unknown_read_preference_is_refused(monkeypatch):
+    monkeypatch.setattr(config.db, "SECONDARY_READ_PREFERENCE", "tertiary")
+    with pytest.raises(ValueError):
+        secondary_read_preference()
+    with pytest.raises(ValueError):
+        connect_to_database()
+    assert config.db.client is None
+
+def test_staleness_below_server_minimum_is_refused(monkeypatch):
+    monkeypatch.setattr(config.db, "MAX_STALENESS_SECONDS", 30)
+    with pytest.raises(ValueError):
+        secondary_read_preference()
@@ -0,0 +1,96 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - test_read_routing.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The test_read_routing.py file is part of the backend test suite. It checks which read intent the
+    controllers, and the pet export routes, ask config/db.py for.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of test_read_routing.py is to make sure browsing reads that tolerate a few seconds of lag go to
+    the secondaries, while logins, profiles and a user's own lists stay on the primary so a user always reads
+    their own writes.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    Each test points get_database of the controller modules at the fake database from conftest.py, which
+    records every intent it is asked for, runs one controller call against canned documents and compares the
+    recorded intents. The export routes are called through a TestClient on an app holding only pet_router.py,
+    without the lifespan, so no MongoDB server is needed.
+
+USAGE:
+    cd backend && python -m pytest tests
+"""
+
+import asyncio
+import pytest
+from bson import ObjectId
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+import controllers.feed_controller as feed_controller
+import controllers.pet_controller as pet_controller
+import controllers.user_controller as user_controller
+from config.db import READ_PRIMARY, READ_SECONDARY
+from routes.pet_router import router as pet_router
+
+PET = {"_id": ObjectId(), "pet_name": "Bantay", "username": "owner", "pet_photo_id": "abc"}
+POST = {"_id": ObjectId(), "username": "owner", "post_content": "Hi", "date_posted": "2026-10-18", "author": {}}
+
+@pytest.fixture
+def routed(fake_db):
+    # Fake database shared by the controllers, seeded with one pet, post and feed entry
+    db = fake_db(pet_controller, user_controller, feed_controller)
+    db.seed("pets", [PET])
+    db.seed("posts", [POST])
+    db.seed("feed", [POST])
+    return db
+
+@pytest.mark.parametrize("call", [
+    lambda: pet_controller.get_all_pets(),
+    lambda: pet_controller.search_pets(q="gentle", location="Manila"),
+    lambda: user_controller.fetch_all_posts(),
+    lambda: feed_controller.get_feed(),
+], ids=["get_all_pets", "search_pets", "fetch_all_posts", "get_feed"])
+def test_browsing_reads_use_secondaries(routed, call):
+    asyncio.run(call())
+    assert routed.intents == [READ_SECONDARY]
+
+@pytest.mark.parametrize("call", [
+    lambda: pet_controller.get_pets("owner"),
+    lambda: pet_controller.get_pet(str(PET["_id"])),
+    lambda: user_controller.load_user_profile(f"reader-{ObjectId()}"),
+], ids=["get_pets", "get_pet", "load_user_profile"])
+def test_own_data_reads_use_primary(routed, call):
+    asyncio.run(call())
+    assert routed.intents == [READ_PRIMARY]
+
+def test_login_check_uses_primary(routed):
+    with pytest.raises(HTTPException):
+        asyncio.run(user_controller.verify_user("nobody", "secret"))
+    assert routed.intents == [READ_PRIMARY]
+
+@pytest.mark.parametrize("path, expected", [
+    ("/all-pets?stream=1", READ_SECONDARY),
+    ("/user-pets/owner?stream=1", READ_PRIMARY),
+])
+def test_pet_exports_declare_their_intent(routed, path, expected):
+    app = FastAPI()
+    app.include_router(pet_router)
+    response = TestClient(app).get(path)
+    assert response.status_code == 200
+    assert response.text.count("\n") == 1
+    assert routed.intents == [expected]
+
+def test_malformed_pet_id_is_not_found(routed):
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(pet_controller.get_pet("not-an-id"))
+    assert error.value.status_code == 404
+    assert routed.intents == []
@@ -0,0 +1,106 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - test_streaming.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The test_streaming.py file is part of the backend test suite. It checks the NDJSON reader of
+    utils/streaming.py and the /add-pet/bulk route that feeds it.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of test_streaming.py is to make sure an NDJSON upload is read line by line within its caps, so
+    a body without newlines or past the size limit answers 413 instead of growing in memory, and that the
+    multipart form of the bulk import is parsed as it arrives.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    ndjson_lines() is fed from small async generators that count how many chunks were pulled. The route tests
+    call /add-pet/bulk through a TestClient on an app holding only pet_router.py, with the fake database from
+    conftest.py standing in for MongoDB; the rows they send fail validation, so nothing reaches the media store.
+
+USAGE:
+    cd backend && python -m pytest tests
+"""
+
+import asyncio
+import json
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+import controllers.pet_controller as pet_controller
+import routes.pet_router
+from utils.streaming import ndjson_lines
+
+def read_lines(chunks, pulled=None, **caps):
+    # Collects the lines ndjson_lines() yields for the given chunks, appending each chunk it pulls to pulled
+    pulled = [] if pulled is None else pulled
+
+    async def source():
+        for chunk in chunks:
+            pulled.append(chunk)
+            yield chunk
+
+    async def collect():
+        return [line async for line in ndjson_lines(source(), **caps)]
+
+    return asyncio.run(collect())
+
+def test_lines_are_split_across_chunks():
+    lines = read_lines([b'{"a": 1}\n{"b"', b': 2}\n{"c": 3}'])
+    assert lines == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+def test_line_without_newline_stops_at_line_cap():
+    pulled = []
+    with pytest.raises(HTTPException) as error:
+        read_lines([b"x" * 10] * 100, pulled, max_line=25)
+    assert error.value.status_code == 413
+    assert len(pulled) == 3
+
+def test_long_finished_line_is_refused():
+    with pytest.raises(HTTPException) as error:
+        read_lines([b"x" * 30 + b"\nok\n"], max_line=25)
+    assert error.value.status_code == 413
+
+def test_body_cap_stops_reading():
+    pulled = []
+    with pytest.raises(HTTPException) as error:
+        read_lines([b"{}\n"] * 100, pulled, max_bytes=30)
+    assert error.value.status_code == 413
+    assert len(pulled) == 11
+
+@pytest.fixture
+def client(fake_db):
+    # TestClient for the pet routes, with an owner named "owner" in the fake database
+    db = fake_db(pet_controller)
+    db.seed("users", [{"_id": "owner-id", "username": "owner"}])
+    app = FastAPI()
+    app.include_router(routes.pet_router.router)
+    return TestClient(app)
+
+def test_bulk_multipart_file_is_streamed(client):
+    rows = "\n".join(json.dumps({"pet_name": f"Pet {i}", "username": "owner"}) for i in range(3)).encode()
+    response = client.post("/add-pet/bulk?username=owner", files={"file": ("pets.ndjson", rows, "application/x-ndjson")})
+    assert response.status_code == 200
+    assert response.json()["rows"] == 3
+    assert response.json()["failed"] == 3
+
+def test_bulk_multipart_without_file_part(client):
+    response = client.post("/add-pet/bulk?username=owner", files={"other": ("pets.ndjson", b"{}", "application/x-ndjson")})
+    assert response.status_code == 400
+
+def test_bulk_body_over_declared_cap(client, monkeypatch):
+    monkeypatch.setattr(routes.pet_router, "MAX_NDJSON_BYTES", 10)
+    response = client.post("/add-pet/bulk?username=owner", content=b'{"pet_name": "x"}\n' * 5, headers={"Content-Type": "application/x-ndjson"})
+    assert response.status_code == 413
+
+def test_bulk_row_cap(client, monkeypatch):
+    monkeypatch.setattr(pet_controller, "BULK_MAX_ROWS", 2)
+    response = client.post("/add-pet/bulk?username=owner", content=b'{"pet_name": "x"}\n' * 5, headers={"Content-Type": "application/x-ndjson"})
+    assert response.status_code == 413
@@ -0,0 +1,81 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - test_user_controller.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The test_user_controller.py file is part of the backend test suite. It checks how user_controller.py
+    announces new posts on the event bus behind /events.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of test_user_controller.py is to make sure a new post is only published once its author was
+    loaded and its feed entry written, so listeners never receive a post with empty author fields, and that the
+    post itself is still saved when that step fails.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The tests create a post against the fake database from conftest.py, with the profile lookup, the feed write
+    and the event bus replaced by stand-ins that record their calls or raise.
+"""
+
+import asyncio
+from datetime import datetime
+import pytest
+import controllers.user_controller as user_controller
+from config.auth import CurrentUser
+from models.user_model import UserPost
+
+AUTHOR = {"firstname": "Ana", "lastname": "Cruz", "profile_photo_id": "abc"}
+
+@pytest.fixture
+def posting(fake_db, monkeypatch):
+    # Fake database for posting plus a list of the events published
+    db = fake_db(user_controller)
+    published = []
+
+    async def publish(event_type, data):
+        published.append((event_type, data))
+
+    async def add_feed_entry(post, author):
+        db.feed.documents.append(post)
+
+    monkeypatch.setattr(user_controller.event_bus, "publish", publish)
+    monkeypatch.setattr(user_controller, "add_feed_entry", add_feed_entry)
+    return db, published
+
+def create_post():
+    # Creates one post as its own author
+    post = UserPost(username="ana", sharedpost="Hello", date_posted=datetime(2026, 10, 18))
+    return asyncio.run(user_controller.post_user_post_action(post, CurrentUser(id="1", username="ana")))
+
+def test_post_is_published_with_its_author(posting, monkeypatch):
+    db, published = posting
+
+    async def load_user_profile(username):
+        return AUTHOR
+
+    monkeypatch.setattr(user_controller, "load_user_profile", load_user_profile)
+    create_post()
+    assert [event_type for event_type, _ in published] == ["post"]
+    assert published[0][1]["firstname"] == "Ana"
+    assert len(db.feed.documents) == 1
+
+def test_post_without_author_is_saved_but_not_published(posting, monkeypatch, caplog):
+    db, published = posting
+
+    async def load_user_profile(username):
+        raise RuntimeError("profile lookup failed")
+
+    monkeypatch.setattr(user_controller, "load_user_profile", load_user_profile)
+    post_id = create_post()
+    assert published == []
+    assert db.posts.documents[0]["_id"] == post_id
+    assert db.feed.documents == []
+    assert "Could not add post" in caplog.text
@@ -0,0 +1,83 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - pagination.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The pagination.py file is a shared helper for the controllers. It turns the paging and projection query
+    parameters of list endpoints into MongoDB filters, projections and sort orders.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of pagination.py is to give every list endpoint the same keyset pagination: a page holds at most
+    MAX_PAGE_SIZE documents, pages are ordered newest first, and the next page starts after the last document
+    id of the previous one, so reading deep pages costs the same as reading the first.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program validates the cursor as an ObjectId and the requested fields against an allow-list, raising
+    HTTPException with status 400 otherwise. fetch_page(), and aggregation pipelines built with keyset_query() and 
+    split_page(), read one document more than the page size to learn
+    whether another page exists without a separate count query.
+"""
+
+from fastapi import HTTPException, status
+from bson import ObjectId
+from bson.errors import InvalidId
+from typing import Iterable, List, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def page_limit(limit: Optional[int]) -> int:
+    # Clamps the requested page size to the server-side bounds
+    if not limit:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+def parse_cursor(after: Optional[str]) -> Optional[ObjectId]:
+    # Converts the `after` cursor into the ObjectId it points to
+    if after is None:
+        return None
+    try:
+        return ObjectId(after)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+def build_projection(fields: Optional[str], allowed: Iterable[str]) -> dict:
+    # Builds a MongoDB projection from a comma-separated `fields` parameter
+    allowed = list(allowed)
+    if not fields:
+        return {field: 1 for field in allowed}
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in allowed]
+    if unknown:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown field(s): {', '.join(unknown)}")
+    return {field: 1 for field in requested}
+
+def keyset_query(query: dict, after: Optional[str]) -> dict:
+    # Restricts a query to the documents older than the cursor
+    cursor_id = parse_cursor(after)
+    if cursor_id is None:
+        return query
+    return {**query, "_id": {"$lt": cursor_id}}
+
+def split_page(documents: List[dict], limit: int) -> Tuple[List[dict], Optional[str]]:
+    # Trims the look-ahead document and returns the cursor of the next page, if any
+    if len(documents) > limit:
+        documents = documents[:limit]
+        return documents, str(documents[-1]["_id"])
+    return documents, None
+
+async def fetch_page(collection, query: dict, projection: dict, after: Optional[str], limit: Optional[int]) -> Tuple[List[dict], Optional[str]]:
+    # Reads one newest-first page and returns it with the cursor of the next page
+    limit = page_limit(limit)
+    documents = await collection.find(keyset_query(query, after), projection).sort("_id", -1).limit(limit + 1).to_list(length=limit + 1)
+    return split_page(documents, limit)
@@ -0,0 +1,77 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - ranking.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The ranking.py file is the scoring engine behind the adoption application listings. adoption_controller.py
+    gives it the self-assessment scores of every applicant for a pet and gets back the order to show them in.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of ranking.py is to rank applicants by how well they fit as adopters, using the pet knowledge,
+    stable living, flexible time schedule and environment scores (0-5) every user gives at registration,
+    weighted by how much a shelter cares about each one.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program works on a NumPy matrix with one row per applicant and one column per score. A single
+    matrix-vector product against the weight vector scores every applicant at once, normalized to 0-100. When
+    only the first k applicants are needed, argpartition selects them in linear time before the small top slice
+    is sorted; otherwise a stable argsort keeps earlier applications first among equal scores. Default weights
+    come from the ADOPTER_SCORE_WEIGHTS environment variable, written as "field=weight" pairs. Weights must be
+    finite and not negative, and small enough that their float32 sum stays finite.
+"""
+
+from fastapi import HTTPException, status
+from typing import Optional, Tuple
+import math
+import numpy as np
+import os
+
+SCORE_FIELDS = ["pet_knowledge", "stable_living", "flex_time_sched", "environment"]
+MAX_SCORE = 5
+
+def parse_weights(spec: Optional[str]) -> np.ndarray:
+    # Parses "field=weight" pairs into a weight vector; fields left out keep a weight of 1
+    weights = dict.fromkeys(SCORE_FIELDS, 1.0)
+    for pair in (spec or "").split(","):
+        if not pair.strip():
+            continue
+        field, _, value = pair.partition("=")
+        field = field.strip()
+        try:
+            weight = float(value)
+        except ValueError:
+            weight = -1
+        if field not in weights or not math.isfinite(weight) or weight < 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid weight: {pair.strip()}")
+        weights[field] = weight
+    if sum(weights.values()) > float(np.finfo(np.float32).max):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Weights are too large")
+    vector = np.array([weights[field] for field in SCORE_FIELDS], dtype=np.float32)
+    if not vector.any():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="At least one weight must be positive")
+    return vector
+
+DEFAULT_WEIGHTS = parse_weights(os.getenv("ADOPTER_SCORE_WEIGHTS"))
+
+def score_applicants(matrix: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    # Scores every applicant row at once, normalized to 0-100
+    return matrix @ weights * (100.0 / (MAX_SCORE * weights.sum()))
+
+def rank_applicants(matrix: np.ndarray, weights: np.ndarray, top: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    # Returns the row order from best to worst applicant, limited to `top` rows, and every applicant's score
+    scores = score_applicants(matrix, weights)
+    if top is not None and top < len(scores):
+        candidates = np.argpartition(-scores, top - 1)[:top]
+        order = candidates[np.lexsort((candidates, -scores[candidates]))]
+    else:
+        order = np.argsort(-scores, kind="stable")
+    return order, scores
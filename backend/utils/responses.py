@@ -0,0 +1,131 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - responses.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The responses.py file is a shared helper for the routers. List endpoints that the mobile app polls, such as
+    /all-pets and /all-user-posts, build their HTTP responses through it.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of responses.py is to cut the bytes a polling client downloads. Every JSON body gets an ETag, a
+    client that sends back a matching If-None-Match receives an empty 304 Not Modified, and bodies above a size
+    threshold are compressed with brotli or gzip when the client accepts it.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program serializes the content once, derives a weak ETag from a BLAKE2b hash of the bytes, and 
+    compares it with the tags listed in If-None-Match. Otherwise it parses Accept-Encoding, prefers brotli 
+    when the optional brotli package is installed, falls back to gzip, and leaves bodies under 
+    COMPRESSION_MIN_SIZE bytes uncompressed because compressing them costs more than it saves. Bodies are 
+    encoded by serialize(), which uses orjson when the optional package is installed and the standard json 
+    module otherwise, and converts ObjectId, datetime and bytes values directly instead of walking the content 
+    with jsonable_encoder first. Routes that return a read-side shape through json_response() skip FastAPI's 
+    response_model revalidation, since returning a Response bypasses it.
+"""
+
+from bson import ObjectId
+from datetime import date, datetime
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+from typing import Optional, Set
+import base64
+import gzip
+import hashlib
+import json
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+def accepted_encodings(accept_encoding: Optional[str]) -> Set[str]:
+    # Lists the content codings the client accepts, skipping those with q=0
+    encodings = set()
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        if not coding:
+            continue
+        quality = params.strip()
+        try:
+            if quality.startswith("q=") and float(quality[2:]) == 0:
+                continue
+        except ValueError:
+            continue
+        encodings.add(coding.strip().lower())
+    return encodings
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # Compares If-None-Match against the ETag using weak comparison
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+def compress(body: bytes, accept_encoding: Optional[str]):
+    # Compresses the body with the best coding the client accepts, if it is large enough
+    if len(body) < COMPRESSION_MIN_SIZE:
+        return body, None
+    encodings = accepted_encodings(accept_encoding)
+    if brotli is not None and "br" in encodings:
+        return brotli.compress(body, quality=BROTLI_QUALITY), "br"
+    if "gzip" in encodings:
+        return gzip.compress(body, compresslevel=GZIP_LEVEL), "gzip"
+    return body, None
+
+def encode_value(value):
+    # Encodes the values the JSON encoder does not handle itself
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        try:
+            return value.decode()
+        except UnicodeDecodeError:
+            return base64.b64encode(value).decode()
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def serialize(content) -> bytes:
+    # Encodes the content as compact JSON, with orjson when it is installed
+    if orjson is not None:
+        return orjson.dumps(content, default=encode_value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=encode_value, separators=(",", ":"), ensure_ascii=False).encode()
+
+def json_response(content, status_code: int = status.HTTP_200_OK, headers: Optional[dict] = None) -> Response:
+    # Builds a JSON response from already shaped content, skipping response_model validation
+    return Response(content=serialize(content), status_code=status_code, media_type="application/json", headers=headers)
+
+def conditional_json_response(request: Request, content, headers: Optional[dict] = None) -> Response:
+    # Builds a JSON response with an ETag, answering 304 when the client already has this body
+    body = serialize(content)
+    etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {**(headers or {}), "ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body, encoding = compress(body, request.headers.get("accept-encoding"))
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
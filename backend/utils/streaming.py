@@ -0,0 +1,84 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - streaming.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The streaming.py file is a shared helper for the routers. It provides the newline-delimited JSON export mode
+    of the pet and post list endpoints, next to the paged JSON mode built by responses.py.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of streaming.py is to send a whole collection without holding it in memory. Documents are written
+    to the client while the MongoDB cursor is still being read, so the first byte leaves right away and memory
+    use stays flat no matter how large the collection grows.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    The program turns an async iterator of documents into NDJSON lines inside a generator consumed by FastAPI's
+    StreamingResponse. Lines are grouped into chunks of about STREAM_CHUNK_SIZE bytes to avoid one socket write
+    per document. The generator only pulls the next document after the previous chunk has been sent, which gives
+    backpressure: a slow client slows the cursor instead of letting buffered documents pile up. In the other
+    direction, ndjson_lines() splits an uploaded NDJSON body into lines as its chunks arrive. Only the current
+    unfinished line is buffered. A line longer than MAX_NDJSON_LINE_BYTES, or a body past MAX_NDJSON_BYTES,
+    answers 413, so a body without newlines cannot grow the buffer without bound.
+"""
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator
+import os
+from utils.responses import serialize
+from utils.uploads import MAX_UPLOAD_BYTES, too_large
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+STREAM_BATCH_SIZE = 500
+STREAM_CHUNK_SIZE = 64 * 1024
+# One row carries one inline photo, so it gets the same cap as a single JSON upload
+MAX_NDJSON_LINE_BYTES = int(os.getenv("MAX_NDJSON_LINE_BYTES", MAX_UPLOAD_BYTES))
+MAX_NDJSON_BYTES = int(os.getenv("MAX_NDJSON_BYTES", 512 * 1024 * 1024))
+
+def wants_ndjson(request: Request, stream: bool) -> bool:
+    # Decides whether the client asked for the NDJSON streaming mode
+    return stream or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+async def ndjson_chunks(documents: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    # Encodes documents as NDJSON lines grouped into chunks
+    buffer = bytearray()
+    async for document in documents:
+        buffer += serialize(document)
+        buffer += b"\n"
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+async def ndjson_lines(chunks: AsyncIterator[bytes], max_line: int = MAX_NDJSON_LINE_BYTES, max_bytes: int = MAX_NDJSON_BYTES) -> AsyncIterator[bytes]:
+    # Splits an incoming byte stream into NDJSON lines without reading the whole body, within the line and body caps
+    buffer = b""
+    received = 0
+    async for chunk in chunks:
+        received += len(chunk)
+        if received > max_bytes:
+            raise too_large(f"NDJSON body is larger than {max_bytes} bytes")
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if len(line) > max_line:
+                raise too_large(f"NDJSON line is longer than {max_line} bytes")
+            yield line
+        if len(buffer) > max_line:
+            raise too_large(f"NDJSON line is longer than {max_line} bytes")
+    if buffer:
+        yield buffer
+
+def ndjson_response(documents: AsyncIterator[dict], headers: dict = None) -> StreamingResponse:
+    # Streams documents to the client as newline-delimited JSON
+    return StreamingResponse(ndjson_chunks(documents), media_type=NDJSON_MEDIA_TYPE, headers=headers)
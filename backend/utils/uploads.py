@@ -0,0 +1,258 @@
+"""
+PROGRAM TITLE:
+    FurEver Pals - uploads.py
+
+PROGRAMMER/S:
+    Ashley Sheine N. Jugueta
+
+WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+    The uploads.py file is a shared helper for the routers. The multipart upload routes for registering, adding
+    a pet and applying for adoption read their request bodies through it before calling the controllers.
+
+DATE WRITTEN:
+    October 18, 2026
+
+DATE REVISED:
+    October 18, 2026
+
+PURPOSE:
+    The purpose of uploads.py is to accept photos as multipart file parts and write them to the media store as
+    they arrive. No request ever holds a whole photo in memory, and the size of each photo and of the whole
+    request is capped. Photos of a request that fails are removed again, and the JSON routes that carry a
+    photo inline are held to the same request cap.
+
+DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+    MultipartStream feeds the raw body chunks of the request to python-multipart's push parser. It turns the 
+    parser callbacks into a list of part, data and end events that the async reader drains after each chunk. 
+    Parts named in the caller's set of photo fields go straight into a media store writer. Every other part is 
+    a text field, collected up to MAX_FIELD_BYTES. Body bytes are counted against MAX_UPLOAD_BYTES, and the 
+    bytes of each photo against MAX_PHOTO_BYTES. Going over either limit answers 413 and aborts the open 
+    writer. A declared Content-Length over the request cap is refused before any byte is read. The result is 
+    the text fields plus a StoredUpload per photo, which holds the hash, size and content type of the blob and 
+    whether this request created it. validate_upload_form() then runs the request model on the text fields. 
+    The photo field gets a stand-in that is empty exactly when the streamed photo was missing or empty, so 
+    validators such as validate_pet_photo still reject those uploads. The routes read their form through 
+    multipart_upload(), which deletes the blobs the request created when reading, validation or the controller 
+    fails, and queues the photos for thumbnails only once the route has succeeded. A blob that was already 
+    stored belongs to earlier documents and is never deleted. CappedBodyRoute is the route class of the user 
+    and pet routers. Its request reads a JSON body against MAX_UPLOAD_BYTES, checking Content-Length first, so 
+    a base64 photo sent to /register, /add-pet or /adopt-pet that is too large answers 413 before it is 
+    parsed. multipart_file_chunks() yields the data of one file part straight from the parser, under a cap 
+    chosen by the caller, for the NDJSON file of /add-pet/bulk.
+"""
+
+from contextlib import asynccontextmanager
+from fastapi import HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ValidationError
+from typing import AsyncIterator, Callable, Dict, NamedTuple, Set, Tuple, Type
+import os
+from config.media import get_media_store
+from config.thumbnails import enqueue_thumbnails
+
+try:
+    import python_multipart as multipart
+    from python_multipart.multipart import parse_options_header
+except ImportError:
+    import multipart
+    from multipart.multipart import parse_options_header
+
+MAX_PHOTO_BYTES = int(os.getenv("MAX_PHOTO_BYTES", 10 * 1024 * 1024))
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", 12 * 1024 * 1024))
+MAX_FIELD_BYTES = 64 * 1024
+
+class StoredUpload(NamedTuple):
+    digest: str
+    size: int
+    content_type: str
+    created: bool
+
+def too_large(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
+
+def check_declared_length(request: Request, max_bytes: int):
+    # Refuses a request whose declared Content-Length is over the cap before any byte is read
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        raise too_large(f"Request body is larger than {max_bytes} bytes")
+
+class MultipartStream:
+    def __init__(self, boundary: bytes):
+        self.events = []
+        self.headers = {}
+        self.header_field = b""
+        self.header_value = b""
+        callbacks = {
+            "on_part_begin": self.on_part_begin,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+        }
+        self.parser = multipart.MultipartParser(boundary, callbacks)
+
+    def on_part_begin(self):
+        self.headers = {}
+
+    def on_header_field(self, data: bytes, start: int, end: int):
+        self.header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int):
+        self.header_value += data[start:end]
+
+    def on_header_end(self):
+        self.headers[self.header_field.lower()] = self.header_value
+        self.header_field = b""
+        self.header_value = b""
+
+    def on_headers_finished(self):
+        _, options = parse_options_header(self.headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("latin-1")
+        content_type = self.headers.get(b"content-type", b"").decode("latin-1")
+        self.events.append(("part", name, content_type))
+
+    def on_part_data(self, data: bytes, start: int, end: int):
+        self.events.append(("data", data[start:end]))
+
+    def on_part_end(self):
+        self.events.append(("end",))
+
+    def feed(self, chunk: bytes) -> list:
+        # Parses one body chunk and returns the events it completed
+        self.parser.write(chunk)
+        events, self.events = self.events, []
+        return events
+
+async def multipart_events(request: Request, max_bytes: int = MAX_UPLOAD_BYTES) -> AsyncIterator[tuple]:
+    # Yields the parts of a multipart body as they arrive, enforcing the request size cap
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    boundary = options.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail="Expected a multipart/form-data body")
+    check_declared_length(request, max_bytes)
+
+    stream = MultipartStream(boundary)
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_bytes:
+            raise too_large(f"Request body is larger than {max_bytes} bytes")
+        for event in stream.feed(chunk):
+            yield event
+    stream.parser.finalize()
+    for event in stream.events:
+        yield event
+
+async def read_multipart(request: Request, photo_fields: Set[str]) -> Tuple[Dict[str, str], Dict[str, StoredUpload]]:
+    # Streams the photo parts into the media store and returns the text fields and the stored photos
+    fields = {}
+    photos = {}
+    name = None
+    writer = None
+    text = bytearray()
+    try:
+        async for event in multipart_events(request):
+            if event[0] == "part":
+                name, content_type = event[1], event[2]
+                if name in photo_fields:
+                    writer = get_media_store().writer()
+                text.clear()
+            elif event[0] == "data":
+                data = event[1]
+                if writer is not None:
+                    if writer.size + len(data) > MAX_PHOTO_BYTES:
+                        raise too_large(f"Photo '{name}' is larger than {MAX_PHOTO_BYTES} bytes")
+                    await writer.write(data)
+                else:
+                    if len(text) + len(data) > MAX_FIELD_BYTES:
+                        raise too_large(f"Field '{name}' is larger than {MAX_FIELD_BYTES} bytes")
+                    text += data
+            elif writer is not None:
+                digest = await writer.close()
+                photos[name] = StoredUpload(digest, writer.size, content_type, writer.created)
+                writer = None
+            else:
+                fields[name] = text.decode("utf-8", errors="replace")
+    except BaseException:
+        if writer is not None:
+            await writer.abort()
+        await discard_photos(photos)
+        raise
+    return fields, photos
+
+async def discard_photos(photos: Dict[str, StoredUpload]):
+    # Deletes the blobs a failed request added to the media store, leaving those that were already stored
+    store = get_media_store()
+    for upload in photos.values():
+        if upload.created:
+            try:
+                await store.delete(upload.digest)
+            except Exception as e:
+                print(f"Could not remove uploaded photo {upload.digest}: {e}")
+
+@asynccontextmanager
+async def multipart_upload(request: Request, photo_fields: Set[str]) -> AsyncIterator[Tuple[Dict[str, str], Dict[str, StoredUpload]]]:
+    # Reads a multipart form like read_multipart() and removes its new photos if the route fails with them
+    fields, photos = await read_multipart(request, photo_fields)
+    try:
+        yield fields, photos
+    except BaseException:
+        await discard_photos(photos)
+        raise
+    for upload in photos.values():
+        if upload.size:
+            enqueue_thumbnails(upload.digest)
+
+async def multipart_file_chunks(request: Request, field: str, max_bytes: int) -> AsyncIterator[bytes]:
+    # Yields the data of one file part as it arrives, so a large upload is never spooled before it is read
+    name = None
+    found = False
+    async for event in multipart_events(request, max_bytes):
+        if event[0] == "part":
+            name = event[1]
+            found = found or name == field
+        elif event[0] == "data" and name == field:
+            yield event[1]
+    if not found:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Multipart batch must include a '{field}' part")
+
+def photo_marker(upload) -> bytes:
+    # Stands in for a streamed photo when its form is validated, so empty uploads still fail the photo validators
+    if upload is None or not upload.size:
+        return b""
+    return upload.digest.encode()
+
+def validate_upload_form(model: Type[BaseModel], fields: Dict[str, str], photos: Dict[str, StoredUpload], photo_field: str):
+    # Validates the text fields and the streamed photo with the model's own validators, answering 422 like a JSON body
+    try:
+        return model.model_validate({**fields, photo_field: photo_marker(photos.get(photo_field))})
+    except ValidationError as e:
+        raise RequestValidationError([{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)])
+
+class CappedBodyRequest(Request):
+    async def body(self) -> bytes:
+        # Reads the whole body like Starlette does, answering 413 once it passes MAX_UPLOAD_BYTES
+        if not hasattr(self, "_body"):
+            check_declared_length(self, MAX_UPLOAD_BYTES)
+            chunks = []
+            received = 0
+            async for chunk in self.stream():
+                received += len(chunk)
+                if received > MAX_UPLOAD_BYTES:
+                    raise too_large(f"Request body is larger than {MAX_UPLOAD_BYTES} bytes")
+                chunks.append(chunk)
+            self._body = b"".join(chunks)
+        return self._body
+
+class CappedBodyRoute(APIRoute):
+    def get_route_handler(self) -> Callable:
+        # Hands the endpoint a request whose JSON body is read within the upload cap; streamed bodies are not affected
+        handler = super().get_route_handler()
+
+        async def capped_handler(request: Request):
+            return await handler(CappedBodyRequest(request.scope, request.receive))
+
+        return capped_handler
@@ -23,11 +23,13 @@
  * DATA STRUCTURES, ALGORITHMS, AND CONTROL:
  *     The app uses state variables to manage shared tips, posts, refreshing status, and modal visibility. Posts are fetched 
  *     from the server and sorted by date, with the most recent posts appearing at the top. Data is fetched using the `fetch()` 
- *     function, and the date formatting is handled by JavaScript's `Date` object.
+ *     function, and the date formatting is handled by JavaScript's `Date` object. The server sends posts one page at a time 
+ *     with the cursor of the next page in the X-Next-Cursor header, and the next page is appended when the feed is scrolled 
+ *     near its end, until the server stops sending a cursor. 
  */
 
 
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import styles from '../styles/CommunityStyles';
 
 import { Text, View, Image, ScrollView, TextInput, Modal, TouchableOpacity, RefreshControl } from 'react-native';
@@ -35,6 +37,7 @@ import moment from 'moment';
 
 import BottomNavigationBar from './BottomNavigationBar';
 import config from './config.js';
+import { fetchPage, isCloseToBottom } from './pagination.js';
 
 // Error Messages Constants
 const ERROR_MESSAGES = {
@@ -52,6 +55,9 @@ export default function Community({ navigation, route }) {
   const [posts, setPosts] = useState([]);
   const [refreshing, setRefreshing] = useState(false);
   const [successModalVisible, setSuccessModalVisible] = useState(false);
+  const nextCursor = useRef(null);
+  const loadingMore = useRef(false);
+  const listVersion = useRef(0);
 
   // Post submission handler
   const confirmSubmission = async () => {
@@ -81,25 +87,61 @@ export default function Community({ navigation, route }) {
     }
   };
   
-  // Fetch posts from the server
+  // Sort posts by date, most recent first
+  const sortPosts = (list) => list.sort((a, b) => new Date(b.date_posted) - new Date(a.date_posted)); // Descending order
+
+  // Fetch the first page of posts from the server
   const fetchPosts = async () => {
+    const version = ++listVersion.current;
     try {
-      const response = await fetch(`http://${config.ipAddress}:8000/all-user-posts`);
+      const { response, nextCursor: cursor } = await fetchPage('/all-user-posts');
       if (!response.ok) {
         throw new Error('Failed to fetch posts');
       }
       const data = await response.json();
+      if (version !== listVersion.current) {
+        return;
+      }
+      nextCursor.current = cursor;
       if (Array.isArray(data.posts)) {
-        const sortedPosts = data.posts.sort((a, b) => new Date(b.date_posted) - new Date(a.date_posted)); // Descending order
-        setPosts(sortedPosts);
+        setPosts(sortPosts(data.posts));
       } else {
         setPosts([]);
       }
     } catch (error) {
       console.error('Error fetching posts:', error);
+      nextCursor.current = null;
       setPosts([]); 
     }
   };
+
+  // Append the next page of posts, if there is one
+  const fetchMorePosts = async () => {
+    if (!nextCursor.current || loadingMore.current) {
+      return;
+    }
+    loadingMore.current = true;
+    const version = listVersion.current;
+    try {
+      const { response, nextCursor: cursor } = await fetchPage('/all-user-posts', nextCursor.current);
+      if (!response.ok) {
+        throw new Error(ERROR_MESSAGES.FETCH_POSTS_FAILED);
+      }
+      const data = await response.json();
+      // A refresh started meanwhile has replaced the list this page belongs to
+      if (version !== listVersion.current) {
+        return;
+      }
+      nextCursor.current = cursor;
+      if (Array.isArray(data.posts)) {
+        setPosts(previous => sortPosts(previous.concat(data.posts)));
+      }
+    } catch (error) {
+      console.error('Error fetching more posts:', error);
+    } finally {
+      loadingMore.current = false;
+    }
+  };
   
   // Refresh the posts feed
   const onRefresh = () => {
@@ -126,6 +168,12 @@ export default function Community({ navigation, route }) {
       <ScrollView
         style={styles.container}
         refreshControl={<RefreshControl refreshing={refreshing} onRefresh={onRefresh} />}
+        onScroll={event => {
+          if (isCloseToBottom(event)) {
+            fetchMorePosts();
+          }
+        }}
+        scrollEventThrottle={400}
       >
         {/* Tip Submission Input */}
         <TextInput
@@ -164,7 +212,7 @@ export default function Community({ navigation, route }) {
           return (
             <View style={styles.containerSharedTip} key={index}>
               <View style={styles.postAccountDetails}>
-                <Image style={styles.postImage} source={{ uri: `data:image/jpeg;base64,${post.profile_photo}` }} />
+                <Image style={styles.postImage} source={{ uri: `http://${config.ipAddress}:8000/media/${post.profile_photo_id}?w=160` }} />
                 <View>
                   <Text style={styles.postName}>{post.username}</Text>
                   <Text style={styles.postDate}>{`${formattedTime} ${formattedDate}`}</Text> 
@@ -17,21 +17,24 @@
  * 
  * PURPOSE:
  *     It fetches a list of pets available for adoption and displays them in a gallery format. It also includes a pull-to-refresh 
- *     functionality to reload the list of pets. 
+ *     functionality to reload the list of pets, and loads more pets as the user scrolls down. 
 
  * DATA STRUCTURES, ALGORITHMS, AND CONTROL:
  *     It uses state variables to store pets, the current route, refreshing status, and the alignment of the pet gallery. 
  *     The app also uses `useEffect` to fetch data initially and `useFocusEffect` to refetch data whenever the screen is focused. 
  *     Network requests are made using `fetch()` to get data from the server, and conditional rendering is applied based on the pet list's length for gallery alignment.
+ *     The server sends pets one page at a time with the cursor of the next page in the X-Next-Cursor header. The cursor is kept in a ref,
+ *     and the next page is appended when the gallery is scrolled near its end, until the server stops sending a cursor.
  */
 
 import { useFocusEffect } from '@react-navigation/native';
-import { useCallback, useState, useEffect } from 'react';
+import { useCallback, useState, useEffect, useRef } from 'react';
 import styles from '../styles/DashboardStyles';
 
 import { Text, View, Image, ScrollView, TouchableOpacity, TextInput, RefreshControl } from 'react-native';
 import BottomNavigationBar from './BottomNavigationBar';
 import config from './config.js';
+import { fetchPage, isCloseToBottom } from './pagination.js';
 
 // Error Messages Constants
 const ERROR_MESSAGES = {
@@ -45,7 +48,10 @@ export default function Dashboard({ navigation, route }) {
   // State variables
   const [pets, setPets] = useState([]);
   const [refreshing, setRefreshing] = useState(false);
-  const [isOdd, setIsOdd] = useState(true);
+  const nextCursor = useRef(null);
+  const loadingMore = useRef(false);
+  const listVersion = useRef(0);
+  const isOdd = pets.length % 2 !== 0;
 
   // Fetch pets data on component mount and when the screen is focused
   useEffect(() => {
@@ -58,21 +64,51 @@ export default function Dashboard({ navigation, route }) {
     }, [])
   );
 
-  // Fetch pets from the server
+  // Fetch the first page of pets from the server
   const fetchPets = async () => {
+    const version = ++listVersion.current;
     try {
-      const response = await fetch(`http://${config.ipAddress}:8000/all-pets`);
+      const { response, nextCursor: cursor } = await fetchPage('/all-pets');
       if (!response.ok) {
         throw new Error(ERROR_MESSAGES.FETCH_PETS_FAILED);
       }
       const data = await response.json();
-      setIsOdd(data.length % 2 !== 0);
+      if (version !== listVersion.current) {
+        return;
+      }
+      nextCursor.current = cursor;
       setPets(data);
     } catch (error) {
       console.error('Error fetching pets:', error);
     }
   };
 
+  // Append the next page of pets, if there is one
+  const fetchMorePets = async () => {
+    if (!nextCursor.current || loadingMore.current) {
+      return;
+    }
+    loadingMore.current = true;
+    const version = listVersion.current;
+    try {
+      const { response, nextCursor: cursor } = await fetchPage('/all-pets', nextCursor.current);
+      if (!response.ok) {
+        throw new Error(ERROR_MESSAGES.FETCH_PETS_FAILED);
+      }
+      const data = await response.json();
+      // A refresh started meanwhile has replaced the list this page belongs to
+      if (version !== listVersion.current) {
+        return;
+      }
+      nextCursor.current = cursor;
+      setPets(previous => previous.concat(data));
+    } catch (error) {
+      console.error('Error fetching more pets:', error);
+    } finally {
+      loadingMore.current = false;
+    }
+  };
+
   // Refresh the pet list
   const onRefresh = () => {
     setRefreshing(true);
@@ -95,6 +131,12 @@ export default function Dashboard({ navigation, route }) {
       <ScrollView
         style={styles.container}
         refreshControl={<RefreshControl refreshing={refreshing} onRefresh={onRefresh} />}
+        onScroll={event => {
+          if (isCloseToBottom(event)) {
+            fetchMorePets();
+          }
+        }}
+        scrollEventThrottle={400}
       >
         <View style={styles.contentGallery}>
           <View style={styles.containerGallery}>
@@ -113,11 +155,11 @@ export default function Dashboard({ navigation, route }) {
                     sex: pet.sex,
                     location: pet.location,
                     description: pet.description,
-                    image: `data:image/jpeg;base64,${pet.pet_photo}`
+                    image: `http://${config.ipAddress}:8000/media/${pet.pet_photo_id}`
                   });
                 }}
               >
-                <Image style={styles.galleryImg} source={{ uri: `data:image/jpeg;base64,${pet.pet_photo}` }} resizeMode="cover" />
+                <Image style={styles.galleryImg} source={{ uri: `http://${config.ipAddress}:8000/media/${pet.pet_photo_id}?w=320` }} resizeMode="cover" />
                 <View style={styles.galleryLine}>
                   <View style={styles.dashboardInfo}>
                     <Text style={styles.petName}>{pet.pet_name}</Text>
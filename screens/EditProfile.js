@@ -54,6 +54,7 @@ export default function EditProfile() {
 
   const [file, setFile] = useState(null);
   const [profile_photo, setProfilePhoto] = useState(null);  
+  const [profilePhotoId, setProfilePhotoId] = useState(null);
   const [error, setError] = useState(null);
   const [userInfo, setUserInfo] = useState(null);
 
@@ -110,7 +111,7 @@ export default function EditProfile() {
     setStableLiving(data.stable_living);
     setFlexTimeSched(data.flex_time_sched);
     setEnvironment(data.environment);
-    setProfilePhoto(data.profile_photo);  
+    setProfilePhotoId(data.profile_photo_id);
   };
 
   useEffect(() => {
@@ -173,8 +174,11 @@ export default function EditProfile() {
       stable_living: stableLiving,
       flex_time_sched: flexTimeSched,
       environment: environment,
-      profile_photo: profile_photo,  
     };
+    // Only send a photo when a new one was picked; the stored one is kept otherwise
+    if (profile_photo) {
+      user.profile_photo = profile_photo;
+    }
 
     try {
       const response = await fetch(`http://${config.ipAddress}:8000/update-user-details/${username}`, {
@@ -212,8 +216,10 @@ export default function EditProfile() {
       <View style={styles.uploadContainer}>
         <TouchableOpacity style={styles.buttonUploadPicture} onPress={pickImage}>
           {/* Display the selected image or placeholder if none exists */}
-          {file || profile_photo ? (
-            <Image style={styles.imgProfile} source={{ uri: `data:image/jpeg;base64,${profile_photo || file}` }} resizeMode="cover" />
+          {profile_photo ? (
+            <Image style={styles.imgProfile} source={{ uri: `data:image/jpeg;base64,${profile_photo}` }} resizeMode="cover" />
+          ) : profilePhotoId ? (
+            <Image style={styles.imgProfile} source={{ uri: `http://${config.ipAddress}:8000/media/${profilePhotoId}` }} resizeMode="cover" />
           ) : (
             <Image
               style={styles.imgProfile}
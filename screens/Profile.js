@@ -22,14 +22,17 @@
  * DATA STRUCTURES, ALGORITHMS, AND CONTROL:
  *     It uses state variables to store the user info, active tab, pets list, and modal visibility. It fetches data using `fetch()` to retrieve user 
  *     information and pets. Conditional rendering is used to display different sections (Info, Paws) based on the active tab.
+ *     The server sends the user's pets one page at a time with the cursor of the next page in the X-Next-Cursor header, and the
+ *     next page is appended when the Paws tab is scrolled near its end, until the server stops sending a cursor.
  */
 
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import styles from '../styles/ProfileStyles';
 
 import { Text, View, Image, Modal, TouchableOpacity, ScrollView, Alert, ActivityIndicator } from 'react-native';
 import BottomNavigationBar from './BottomNavigationBar'; 
 import config from './config.js';
+import { fetchPage, isCloseToBottom } from './pagination.js';
 
 const ERROR_MESSAGES = {
   FETCH_USER_INFO_EMPTY_DATA: 'Empty response data',
@@ -50,6 +53,9 @@ export default function Profile({ navigation, route }) {
   const [userInfo, setUserInfo] = useState(null);
   const [activeTab, setActiveTab] = useState('Info');
   const [pets, setPets] = useState([]);
+  const nextCursor = useRef(null);
+  const loadingMore = useRef(false);
+  const listVersion = useRef(0);
 
   // Logout handler
   const handleLogout = () => {
@@ -91,15 +97,17 @@ export default function Profile({ navigation, route }) {
     }
   };
 
-  // Fetch user pets from server
+  // Fetch the first page of user pets from server
   const fetchPets = async () => {
+    const version = ++listVersion.current;
     try {
-      const url = `http://${config.ipAddress}:8000/user-pets/${username}`;
-      console.log('Fetching pets with URL:', url);
-
-      const response = await fetch(url);
+      const { response, nextCursor: cursor } = await fetchPage(`/user-pets/${username}`);
+      if (version !== listVersion.current) {
+        return;
+      }
       if (response.status === 404) {
         console.log(ERROR_MESSAGES.FETCH_PETS_NOT_FOUND);
+        nextCursor.current = null;
         setPets([]);
         return;
       }
@@ -108,12 +116,39 @@ export default function Profile({ navigation, route }) {
       }
 
       const data = await response.json();
+      nextCursor.current = cursor;
       setPets(data);
     } catch (error) {
       console.error(`${ERROR_MESSAGES.FETCH_PETS_ERROR} ${error.message}`);
     }
   };
 
+  // Append the next page of user pets, if there is one
+  const fetchMorePets = async () => {
+    if (!nextCursor.current || loadingMore.current) {
+      return;
+    }
+    loadingMore.current = true;
+    const version = listVersion.current;
+    try {
+      const { response, nextCursor: cursor } = await fetchPage(`/user-pets/${username}`, nextCursor.current);
+      if (!response.ok) {
+        throw new Error(`${ERROR_MESSAGES.FETCH_PETS_FAILED} ${response.status}`);
+      }
+      const data = await response.json();
+      // A refresh started meanwhile has replaced the list this page belongs to
+      if (version !== listVersion.current) {
+        return;
+      }
+      nextCursor.current = cursor;
+      setPets(previous => previous.concat(data));
+    } catch (error) {
+      console.error(`${ERROR_MESSAGES.FETCH_PETS_ERROR} ${error.message}`);
+    } finally {
+      loadingMore.current = false;
+    }
+  };
+
   // Hook to fetch data when the screen is focused
   useEffect(() => {
     const unsubscribeFocus = navigation.addListener('focus', () => {
@@ -123,6 +158,8 @@ export default function Profile({ navigation, route }) {
 
     return () => {
       unsubscribeFocus();
+      listVersion.current++;
+      nextCursor.current = null;
       setUserInfo(null);
       setPets([]);
     };
@@ -145,7 +182,7 @@ export default function Profile({ navigation, route }) {
     stable_living, 
     flex_time_sched, 
     environment, 
-    profile_photo
+    profile_photo_id
   } = userInfo;
   
   // Format the birthday to a more readable string
@@ -219,10 +256,18 @@ export default function Profile({ navigation, route }) {
       </View>
   
       {/* Scrollable content */}
-      <ScrollView style={styles.Container}>
+      <ScrollView
+        style={styles.Container}
+        onScroll={event => {
+          if (activeTab === 'Paws' && isCloseToBottom(event)) {
+            fetchMorePets();
+          }
+        }}
+        scrollEventThrottle={400}
+      >
         <View style={styles.accountContainer}>
           {/* Display user profile photo */}
-          <Image style={styles.imageProfile} source={{ uri: `data:image/jpeg;base64,${profile_photo}` }} />
+          <Image style={styles.imageProfile} source={{ uri: `http://${config.ipAddress}:8000/media/${profile_photo_id}` }} />
           <View style={styles.accountInfoContainer}>
             {/* Display user name and username */}
             <Text style={styles.textName}>{`${firstname} ${middlename ? middlename + ' ' : ''}${lastname}`}</Text>
@@ -295,11 +340,11 @@ export default function Profile({ navigation, route }) {
                             sex: pet.sex,
                             location: pet.location,
                             description: pet.description,
-                            image: `data:image/jpeg;base64,${pet.pet_photo}`,
+                            image: `http://${config.ipAddress}:8000/media/${pet.pet_photo_id}`,
                           })
                         }
                       >
-                        <Image style={styles.galleryImg} source={{ uri: `data:image/jpeg;base64,${pet.pet_photo}` }} resizeMode="cover" />
+                        <Image style={styles.galleryImg} source={{ uri: `http://${config.ipAddress}:8000/media/${pet.pet_photo_id}?w=320` }} resizeMode="cover" />
                         <View style={styles.galleryLine}>
                           <View style={styles.galleryInfo}>
                             <Text style={styles.petName}>{pet.pet_name}</Text>
@@ -0,0 +1,45 @@
+/**
+ * PROGRAM TITLE:
+ *     Pagination Helpers
+ *
+ * PROGRAMMER/S:
+ *     Ashley Sheine N. Jugueta (Backend/DB Connection)
+ *
+ * WHERE THE PROGRAM FITS IN THE GENERAL SYSTEM DESIGNS:
+ *     These helpers are shared by the screens that show long lists: Dashboard, Community and Profile.
+ *
+ * DATE WRITTEN:
+ *     October 18, 2026
+ *
+ * DATE REVISED:
+ *     October 18, 2026
+ *
+ * PURPOSE:
+ *     The list endpoints return one page at a time, newest first, and put the cursor of the next page in the
+ *     X-Next-Cursor header. These helpers fetch a page with its cursor and tell a screen when the user has
+ *     scrolled close enough to the end to load the next one.
+ *
+ * DATA STRUCTURES, ALGORITHMS, AND CONTROL:
+ *     `fetchPage()` adds the `after` parameter when a cursor is given and returns the response together with
+ *     the header value, which is null on the last page. `isCloseToBottom()` compares the scroll position of a
+ *     ScrollView event with the height of its content.
+ */
+
+import config from './config.js';
+
+// Distance from the end of the list, in pixels, at which the next page is requested
+const LOAD_MORE_THRESHOLD = 300;
+
+// Fetch one page of a list endpoint and the cursor of the page after it
+export async function fetchPage(path, after = null) {
+  const separator = path.includes('?') ? '&' : '?';
+  const cursor = after ? `${separator}after=${encodeURIComponent(after)}` : '';
+  const response = await fetch(`http://${config.ipAddress}:8000${path}${cursor}`);
+  return { response, nextCursor: response.headers.get('X-Next-Cursor') };
+}
+
+// Check whether a ScrollView has been scrolled near the end of its content
+export function isCloseToBottom({ nativeEvent }) {
+  const { layoutMeasurement, contentOffset, contentSize } = nativeEvent;
+  return layoutMeasurement.height + contentOffset.y >= contentSize.height - LOAD_MORE_THRESHOLD;
+}